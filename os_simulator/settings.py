@@ -129,6 +129,43 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
 }
 
+# Caché de resultados del simulador (/sim/run/). BACKEND es un alias de CACHES
+# (p. ej. "default") para compartirla entre workers; None = solo LRU en proceso.
+SIMULATOR_RESULT_CACHE = {
+    "ENABLED": env.bool("SIMULATOR_CACHE_ENABLED", default=True),
+    "MAX_ENTRIES": env.int("SIMULATOR_CACHE_MAX_ENTRIES", default=128),
+    "MAX_BYTES": env.int("SIMULATOR_CACHE_MAX_BYTES", default=64 * 1024 * 1024),
+    "MAX_ENTRY_BYTES": env.int("SIMULATOR_CACHE_MAX_ENTRY_BYTES", default=8 * 1024 * 1024),
+    "BACKEND": env.str("SIMULATOR_CACHE_BACKEND", default="") or None,
+    "TIMEOUT": env.int("SIMULATOR_CACHE_TIMEOUT", default=3600),
+}
+
+# Imágenes del Gantt (/sim/gantt/<clave>.svg|png), indexadas por el hash del
+# resultado y la vista pedida. Mismas opciones que SIMULATOR_RESULT_CACHE.
+SIMULATOR_GANTT_CACHE = {
+    "ENABLED": env.bool("SIMULATOR_GANTT_CACHE_ENABLED", default=True),
+    "MAX_ENTRIES": env.int("SIMULATOR_GANTT_CACHE_MAX_ENTRIES", default=512),
+    "MAX_BYTES": env.int("SIMULATOR_GANTT_CACHE_MAX_BYTES", default=32 * 1024 * 1024),
+    "MAX_ENTRY_BYTES": env.int("SIMULATOR_GANTT_CACHE_MAX_ENTRY_BYTES", default=1024 * 1024),
+    "BACKEND": env.str("SIMULATOR_CACHE_BACKEND", default="") or None,
+    "TIMEOUT": env.int("SIMULATOR_CACHE_TIMEOUT", default=3600),
+    "PREFIX": "simulator:gantt:",
+}
+
+# Procesos que usa /sim/api/batch/ para simular cargas en paralelo (None = núcleos disponibles).
+SIMULATOR_BATCH_MAX_WORKERS = env.int("SIMULATOR_BATCH_MAX_WORKERS", default=None)
+
+# Eventos del planificador por mensaje SSE en /sim/stream/.
+SIMULATOR_STREAM_BATCH = env.int("SIMULATOR_STREAM_BATCH", default=256)
+
+# Cargas de /sim/run/ con más procesos que este umbral se encolan para
+# `manage.py simworker` en lugar de simularse en la petición (0 = nunca).
+SIMULATOR_JOB_THRESHOLD = env.int("SIMULATOR_JOB_THRESHOLD", default=5000)
+
+# Segundos que se conservan las líneas de tiempo guardadas para el Gantt
+# (LineaTiempo); `manage.py simworker` purga las más antiguas (0 = nunca).
+SIMULATOR_TIMELINE_TTL = env.int("SIMULATOR_TIMELINE_TTL", default=7 * 24 * 3600)
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "",
     "VERSION": "0.1.0",
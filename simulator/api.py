@@ -0,0 +1,202 @@
+import json
+
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import jobs
+from .core.comparacion import comparar, lado_a_lado
+from .core.lotes import opciones_carga, simular_lote
+from .core.metrics import pagina_timeline, resultado_a_dict
+from .models import LineaTiempo, SimulationJob
+from .serializers import CargaSerializer, ComparacionSerializer, LoteSerializer, SimulationJobSerializer
+from .views import cache_resultados, respuesta_gantt
+
+
+class BatchSimulationView(APIView):
+    """
+    Ejecuta varias cargas en paralelo y responde NDJSON: una línea por carga,
+    escrita en cuanto su simulación termina (orden de finalización; cada
+    línea lleva su "index" dentro de la petición). Todo corre dentro de la
+    petición, así que si las cargas suman más de SIMULATOR_JOB_THRESHOLD
+    procesos se rechazan con 400: las grandes van a /sim/api/jobs/.
+    """
+
+    @extend_schema(
+        request=LoteSerializer,
+        responses={
+            (200, "application/x-ndjson"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description='Una línea JSON por carga: {"index", "id", "algoritmo", "quantum", "resultado"} o {"index", "id", "error"}.',
+            )
+        },
+    )
+    def post(self, request):
+        serializer = LoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        umbral = getattr(settings, "SIMULATOR_JOB_THRESHOLD", 0)
+        if umbral and sum(len(carga["procesos"]) for carga in datos["cargas"]) > umbral:
+            return Response(
+                {"detail": f"Las cargas de un lote deben sumar como mucho {umbral} procesos."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        lineas = simular_lote(
+            datos["cargas"],
+            max_workers=getattr(settings, "SIMULATOR_BATCH_MAX_WORKERS", None),
+            cache=cache_resultados,
+            timeline=datos["timeline"],
+            timeline_page=datos["timeline_page"],
+            timeline_page_size=datos["timeline_page_size"],
+        )
+        respuesta = StreamingHttpResponse(
+            (json.dumps(linea, ensure_ascii=False) + "\n" for linea in lineas),
+            content_type="application/x-ndjson",
+        )
+        # Evita que un proxy acumule la respuesta completa antes de reenviarla.
+        respuesta["X-Accel-Buffering"] = "no"
+        return respuesta
+
+
+class CompareView(APIView):
+    """
+    Simula una carga con varios algoritmos (por defecto FCFS, SJF y RR) y
+    responde con los resultados lado a lado. La carga se valida y se
+    convierte una sola vez para todos ellos. Como todo corre dentro de la
+    petición, las cargas de más de SIMULATOR_JOB_THRESHOLD procesos se
+    rechazan con 400: esas se encolan una a una en /sim/api/jobs/.
+    """
+
+    @extend_schema(request=ComparacionSerializer, responses={200: OpenApiTypes.OBJECT})
+    def post(self, request):
+        serializer = ComparacionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        variantes = [dict(variante) for variante in datos["algoritmos"]]
+        umbral = getattr(settings, "SIMULATOR_JOB_THRESHOLD", 0)
+        if umbral and len(datos["procesos"]) > umbral:
+            return Response(
+                {"detail": f"Para comparar algoritmos la carga debe tener como mucho {umbral} procesos."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            resultados = comparar(
+                [dict(proceso) for proceso in datos["procesos"]],
+                variantes,
+                max_workers=getattr(settings, "SIMULATOR_BATCH_MAX_WORKERS", None),
+                cache=cache_resultados,
+            )
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "comparacion": lado_a_lado(variantes, resultados),
+                "resultados": [
+                    {
+                        **variante,
+                        "resultado": resultado_a_dict(
+                            resultado,
+                            timeline=datos["timeline"],
+                            timeline_page=datos["timeline_page"],
+                            timeline_page_size=datos["timeline_page_size"],
+                        ),
+                    }
+                    for variante, resultado in zip(variantes, resultados)
+                ],
+            }
+        )
+
+
+class JobListCreateView(APIView):
+    """Encola una simulación (202 + estado) para que la ejecute `manage.py simworker`."""
+
+    @extend_schema(request=CargaSerializer, responses={202: SimulationJobSerializer})
+    def post(self, request):
+        serializer = CargaSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        job = jobs.encolar(
+            [dict(proceso) for proceso in datos["procesos"]],
+            datos["algoritmo"],
+            datos["quantum"],
+            opciones_carga(datos),
+        )
+        return Response(
+            SimulationJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": reverse("api_job_detail", args=[job.pk])},
+        )
+
+
+class JobDetailView(APIView):
+    """Estado y progreso de un trabajo."""
+
+    @extend_schema(responses=SimulationJobSerializer)
+    def get(self, request, pk):
+        return Response(SimulationJobSerializer(get_object_or_404(SimulationJob, pk=pk)).data)
+
+
+class JobCancelView(APIView):
+    """Cancela un trabajo en cola, o pide al worker que aborte uno en ejecución."""
+
+    @extend_schema(request=None, responses=SimulationJobSerializer)
+    def post(self, request, pk):
+        job = get_object_or_404(SimulationJob, pk=pk)
+        if job.finalizado:
+            return Response(SimulationJobSerializer(job).data, status=status.HTTP_409_CONFLICT)
+        return Response(SimulationJobSerializer(jobs.cancelar(job)).data)
+
+
+class JobResultView(APIView):
+    """
+    Resumen del resultado de un trabajo terminado (409 mientras no lo
+    esté). La línea de tiempo, guardada aparte en LineaTiempo, se incluye
+    con ?timeline=1, paginada con timeline_page y timeline_page_size.
+    """
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT, 409: SimulationJobSerializer})
+    def get(self, request, pk):
+        job = get_object_or_404(SimulationJob, pk=pk)
+        if job.estado != SimulationJob.Estado.TERMINADO:
+            return Response(SimulationJobSerializer(job).data, status=status.HTTP_409_CONFLICT)
+        resultado = dict(job.resultado)
+        if request.query_params.get("timeline") in ("1", "true"):
+            try:
+                page = int(request.query_params.get("timeline_page", 1))
+                page_size = min(5000, max(1, int(request.query_params.get("timeline_page_size", 500))))
+            except ValueError:
+                return Response({"detail": "Paginación inválida."}, status=status.HTTP_400_BAD_REQUEST)
+            segmentos = LineaTiempo.cargar(job.clave) if job.clave else None
+            if segmentos is None:
+                raise Http404("El trabajo no tiene línea de tiempo guardada.")
+            resultado["timeline"] = pagina_timeline(segmentos, page, page_size)
+        return Response(resultado)
+
+
+class JobGanttView(APIView):
+    """
+    Gantt del resultado de un trabajo terminado como SVG o PNG, con el mismo
+    tamaño y ventana (ancho, alto, inicio, fin) que /sim/gantt/. La imagen
+    se cachea por la clave que el worker guardó al terminar el trabajo.
+    """
+
+    @extend_schema(
+        responses={
+            (200, "image/svg+xml"): OpenApiTypes.BINARY,
+            (200, "image/png"): OpenApiTypes.BINARY,
+            409: SimulationJobSerializer,
+        }
+    )
+    def get(self, request, pk, formato):
+        job = get_object_or_404(SimulationJob, pk=pk)
+        if job.estado != SimulationJob.Estado.TERMINADO:
+            return Response(SimulationJobSerializer(job).data, status=status.HTTP_409_CONFLICT)
+        if not job.clave:
+            raise Http404("El trabajo no tiene línea de tiempo guardada.")
+        return respuesta_gantt(request, job.clave, formato, lambda: LineaTiempo.cargar(job.clave))
@@ -0,0 +1,265 @@
+"""
+Benchmarks del motor: cuánto tarda y cuánta memoria usa
+`SchedulerSimulator.run` según el algoritmo, la configuración de I/O y el
+tamaño de la carga.
+
+Cada caso simula una carga sintética reproducible (llegadas de Poisson con
+la CPU al ~95 % y ráfagas uniformes de 1 a 20 ticks) cargada como
+ProcessTable. Los resultados se guardan como JSON y `comparar` los
+contrasta con una baseline anterior: una baseline solo es comparable con
+resultados de la misma máquina y la misma versión de Python.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+from .engine.process_table import ProcessTable
+from .engine.profiling import RunProfiler
+from .engine.simulator import SchedulerSimulator, SimulationConfig
+from .scheduler import crear_algoritmo
+
+VERSION_BASELINE = 2
+TAMANOS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+QUANTUMS_RR = (2, 8, 32)
+# Carga media de la CPU en las cargas sintéticas.
+_UTILIZACION = 0.95
+_RAFAGA_MAX = 20
+
+
+@dataclass(frozen=True)
+class CasoBenchmark:
+    """Una medición: algoritmo (con su quantum), I/O y número de procesos."""
+
+    algoritmo: str
+    n: int
+    quantum: int | None = None
+    io_enabled: bool = False
+    engine: str = "event"
+
+    @property
+    def clave(self) -> str:
+        nombre = self.algoritmo if self.quantum is None else f"{self.algoritmo}-q{self.quantum}"
+        return f"{nombre}/io={int(self.io_enabled)}/{self.engine}/n={self.n}"
+
+
+@dataclass(frozen=True)
+class Regresion:
+    """Una métrica de un caso que empeoró más de lo permitido."""
+
+    caso: str
+    metrica: str
+    base: float
+    actual: float
+
+    @property
+    def cambio(self) -> float:
+        return self.actual / self.base - 1 if self.base else float("inf")
+
+    def __str__(self) -> str:
+        return f"{self.caso}: {self.metrica} {self.base:.6g} -> {self.actual:.6g} ({self.cambio:+.1%})"
+
+
+def casos_por_defecto(
+    tamanos: Sequence[int] = TAMANOS, *, engine: str = "event"
+) -> list[CasoBenchmark]:
+    """FCFS, SJF y RR con cada quantum de QUANTUMS_RR, con y sin I/O, para cada tamaño."""
+    algoritmos: list[tuple[str, int | None]] = [("fcfs", None), ("sjf", None)]
+    algoritmos += [("rr", quantum) for quantum in QUANTUMS_RR]
+    return [
+        CasoBenchmark(algoritmo, n, quantum, io_enabled, engine)
+        for n in tamanos
+        for io_enabled in (False, True)
+        for algoritmo, quantum in algoritmos
+    ]
+
+
+def carga_sintetica(n: int, semilla: int = 0) -> ProcessTable:
+    """`n` procesos con llegadas de Poisson y ráfagas uniformes, reproducibles por semilla."""
+    rnd = random.Random(semilla)
+    media_entre_llegadas = (1 + _RAFAGA_MAX) / 2 / _UTILIZACION
+    llegadas: list[int] = []
+    reloj = 0.0
+    for _ in range(n):
+        llegadas.append(int(reloj))
+        reloj += rnd.expovariate(1 / media_entre_llegadas)
+    rafagas = [rnd.randint(1, _RAFAGA_MAX) for _ in range(n)]
+    return ProcessTable.from_columns(range(1, n + 1), llegadas, rafagas)
+
+
+def medir(
+    caso: CasoBenchmark,
+    *,
+    repeticiones: int = 3,
+    semilla: int = 0,
+    memoria: bool = True,
+    perfil: bool = False,
+) -> dict[str, Any]:
+    """
+    Mide `run()` (la carga se prepara fuera del cronómetro):
+
+    - segundos: el mejor de `repeticiones` tiempos de pared.
+    - ticks y ticks_por_segundo: reloj simulado final y ritmo de simulación.
+    - memoria_pico: bytes de pico asignados durante `run()`, medidos en una
+      pasada aparte con tracemalloc (None si `memoria` es False).
+    - asignaciones: bloques asignados durante `run()` que siguen vivos al
+      volver, es decir, lo que retiene la simulación (línea de tiempo, PCBs
+      terminados, métricas); diferencia entre instantáneas de tracemalloc
+      de esa misma pasada (None si `memoria` es False).
+    - perfil: RunProfiler.report() de otra pasada instrumentada (None si
+      `perfil` es False); no afecta a las demás medidas.
+    """
+    tiempos: list[float] = []
+    ticks = 0
+    for repeticion in range(max(1, repeticiones)):
+        sim = _preparar(caso, semilla)
+        gc.collect()
+        inicio = time.perf_counter()
+        sim.run()
+        tiempos.append(time.perf_counter() - inicio)
+        if repeticion == 0:
+            ticks = sim.clock
+        del sim
+
+    pico = asignaciones = None
+    if memoria:
+        sim = _preparar(caso, semilla)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            antes = tracemalloc.take_snapshot()
+            base, _ = tracemalloc.get_traced_memory()
+            sim.run()
+            _, maximo = tracemalloc.get_traced_memory()
+            despues = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        pico = maximo - base
+        asignaciones = _bloques_nuevos(antes, despues)
+
+    informe = None
+    if perfil:
+        profiler = RunProfiler()
+        _preparar(caso, semilla, profiler).run()
+        informe = profiler.report()
+
+    segundos = min(tiempos)
+    return {
+        **asdict(caso),
+        "segundos": segundos,
+        "ticks": ticks,
+        "ticks_por_segundo": ticks / segundos if segundos else None,
+        "asignaciones": asignaciones,
+        "memoria_pico": pico,
+        "perfil": informe,
+    }
+
+
+def ejecutar(
+    casos: Iterable[CasoBenchmark],
+    *,
+    repeticiones: int = 3,
+    semilla: int = 0,
+    memoria: bool = True,
+    perfil: bool = False,
+    al_medir: Callable[[CasoBenchmark, Dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Mide cada caso y devuelve el documento JSON de resultados (baseline).
+    `al_medir(caso, medida)` se llama tras cada caso, para informar del avance.
+    """
+    resultados: Dict[str, Any] = {}
+    for caso in casos:
+        medida = medir(
+            caso, repeticiones=repeticiones, semilla=semilla, memoria=memoria, perfil=perfil
+        )
+        resultados[caso.clave] = medida
+        if al_medir is not None:
+            al_medir(caso, medida)
+    return {
+        "version": VERSION_BASELINE,
+        "entorno": {
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+        },
+        "resultados": resultados,
+    }
+
+
+def guardar(documento: Dict[str, Any], ruta: str) -> None:
+    with open(ruta, "w", encoding="utf-8") as fichero:
+        json.dump(documento, fichero, indent=2, sort_keys=True)
+        fichero.write("\n")
+
+
+def cargar(ruta: str) -> dict[str, Any]:
+    with open(ruta, encoding="utf-8") as fichero:
+        documento = json.load(fichero)
+    if documento.get("version") != VERSION_BASELINE:
+        raise ValueError(f"Versión de baseline no soportada: {documento.get('version')!r}")
+    return documento
+
+
+def comparar(
+    actual: Dict[str, Any],
+    base: Dict[str, Any],
+    *,
+    umbral_tiempo: float = 0.25,
+    umbral_memoria: float = 0.10,
+    umbral_asignaciones: float = 0.10,
+    minimo_segundos: float = 0.01,
+) -> List[Regresion]:
+    """
+    Regresiones de `actual` respecto a `base` en los casos que ambos tienen.
+    Un caso regresa si su tiempo crece más de `umbral_tiempo` (fracción), su
+    memoria de pico más de `umbral_memoria` o sus asignaciones más de
+    `umbral_asignaciones`. Los tiempos base por debajo de `minimo_segundos`
+    se ignoran: a esa escala domina el ruido.
+    """
+    regresiones: List[Regresion] = []
+    base_resultados = base["resultados"]
+    for clave, medida in actual["resultados"].items():
+        previa = base_resultados.get(clave)
+        if previa is None:
+            continue
+        if previa["segundos"] >= minimo_segundos and medida["segundos"] > previa["segundos"] * (1 + umbral_tiempo):
+            regresiones.append(Regresion(clave, "segundos", previa["segundos"], medida["segundos"]))
+        for metrica, umbral in (("memoria_pico", umbral_memoria), ("asignaciones", umbral_asignaciones)):
+            if (
+                previa.get(metrica)
+                and medida.get(metrica) is not None
+                and medida[metrica] > previa[metrica] * (1 + umbral)
+            ):
+                regresiones.append(Regresion(clave, metrica, previa[metrica], medida[metrica]))
+    return regresiones
+
+
+def _bloques_nuevos(antes: tracemalloc.Snapshot, despues: tracemalloc.Snapshot) -> int:
+    """Bloques vivos en `despues` que no lo estaban en `antes`, sin contar los de tracemalloc."""
+    sin_tracemalloc = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    despues = despues.filter_traces(sin_tracemalloc)
+    antes = antes.filter_traces(sin_tracemalloc)
+    return sum(diferencia.count_diff for diferencia in despues.compare_to(antes, "traceback"))
+
+
+def _preparar(
+    caso: CasoBenchmark, semilla: int, profiler: RunProfiler | None = None
+) -> SchedulerSimulator:
+    config = SimulationConfig(
+        algorithm=crear_algoritmo(caso.algoritmo, caso.quantum),
+        io_enabled=caso.io_enabled,
+        engine=caso.engine,
+        seed=semilla,
+        profiler=profiler,
+    )
+    sim = SchedulerSimulator(config)
+    sim.load_table(carga_sintetica(caso.n, semilla))
+    return sim
@@ -0,0 +1,285 @@
+"""
+Caché de resultados direccionada por contenido para Planificador.
+
+La clave es un hash de la carga normalizada (pid, llegada, rafaga,
+prioridad, usuario, en el orden recibido; de una ProcessTable, el hash de
+sus columnas), el algoritmo, el quantum
+efectivo, las opciones del algoritmo y la configuración de I/O. Hay dos
+niveles: un LRU en proceso, acotado por número de entradas y por bytes, y
+opcionalmente cualquier backend con la API de caché de Django
+(`get`/`set`/`delete`), compartido entre workers. Un acierto devuelve el
+Resultado sin simular.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Mapping, Protocol
+
+from .engine.process_table import ProcessTable
+from .engine.workload import workload_digest
+from .metrics import Resultado
+
+# Súbelo si cambia la forma de Resultado o la semántica del simulador.
+VERSION_CLAVE = 4
+
+# Opciones de cada algoritmo y su valor por defecto (ver crear_algoritmo).
+OPCIONES_ALGORITMO: Dict[str, Dict[str, int | None]] = {
+    "mlfq": {"niveles": 3, "boost": None},
+    "cfs": {"latencia": 24, "granularidad": 3},
+}
+
+
+class BackendCache(Protocol):
+    """Subconjunto de django.core.cache.BaseCache que usa CacheResultados."""
+
+    def get(self, key: str, default: Any = None) -> Any: ...
+
+    def set(self, key: str, value: Any, timeout: Any = ...) -> None: ...
+
+    def delete(self, key: str) -> Any: ...
+
+
+def clave_resultado(
+    procesos: List[Dict[str, Any]] | ProcessTable,
+    algoritmo: str,
+    quantum: int | None = None,
+    io: Mapping[str, Any] | None = None,
+    opciones: Mapping[str, Any] | None = None,
+    *,
+    huella: str | None = None,
+) -> str:
+    """
+    Hash canónico de una simulación. Normaliza igual que Planificador
+    (enteros, valores por defecto, quantum por defecto de RR y MLFQ), así
+    que dos entradas que producen el mismo Resultado comparten clave.
+    `huella` es la de huella_carga(procesos), si ya se calculó (p. ej. al
+    comparar varios algoritmos sobre la misma carga).
+    """
+    carga = huella if huella is not None else huella_carga(procesos)
+    if algoritmo in ("rr", "mlfq"):
+        quantum = quantum if quantum is not None and quantum > 0 else 2
+    else:
+        quantum = None
+    documento = json.dumps(
+        {
+            "v": VERSION_CLAVE,
+            "algoritmo": algoritmo,
+            "quantum": quantum,
+            "opciones": normalizar_opciones(algoritmo, opciones),
+            "io": dict(sorted((io or {}).items())),
+            "carga": carga,
+        },
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.blake2b(documento.encode(), digest_size=20).hexdigest()
+
+
+def huella_carga(procesos: List[Dict[str, Any]] | ProcessTable) -> str:
+    """Hash de la carga normalizada, la parte de clave_resultado que no depende del algoritmo."""
+    if isinstance(procesos, ProcessTable):
+        return "tabla:" + workload_digest(procesos)
+    filas = [
+        [p["pid"], p["llegada"], p["rafaga"], p["prioridad"], p["usuario"]]
+        for p in normalizar_procesos(procesos)
+    ]
+    documento = json.dumps(filas, separators=(",", ":"))
+    return hashlib.blake2b(documento.encode(), digest_size=20).hexdigest()
+
+
+def normalizar_procesos(procesos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Filas con los tipos con los que se simulan y se hashean: pid, llegada,
+    rafaga y prioridad enteros (prioridad puede ser None) y usuario str.
+    Planificador simula sobre estas filas, así que dos cargas con la misma
+    clave dan siempre el mismo Resultado. Lanza ValueError indicando la
+    fila si alguna no es válida.
+    """
+    filas: List[Dict[str, Any]] = []
+    for fila, p in enumerate(procesos):
+        try:
+            normalizada = {
+                "pid": int(p["pid"]),
+                "llegada": int(p.get("llegada", 0)),
+                "rafaga": int(p.get("rafaga", 0)),
+                "prioridad": None if p.get("prioridad") is None else int(p["prioridad"]),
+                "usuario": str(p.get("usuario", "root")),
+            }
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Proceso {fila} inválido ({exc})") from exc
+        if normalizada["llegada"] < 0 or normalizada["rafaga"] < 0:
+            raise ValueError(f"Proceso {fila}: llegada y rafaga no pueden ser negativas")
+        filas.append(normalizada)
+    return filas
+
+
+def normalizar_opciones(
+    algoritmo: str, opciones: Mapping[str, Any] | None
+) -> Dict[str, int | None] | None:
+    """
+    Opciones efectivas de `algoritmo`: las conocidas, como enteros, y el
+    valor por defecto para las que faltan o son 0/None. None si el
+    algoritmo no tiene opciones.
+    """
+    por_defecto = OPCIONES_ALGORITMO.get(algoritmo)
+    if por_defecto is None:
+        return None
+    opciones = opciones or {}
+    return {
+        nombre: int(opciones[nombre]) if opciones.get(nombre) else valor
+        for nombre, valor in por_defecto.items()
+    }
+
+
+@dataclass(slots=True)
+class EstadisticasCache:
+    hits: int = 0
+    hits_backend: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entradas: int = 0
+    bytes: int = 0
+
+
+class CacheResultados:
+    """
+    LRU en proceso con un segundo nivel opcional.
+
+    `max_entradas` y `max_bytes` limitan el LRU (el tamaño de una entrada es
+    el de su pickle); al superarlos se desalojan las menos usadas. Entradas
+    mayores que `max_bytes_entrada` no se guardan en ningún nivel. Los
+    Resultado devueltos se comparten entre llamadas: trátalos como de solo
+    lectura. Admite cualquier valor serializable con pickle; las vistas la
+    usan también para las imágenes del Gantt.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entradas: int = 128,
+        max_bytes: int | None = 64 * 1024 * 1024,
+        max_bytes_entrada: int | None = 8 * 1024 * 1024,
+        backend: BackendCache | None = None,
+        timeout: int | None = 3600,
+        prefijo: str = "simulator:resultado:",
+    ) -> None:
+        if max_entradas < 0:
+            raise ValueError("max_entradas debe ser >= 0")
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.max_bytes_entrada = max_bytes_entrada
+        self.backend = backend
+        self.timeout = timeout
+        self.prefijo = prefijo
+        self._lru: OrderedDict[str, tuple[Resultado, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = EstadisticasCache()
+
+    @classmethod
+    def con_django(cls, alias: str = "default", **opciones: Any) -> "CacheResultados":
+        """Instancia con el backend de caché de Django `alias` como segundo nivel."""
+        from django.core.cache import caches  # pylint: disable=import-outside-toplevel
+
+        return cls(backend=caches[alias], **opciones)
+
+    # ---------- API ----------
+
+    def obtener(self, clave: str) -> Resultado | None:
+        with self._lock:
+            entrada = self._lru.get(clave)
+            if entrada is not None:
+                self._lru.move_to_end(clave)
+                self._stats.hits += 1
+                return entrada[0]
+        if self.backend is not None:
+            datos = self.backend.get(self.prefijo + clave)
+            if datos is not None:
+                resultado = pickle.loads(datos)
+                with self._lock:
+                    self._stats.hits_backend += 1
+                    self._insertar(clave, resultado, len(datos))
+                return resultado
+        with self._lock:
+            self._stats.misses += 1
+        return None
+
+    def guardar(self, clave: str, resultado: Resultado) -> None:
+        datos = pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.max_bytes_entrada is not None and len(datos) > self.max_bytes_entrada:
+            return
+        with self._lock:
+            self._insertar(clave, resultado, len(datos))
+        if self.backend is not None:
+            self.backend.set(self.prefijo + clave, datos, self.timeout)
+
+    def invalidar(self, clave: str) -> None:
+        with self._lock:
+            entrada = self._lru.pop(clave, None)
+            if entrada is not None:
+                self._bytes -= entrada[1]
+        if self.backend is not None:
+            self.backend.delete(self.prefijo + clave)
+
+    def limpiar(self) -> None:
+        """Vacía el LRU local (el backend compartido conserva sus entradas)."""
+        with self._lock:
+            self._lru.clear()
+            self._bytes = 0
+
+    @property
+    def estadisticas(self) -> EstadisticasCache:
+        with self._lock:
+            return replace(self._stats, entradas=len(self._lru), bytes=self._bytes)
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self._lru
+
+    # ---------- LRU (con el lock tomado) ----------
+
+    def _insertar(self, clave: str, resultado: Resultado, tamano: int) -> None:
+        if self.max_entradas == 0 or (self.max_bytes is not None and tamano > self.max_bytes):
+            return
+        anterior = self._lru.pop(clave, None)
+        if anterior is not None:
+            self._bytes -= anterior[1]
+        self._lru[clave] = (resultado, tamano)
+        self._bytes += tamano
+        while len(self._lru) > self.max_entradas or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, liberado) = self._lru.popitem(last=False)
+            self._bytes -= liberado
+            self._stats.evictions += 1
+
+
+def cache_desde_settings(opciones: Mapping[str, Any] | None) -> CacheResultados | None:
+    """
+    Construye la caché a partir de un dict estilo settings:
+    {"ENABLED", "MAX_ENTRIES", "MAX_BYTES", "MAX_ENTRY_BYTES", "BACKEND", "TIMEOUT", "PREFIX"}.
+    "BACKEND" es el alias de una caché de Django o None (solo LRU local);
+    "PREFIX" separa en él las claves de distintas cachés.
+    """
+    opciones = dict(opciones or {})
+    if not opciones.get("ENABLED", True):
+        return None
+    kwargs: Dict[str, Any] = {
+        "max_entradas": opciones.get("MAX_ENTRIES", 128),
+        "max_bytes": opciones.get("MAX_BYTES", 64 * 1024 * 1024),
+        "max_bytes_entrada": opciones.get("MAX_ENTRY_BYTES", 8 * 1024 * 1024),
+        "timeout": opciones.get("TIMEOUT", 3600),
+        "prefijo": opciones.get("PREFIX", "simulator:resultado:"),
+    }
+    alias = opciones.get("BACKEND")
+    if alias:
+        return CacheResultados.con_django(alias, **kwargs)
+    return CacheResultados(**kwargs)
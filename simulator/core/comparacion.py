@@ -0,0 +1,182 @@
+"""
+Una carga simulada con varios algoritmos, para compararlos lado a lado.
+
+Cada variante es {"algoritmo": str, "quantum": int|None} más las opciones
+del algoritmo si las tiene (como las cargas de core.lotes, sin "procesos").
+La carga se valida, se convierte a ProcessTable y se hashea una sola vez
+(Planificador.tabla, huella_carga). Cada variante parte de una copia nueva
+de la tabla: PCBs recién creados con `to_pcbs()` si la carga llegó como
+filas (el motor va más rápido con PCBs que con vistas de la tabla) o
+`fresh()` si ya era una ProcessTable, que comparte las columnas estáticas.
+
+FCFS y SJF se resuelven en el proceso actual (sin I/O tienen solución
+cerrada). El resto corre en un pool de procesos que recibe la tabla una vez
+por worker, no una vez por variante; con cargas pequeñas, arrancar el pool
+cuesta más que simular y se simula en serie. Con caché, las claves son las
+mismas que las de /sim/run/ y /sim/api/batch/ para esa carga.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Sequence
+
+from .cache import CacheResultados, clave_resultado, huella_carga, normalizar_opciones
+from .engine.batch import BATCH_ALGORITHMS
+from .engine.process_table import ProcessTable
+from .lotes import opciones_carga
+from .metrics import Resultado
+from .scheduler import Planificador, Procesos, crear_algoritmo
+
+VARIANTES_POR_DEFECTO: tuple[Dict[str, Any], ...] = (
+    {"algoritmo": "fcfs"},
+    {"algoritmo": "sjf"},
+    {"algoritmo": "rr", "quantum": 2},
+)
+
+# Por debajo de este número de procesos se simula en serie.
+MIN_PROCESOS_POOL = 2000
+
+# (métrica de Resultado, etiqueta, True si menor es mejor)
+METRICAS = (
+    ("avg_wait", "Espera media", True),
+    ("avg_turnaround", "Retorno medio", True),
+    ("avg_response", "Respuesta media", True),
+    ("makespan", "Makespan", True),
+    ("throughput", "Throughput", False),
+    ("cpu_utilization", "Uso de CPU", False),
+    ("context_switches", "Cambios de contexto", True),
+)
+
+# Carga del worker, fijada una vez por proceso por el initializer del pool.
+_tabla: ProcessTable | None = None
+_filas = False
+
+
+def comparar(
+    procesos: Procesos,
+    variantes: Sequence[Dict[str, Any]] = VARIANTES_POR_DEFECTO,
+    *,
+    max_workers: int | None = None,
+    cache: CacheResultados | None = None,
+) -> List[Resultado]:
+    """
+    Resultado de cada variante, en el orden recibido. Lanza ValueError si
+    la carga o alguna variante no es válida, antes de simular ninguna.
+    """
+    tabla = Planificador().tabla(procesos)
+    filas = not isinstance(procesos, ProcessTable)
+    for variante in variantes:
+        crear_algoritmo(variante["algoritmo"], variante.get("quantum"), opciones_carga(variante))
+
+    resultados: List[Resultado | None] = [None] * len(variantes)
+    claves: List[str | None] = [None] * len(variantes)
+    aciertos = [False] * len(variantes)
+    huella = huella_carga(procesos) if cache is not None else None
+    pendientes: List[int] = []
+    for index, variante in enumerate(variantes):
+        if cache is not None:
+            claves[index] = clave_resultado(
+                procesos,
+                variante["algoritmo"],
+                variante.get("quantum"),
+                Planificador.IO_CONFIG,
+                opciones_carga(variante),
+                huella=huella,
+            )
+            resultados[index] = cache.obtener(claves[index])
+            if resultados[index] is not None:
+                aciertos[index] = True
+                continue
+        if variante["algoritmo"] in BATCH_ALGORITHMS:
+            resultados[index] = _simular(tabla, variante, filas)
+        else:
+            pendientes.append(index)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pendientes))
+    if workers < 2 or len(tabla) < MIN_PROCESOS_POOL:
+        for index in pendientes:
+            resultados[index] = _simular(tabla, variantes[index], filas)
+    else:
+        with ProcessPoolExecutor(
+            workers, initializer=_recibir_tabla, initargs=(tabla, filas)
+        ) as pool:
+            futuros = {index: pool.submit(_simular_en_worker, variantes[index]) for index in pendientes}
+            for index, futuro in futuros.items():
+                resultados[index] = futuro.result()
+
+    if cache is not None:
+        for index, (resultado, acierto) in enumerate(zip(resultados, aciertos)):
+            if not acierto:
+                resultado.clave = claves[index]
+                cache.guardar(claves[index], resultado)
+    return resultados
+
+
+def etiqueta(variante: Dict[str, Any]) -> str:
+    """
+    Nombre corto de una variante: "FCFS", "RR q=4", "MLFQ q=2 niveles=3
+    boost=20", "CFS latencia=24 granularidad=3". Incluye las opciones
+    efectivas del algoritmo, así que dos variantes con distinta
+    configuración nunca comparten etiqueta.
+    """
+    algoritmo = variante["algoritmo"]
+    partes = [algoritmo.upper()]
+    if algoritmo in ("rr", "mlfq"):
+        partes.append(f"q={variante.get('quantum') or 2}")
+    for nombre, valor in (normalizar_opciones(algoritmo, opciones_carga(variante)) or {}).items():
+        if valor is not None:
+            partes.append(f"{nombre}={valor}")
+    return " ".join(partes)
+
+
+def lado_a_lado(variantes: Sequence[Dict[str, Any]], resultados: Sequence[Resultado]) -> Dict[str, Any]:
+    """
+    Tabla comparativa: {"columnas": [{"etiqueta", "algoritmo", "quantum",
+    "clave"}], "filas": [{"metrica", "etiqueta", "valores": [{"valor",
+    "mejor"}]}]}, una columna por variante y una fila por métrica de
+    METRICAS; "mejor" marca el mejor valor de la fila (todos, si empatan).
+    """
+    columnas = [
+        {
+            "etiqueta": etiqueta(variante),
+            "algoritmo": variante["algoritmo"],
+            "quantum": variante.get("quantum"),
+            "clave": resultado.clave,
+        }
+        for variante, resultado in zip(variantes, resultados)
+    ]
+    filas = []
+    for metrica, nombre, menor_es_mejor in METRICAS:
+        valores = [getattr(resultado, metrica) for resultado in resultados]
+        conocidos = [valor for valor in valores if valor is not None]
+        mejor = (min if menor_es_mejor else max)(conocidos) if conocidos else None
+        filas.append(
+            {
+                "metrica": metrica,
+                "etiqueta": nombre,
+                "valores": [
+                    {"valor": valor, "mejor": valor is not None and valor == mejor}
+                    for valor in valores
+                ],
+            }
+        )
+    return {"columnas": columnas, "filas": filas}
+
+
+def _simular(tabla: ProcessTable, variante: Dict[str, Any], filas: bool) -> Resultado:
+    algoritmo = variante["algoritmo"]
+    procesos = tabla.to_pcbs() if filas and algoritmo not in BATCH_ALGORITHMS else tabla
+    return Planificador()._simular(
+        procesos, algoritmo, variante.get("quantum"), opciones=opciones_carga(variante)
+    )
+
+
+def _recibir_tabla(tabla: ProcessTable, filas: bool) -> None:
+    global _tabla, _filas  # pylint: disable=global-statement
+    _tabla, _filas = tabla, filas
+
+
+def _simular_en_worker(variante: Dict[str, Any]) -> Resultado:
+    return _simular(_tabla, variante, _filas)
@@ -15,6 +15,8 @@ class SchedulingDecision:
 
     next_process: PCB | None
     preempt_current: bool = False  # "preemptar" = interrumpir el proceso actual
+    # Ticks the decision stays valid if no process arrives or wakes up;
+    # None means "until the next event". Used by the event-driven engine.
     timeslice: int | None = None
     notes: str | None = None
 
@@ -30,6 +32,10 @@ class SchedulingAlgorithm(Protocol):
         """Reset internal state before a new simulation run."""
         raise NotImplementedError
 
+    def create_ready_queue(self) -> ReadyQueue:
+        """Build the ready queue the simulator should use (FIFO by default)."""
+        return ReadyQueue()
+
     def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
         """Load the ready queue before starting the simulation loop."""
         raise NotImplementedError
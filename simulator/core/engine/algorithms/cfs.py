@@ -0,0 +1,153 @@
+"""Completely Fair Scheduler: weighted virtual runtime, smallest first."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import FairReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+# Linux's sched_prio_to_weight: nice -20 .. 19, each step is ~1.25x CPU share.
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+
+
+def nice_weight(pcb: PCB) -> int:
+    """Load weight of `pcb`, reading `priority` as a nice value (None = 0, clamped to -20..19)."""
+    nice = pcb.priority or 0
+    return NICE_TO_WEIGHT[min(19, max(-20, nice)) + 20]
+
+
+class CFSAlgorithm(SchedulingAlgorithm):
+    """
+    Preemptive fair-share scheduling: always run the process with the
+    smallest virtual runtime, which advances more slowly for heavier
+    (lower nice) processes.
+
+    On dispatch a process gets `period * weight / total_weight` ticks, where
+    `period` is `target_latency` stretched to `min_granularity` ticks per
+    runnable process; no slice is shorter than `min_granularity`. When its
+    slice is over, the process is preempted as soon as a queued process has
+    a smaller vruntime.
+    """
+
+    name = "cfs"
+
+    def __init__(self, target_latency: int = 24, min_granularity: int = 3) -> None:
+        if min_granularity <= 0 or target_latency < min_granularity:
+            raise ValueError("need 0 < min_granularity <= target_latency")
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self._current: PCB | None = None
+        self._dispatch_time: int = 0
+        self._slice: int = min_granularity
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        self._current = None
+        self._dispatch_time = 0
+        self._slice = self.min_granularity
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Heap ordered by vruntime: O(log n) enqueue and pick-next."""
+        return FairReadyQueue(weight=nice_weight)
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load enqueues the jobs in arrival order (all start at vruntime 0)."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: FairReadyQueue,  # type: ignore[override]
+    ) -> SchedulingDecision:
+        """Keep the current process until its slice ends and someone is behind it in vruntime."""
+        if running is not self._current:
+            # The previous process finished or blocked for I/O.
+            if self._current is not None and self._current.remaining_time == 0:
+                ready_queue.forget(self._current)
+            self._current = None
+            if running is not None:
+                # Dispatched outside of our bookkeeping (e.g. a restored run).
+                self._start_slice(running, current_time, ready_queue)
+
+        if running is None:
+            return self._dispatch(ready_queue.dequeue(), current_time, ready_queue)
+
+        head = ready_queue.peek()
+        if (
+            head is not None
+            and current_time - self._dispatch_time >= self._slice
+            and ready_queue.vruntime(head) < ready_queue.vruntime(running)
+        ):
+            # `running` goes back to the queue once the simulator applies this decision.
+            decision = self._dispatch(ready_queue.dequeue(), current_time, ready_queue, running)
+            decision.preempt_current = True
+            return decision
+        return self._decision(running, current_time, ready_queue)
+
+    # ---------- helpers ----------
+
+    def _dispatch(
+        self,
+        pcb: PCB | None,
+        current_time: int,
+        ready_queue: FairReadyQueue,
+        preempted: PCB | None = None,
+    ) -> SchedulingDecision:
+        if pcb is None:
+            self._current = None
+            ready_queue.current = None
+            return SchedulingDecision(next_process=None)
+        self._start_slice(pcb, current_time, ready_queue, preempted)
+        return self._decision(pcb, current_time, ready_queue, preempted)
+
+    def _start_slice(
+        self,
+        pcb: PCB,
+        current_time: int,
+        ready_queue: FairReadyQueue,
+        preempted: PCB | None = None,
+    ) -> None:
+        self._current = pcb
+        ready_queue.current = pcb
+        self._dispatch_time = current_time
+        runnable = len(ready_queue) + 1
+        load = ready_queue.load + ready_queue.weight(pcb)
+        if preempted is not None:
+            runnable += 1
+            load += ready_queue.weight(preempted)
+        period = max(self.target_latency, runnable * self.min_granularity)
+        self._slice = max(self.min_granularity, period * ready_queue.weight(pcb) // load)
+
+    def _decision(
+        self,
+        pcb: PCB,
+        current_time: int,
+        ready_queue: FairReadyQueue,
+        preempted: PCB | None = None,
+    ) -> SchedulingDecision:
+        head = ready_queue.peek()
+        if preempted is not None and (
+            head is None or ready_queue.vruntime(preempted) < ready_queue.vruntime(head)
+        ):
+            head = preempted
+        if head is None:
+            # Alone on the CPU until something arrives or wakes up.
+            return SchedulingDecision(next_process=pcb)
+        # Valid until the slice is over and `pcb` has passed the head's vruntime.
+        until_slice = self._slice - (current_time - self._dispatch_time)
+        behind = ready_queue.vruntime(head) - ready_queue.vruntime(pcb)
+        until_passed = behind // ready_queue.rate(pcb) + 1 if behind >= 0 else 0
+        return SchedulingDecision(next_process=pcb, timeslice=max(1, until_slice, until_passed))
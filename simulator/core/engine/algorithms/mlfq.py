@@ -0,0 +1,113 @@
+"""Multilevel Feedback Queue scheduling algorithm."""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from ..pcb import PCB
+from ..queues import MultiLevelReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+
+class MLFQAlgorithm(SchedulingAlgorithm):
+    """
+    Preemptive MLFQ: new processes start at level 0, a process that uses its
+    whole quantum drops one level, and every `boost_interval` ticks all
+    processes go back to level 0 so long jobs cannot starve.
+
+    A process waiting at a higher level preempts the running one. A process
+    that blocks for I/O keeps its level and gets a fresh quantum when it
+    runs again. The lowest level behaves like Round Robin.
+    """
+
+    name = "mlfq"
+
+    def __init__(self, quanta: Sequence[int] = (2, 4, 8), boost_interval: int | None = None) -> None:
+        if not quanta or any(q <= 0 for q in quanta):
+            raise ValueError("quanta must be a non-empty list of positive integers")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("boost_interval must be positive")
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+        self._current: PCB | None = None
+        self._dispatch_time: int = 0
+        self._next_boost: int | None = boost_interval
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        self._current = None
+        self._dispatch_time = 0
+        self._next_boost = self.boost_interval
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """One FIFO per level plus an occupancy bitmap."""
+        return MultiLevelReadyQueue(len(self.quanta))
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Initial load enqueues every job at level 0 in arrival order."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.arrival_time))
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,
+        running: PCB | None,
+        ready_queue: MultiLevelReadyQueue,  # type: ignore[override]
+    ) -> SchedulingDecision:
+        """Apply boosts, preemption by higher levels and demotion on quantum expiry."""
+        if self._next_boost is not None and current_time >= self._next_boost:
+            ready_queue.boost()
+            missed = (current_time - self._next_boost) // self.boost_interval + 1
+            self._next_boost += missed * self.boost_interval
+            self._dispatch_time = current_time
+
+        if running is not self._current:
+            # The previous process finished or blocked for I/O.
+            if self._current is not None and self._current.remaining_time == 0:
+                ready_queue.forget(self._current)
+            self._current = None
+            if running is not None:
+                # Dispatched outside of our bookkeeping (e.g. a restored run).
+                self._current = running
+                self._dispatch_time = current_time
+
+        if running is None:
+            return self._dispatch(ready_queue.dequeue(), current_time, ready_queue)
+
+        level = ready_queue.level_of(running)
+        top = ready_queue.highest_level()
+        if current_time - self._dispatch_time >= self.quanta[level]:
+            if level + 1 < len(self.quanta):
+                level += 1
+                ready_queue.set_level(running, level)
+            if top is None or top > level:
+                # Nobody to yield to: fresh quantum at the new level.
+                self._dispatch_time = current_time
+                return self._decision(running, current_time, ready_queue)
+        elif top is None or top >= level:
+            return self._decision(running, current_time, ready_queue)
+
+        # `running` goes back to the ready queue at its (possibly new) level.
+        decision = self._dispatch(ready_queue.dequeue(), current_time, ready_queue)
+        decision.preempt_current = True
+        return decision
+
+    # ---------- helpers ----------
+
+    def _dispatch(
+        self, pcb: PCB | None, current_time: int, ready_queue: MultiLevelReadyQueue
+    ) -> SchedulingDecision:
+        self._current = pcb
+        self._dispatch_time = current_time
+        if pcb is None:
+            return SchedulingDecision(next_process=None)
+        return self._decision(pcb, current_time, ready_queue)
+
+    def _decision(
+        self, pcb: PCB, current_time: int, ready_queue: MultiLevelReadyQueue
+    ) -> SchedulingDecision:
+        # Valid until the quantum runs out or the next boost, whichever is first.
+        timeslice = self.quanta[ready_queue.level_of(pcb)] - (current_time - self._dispatch_time)
+        if self._next_boost is not None:
+            timeslice = min(timeslice, self._next_boost - current_time)
+        return SchedulingDecision(next_process=pcb, timeslice=max(1, timeslice))
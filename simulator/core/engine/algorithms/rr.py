@@ -43,6 +43,7 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
 
         should_preempt = False
         next_proc: PCB | None = running
+        timeslice: int | None = self.quantum
 
         if running is None:
             next_proc = ready_queue.dequeue()
@@ -59,9 +60,15 @@ class RoundRobinAlgorithm(SchedulingAlgorithm):
                     self._dispatch_time = current_time
                 else:
                     self._current_pid = None
+            elif time_in_cpu < self.quantum:
+                timeslice = self.quantum - time_in_cpu
+            else:
+                # Quantum already spent but nobody is waiting: keep running
+                # until a process arrives or wakes up.
+                timeslice = None
 
         return SchedulingDecision(
             next_process=next_proc,
             preempt_current=should_preempt,
-            timeslice=self.quantum,
+            timeslice=timeslice,
         )
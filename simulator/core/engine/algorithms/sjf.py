@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Iterable
 
 from ..pcb import PCB
-from ..queues import ReadyQueue
+from ..queues import PriorityReadyQueue, ReadyQueue
 from .base import SchedulingAlgorithm, SchedulingDecision
 
 
@@ -19,6 +20,10 @@ class SJFAlgorithm(SchedulingAlgorithm):
         # SJF uses no additional state yet.
         return None
 
+    def create_ready_queue(self) -> ReadyQueue:
+        """Keep ready processes in a heap ordered by remaining burst."""
+        return PriorityReadyQueue(key=attrgetter("remaining_time"))
+
     def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
         """Load all available jobs before the simulation starts."""
         ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.burst_time))
@@ -34,19 +39,5 @@ class SJFAlgorithm(SchedulingAlgorithm):
         if running:
             return SchedulingDecision(next_process=running)
 
-        if len(ready_queue) == 0:
-            return SchedulingDecision(next_process=None)
-
-        # Choose the PCB with the smallest remaining burst time.
-        shortest = min(ready_queue, key=lambda pcb: pcb.remaining_time)
-
-        # Rebuild the queue without the selected PCB.
-        buffer = []
-        while len(ready_queue) > 0:
-            candidate = ready_queue.dequeue()
-            if candidate is shortest:
-                continue
-            buffer.append(candidate)
-        ready_queue.extend(buffer)
-
-        return SchedulingDecision(next_process=shortest)
+        # The heap yields the smallest remaining burst (FIFO among ties).
+        return SchedulingDecision(next_process=ready_queue.dequeue())
@@ -0,0 +1,47 @@
+"""Shortest Remaining Time First scheduling algorithm (preemptive SJF)."""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Iterable
+
+from ..pcb import PCB
+from ..queues import PriorityReadyQueue, ReadyQueue
+from .base import SchedulingAlgorithm, SchedulingDecision
+
+
+class SRTFAlgorithm(SchedulingAlgorithm):
+    """Preemptive SJF: a ready process with less remaining time preempts the running one."""
+
+    name = "srtf"
+
+    def reset(self) -> None:
+        """Reset algorithm state between runs."""
+        # SRTF keeps all of its state in the ready queue.
+        return None
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """Keep ready processes in a heap ordered by remaining time."""
+        return PriorityReadyQueue(key=attrgetter("remaining_time"))
+
+    def prime(self, ready_queue: ReadyQueue, jobs: Iterable[PCB]) -> None:
+        """Load all available jobs before the simulation starts."""
+        ready_queue.extend(sorted(jobs, key=lambda pcb: pcb.remaining_time))
+
+    def next_tick(
+        self,
+        *,
+        current_time: int,  # noqa: ARG002
+        running: PCB | None,
+        ready_queue: ReadyQueue,
+    ) -> SchedulingDecision:
+        """Dispatch the shortest remaining time, preempting on a strictly shorter one."""
+        if running is None:
+            return SchedulingDecision(next_process=ready_queue.dequeue())
+
+        candidate = ready_queue.peek()
+        if candidate is not None and candidate.remaining_time < running.remaining_time:
+            return SchedulingDecision(next_process=ready_queue.dequeue(), preempt_current=True)
+
+        # Only an arrival or an I/O completion can change this decision.
+        return SchedulingDecision(next_process=running)
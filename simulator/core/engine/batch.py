@@ -0,0 +1,134 @@
+"""
+Closed-form evaluator for non-preemptive algorithms on CPU-only workloads.
+
+FCFS and non-preemptive SJF without I/O never need the tick loop: FCFS is a
+sort plus a running max/sum, and SJF is a single pass over arrivals with a
+heap of ready bursts. Both work on plain integer columns (arrivals, bursts)
+and reproduce exactly what `SchedulerSimulator` computes for the same jobs.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+BATCH_ALGORITHMS = ("fcfs", "sjf")
+
+
+@dataclass(slots=True)
+class BatchSchedule:
+    """Per-process results in input order, plus run-level aggregates."""
+
+    start: array
+    finish: array
+    waiting: array
+    turnaround: array
+    response: array
+    order: array  # input indices in dispatch (= completion) order
+    makespan: int = 0
+    busy_time: int = 0
+
+    @property
+    def throughput(self) -> float | None:
+        if self.makespan <= 0:
+            return None
+        return len(self.order) / self.makespan
+
+    @property
+    def cpu_utilization(self) -> float | None:
+        if self.makespan <= 0:
+            return None
+        return self.busy_time / self.makespan
+
+    @property
+    def context_switches(self) -> int:
+        # Non-preemptive runs dispatch every process exactly once from an idle CPU.
+        return len(self.order)
+
+
+def evaluate(
+    arrivals: Sequence[int],
+    bursts: Sequence[int],
+    algorithm: str = "fcfs",
+) -> BatchSchedule:
+    """Schedule one workload with `algorithm` ("fcfs" or "sjf")."""
+    if len(arrivals) != len(bursts):
+        raise ValueError("arrivals and bursts must have the same length")
+    # Same stable arrival order the simulator uses in load_jobs.
+    by_arrival = sorted(range(len(arrivals)), key=arrivals.__getitem__)
+    if algorithm == "fcfs":
+        order = array("q", by_arrival)
+    elif algorithm == "sjf":
+        order = _sjf_order(arrivals, bursts, by_arrival)
+    else:
+        raise ValueError(f"Batch evaluation only supports {BATCH_ALGORITHMS}, not {algorithm!r}")
+    return _schedule(arrivals, bursts, order)
+
+
+def evaluate_batch(
+    workloads: Iterable[tuple[Sequence[int], Sequence[int]]],
+    algorithm: str = "fcfs",
+) -> list[BatchSchedule]:
+    """Evaluate many (arrivals, bursts) workloads with the same algorithm."""
+    return [evaluate(arrivals, bursts, algorithm) for arrivals, bursts in workloads]
+
+
+def _sjf_order(
+    arrivals: Sequence[int],
+    bursts: Sequence[int],
+    by_arrival: list[int],
+) -> array:
+    """Dispatch order of non-preemptive SJF; ties go to the earlier arrival."""
+    order = array("q")
+    ready: list[tuple[int, int, int]] = []
+    push, pop = heapq.heappush, heapq.heappop
+    total = len(by_arrival)
+    nxt = 0
+    clock = 0
+    while nxt < total or ready:
+        if not ready and arrivals[by_arrival[nxt]] > clock:
+            clock = arrivals[by_arrival[nxt]]
+        while nxt < total and arrivals[by_arrival[nxt]] <= clock:
+            idx = by_arrival[nxt]
+            push(ready, (bursts[idx], nxt, idx))
+            nxt += 1
+        _burst, _seq, idx = pop(ready)
+        order.append(idx)
+        # A zero-length burst still occupies the CPU for one tick.
+        clock += bursts[idx] if bursts[idx] > 0 else 1
+    return order
+
+
+def _schedule(arrivals: Sequence[int], bursts: Sequence[int], order: array) -> BatchSchedule:
+    n = len(arrivals)
+    start = array("q", bytes(8 * n))
+    finish = array("q", bytes(8 * n))
+    waiting = array("q", bytes(8 * n))
+    turnaround = array("q", bytes(8 * n))
+    response = array("q", bytes(8 * n))
+    clock = 0
+    busy = 0
+    for idx in order:
+        arrival = arrivals[idx]
+        burst = bursts[idx]
+        run = burst if burst > 0 else 1
+        begin = clock if clock > arrival else arrival
+        clock = begin + run
+        busy += run
+        start[idx] = begin
+        finish[idx] = clock
+        turnaround[idx] = clock - arrival
+        waiting[idx] = clock - arrival - burst
+        response[idx] = begin - arrival
+    return BatchSchedule(
+        start=start,
+        finish=finish,
+        waiting=waiting,
+        turnaround=turnaround,
+        response=response,
+        order=order,
+        makespan=clock,
+        busy_time=busy,
+    )
@@ -0,0 +1,89 @@
+"""Flat, offset-indexed I/O schedules generated in one pass for a whole workload."""
+
+from __future__ import annotations
+
+import random
+from array import array
+from typing import Iterable, Sequence
+
+
+class IOScheduleTable:
+    """
+    I/O events for many jobs stored as three flat int arrays.
+
+    Row `i` owns events `offsets[i]:offsets[i + 1]` of `triggers` (CPU time
+    at which the request fires) and `durations` (ticks spent blocked).
+    """
+
+    __slots__ = ("offsets", "triggers", "durations")
+
+    def __init__(self) -> None:
+        self.offsets = array("q", [0])
+        self.triggers = array("q")
+        self.durations = array("q")
+
+    @classmethod
+    def from_events(cls, events: Iterable[tuple[int, int]]) -> "IOScheduleTable":
+        """Single-row table from (cpu_time_at_request, io_duration) tuples."""
+        table = cls()
+        for trigger_at, duration in events:
+            table.triggers.append(trigger_at)
+            table.durations.append(duration)
+        table.offsets.append(len(table.triggers))
+        return table
+
+    @property
+    def rows(self) -> int:
+        return len(self.offsets) - 1
+
+    def row_bounds(self, row: int) -> tuple[int, int]:
+        """[start, end) event indices of `row`."""
+        return self.offsets[row], self.offsets[row + 1]
+
+    def events(self, row: int) -> list[tuple[int, int]]:
+        """Events of `row` as (cpu_time_at_request, io_duration) tuples."""
+        start, end = self.row_bounds(row)
+        return list(zip(self.triggers[start:end], self.durations[start:end]))
+
+
+def generate_io_schedules(
+    bursts: Sequence[int],
+    *,
+    interval_mean: float,
+    interval_stddev: float,
+    duration_mean: float,
+    duration_stddev: float,
+    max_events: int | None = None,
+    enabled: Sequence[bool] | None = None,
+    rng: random.Random | None = None,
+) -> IOScheduleTable:
+    """
+    Generate the I/O schedules of every job in one pass.
+
+    Gaps and durations are drawn from normal distributions exactly as
+    `PCB.prepare_io_schedule` does, in job order, so a given `rng` state
+    yields the same schedules either way. Rows with `enabled[i]` false (or
+    every row when a mean is not positive) are left empty without drawing.
+    """
+    table = IOScheduleTable()
+    offsets, triggers, durations = table.offsets, table.triggers, table.durations
+    add_trigger, add_duration, close_row = triggers.append, durations.append, offsets.append
+    draw = (rng or random).normalvariate
+    active = interval_mean > 0 and duration_mean > 0
+    limit = -1 if max_events is None else max(0, max_events)
+
+    for index, burst in enumerate(bursts):
+        if active and (enabled is None or enabled[index]):
+            cursor = 0
+            count = 0
+            while count != limit:
+                gap = round(draw(interval_mean, interval_stddev))
+                cursor += gap if gap > 1 else 1
+                if cursor >= burst:
+                    break
+                duration = round(draw(duration_mean, duration_stddev))
+                add_trigger(cursor)
+                add_duration(duration if duration > 1 else 1)
+                count += 1
+        close_row(len(triggers))
+    return table
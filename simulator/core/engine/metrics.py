@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import Any, Iterable, List
+
+from .histogram import LatencyHistograms
 
 
 @dataclass(slots=True)
@@ -14,6 +16,88 @@ class ProcessMetrics:
     waiting_time: float | None = None
     turnaround_time: float | None = None  # total time from arrival to completion
     response_time: float | None = None
+    usuario: str | None = None
+
+
+@dataclass(slots=True)
+class RunningStat:
+    """Streaming count/mean/variance/min/max (Welford), mergeable across runs."""
+
+    count: int = 0
+    total: float = 0
+    min: float | None = None
+    max: float | None = None
+    _mean: float = 0.0
+    _m2: float = 0.0
+
+    def add(self, value: float | None) -> None:
+        """Fold one sample in; None is ignored."""
+        if value is None:
+            return
+        self.count += 1
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStat") -> None:
+        """Combine with the stats of a disjoint sample (parallel variance)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.total, self.min, self.max = other.count, other.total, other.min, other.max
+            self._mean, self._m2 = other._mean, other._m2
+            return
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self._mean += delta * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)  # type: ignore[type-var]
+        self.max = max(self.max, other.max)  # type: ignore[type-var]
+
+    @property
+    def mean(self) -> float:
+        # total/count keeps the exact value a sum() over the samples would give.
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two samples)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return self.variance ** 0.5
+
+    def as_dict(self) -> dict[str, float | None]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+@dataclass(slots=True)
+class CPUMetrics:
+    """Per-CPU counters from a multi-core run."""
+
+    cpu: int
+    busy_time: int = 0
+    utilization: float | None = None
+    context_switches: int = 0
+    # Processes moved onto / off this CPU's run queue by the load balancer.
+    migrations_in: int = 0
+    migrations_out: int = 0
+    # Of `migrations_in`, those this CPU pulled while idle (work stealing).
+    steals: int = 0
 
 
 @dataclass(slots=True)
@@ -24,39 +108,95 @@ class SimulationMetrics:
     throughput: float | None = None
     cpu_utilization: float | None = None
     context_switches: int = 0
+    completed: int = 0
+    makespan: int = 0  # latest finish time seen so far
+    # Streaming summaries, updated as each process terminates.
+    waiting: RunningStat = field(default_factory=RunningStat)
+    turnaround: RunningStat = field(default_factory=RunningStat)
+    response: RunningStat = field(default_factory=RunningStat)
+    # Tail-latency histograms, overall and per metadata["usuario"].
+    latency: LatencyHistograms = field(default_factory=LatencyHistograms)
+    latency_by_user: dict[str, LatencyHistograms] = field(default_factory=dict)
+    # False keeps only the summaries above (summary-only runs).
+    per_process: bool = True
+    # Multi-core runs only: one entry per CPU and the total number of migrations.
+    per_cpu: List[CPUMetrics] = field(default_factory=list)
+    migrations: int = 0
+    # RunProfiler.report() when the run was profiled (SimulationConfig.profiler).
+    profile: dict[str, Any] | None = None
 
     def add_process_metrics(self, metrics: ProcessMetrics) -> None:
         """Collect metrics for a single process."""
-        self.processes.append(metrics)
+        self.waiting.add(metrics.waiting_time)
+        self.turnaround.add(metrics.turnaround_time)
+        self.response.add(metrics.response_time)
+        self.latency.record(metrics.waiting_time, metrics.response_time)
+        if metrics.usuario is not None:
+            per_user = self.latency_by_user.get(metrics.usuario)
+            if per_user is None:
+                per_user = self.latency_by_user[metrics.usuario] = LatencyHistograms()
+            per_user.record(metrics.waiting_time, metrics.response_time)
+        self.completed += 1
+        if self.per_process:
+            self.processes.append(metrics)
+
+    def record_pcb(self, pcb: "PCB") -> None:  # type: ignore
+        """Fold a finished PCB into the metrics; unfinished PCBs are skipped."""
+        if pcb.finish_time is None:
+            return
+        waiting = pcb.waiting_time
+        if waiting is None and pcb.turnaround_time is not None:
+            waiting = pcb.turnaround_time - pcb.burst_time
+        turnaround = pcb.turnaround_time
+        if turnaround is None:
+            turnaround = pcb.finish_time - pcb.arrival_time
+        self.add_process_metrics(
+            ProcessMetrics(
+                pid=pcb.pid,
+                waiting_time=waiting,
+                turnaround_time=turnaround,
+                response_time=pcb.response_time,
+                usuario=pcb.metadata.get("usuario", "root"),
+            )
+        )
+        if pcb.finish_time > self.makespan:
+            self.makespan = pcb.finish_time
 
     @classmethod
     def from_pcbs(cls, pcbs: Iterable["PCB"]) -> "SimulationMetrics":  # type: ignore
         """
         Build metrics from the final PCB state.
         """
-        from .pcb import PCB  # pylint: disable=cyclic-import
+        metrics = cls()
+        for pcb in pcbs:
+            metrics.record_pcb(pcb)
+        return metrics
 
+    @classmethod
+    def from_table(cls, table: "ProcessTable") -> "SimulationMetrics":  # type: ignore
+        """
+        Build metrics straight from ProcessTable columns, in row order.
+        """
         metrics = cls()
-        finished: List[PCB] = list(pcbs)
-
-        for pcb in finished:
-            if pcb.finish_time is None:
-                # Skip processes that never finished.
-                continue
-            waiting = pcb.waiting_time
-            if waiting is None and pcb.turnaround_time is not None:
-                waiting = pcb.turnaround_time - pcb.burst_time
-            turnaround = pcb.turnaround_time
-            if turnaround is None:
-                turnaround = pcb.finish_time - pcb.arrival_time
-            response = pcb.response_time
+        for i in table.finished_rows():
+            arrival = table.arrival[i]
+            finish = table.finish[i]
+            turnaround = finish - arrival
             metrics.add_process_metrics(
                 ProcessMetrics(
-                    pid=pcb.pid,
-                    waiting_time=waiting,
+                    pid=table.pid[i],
+                    waiting_time=turnaround - table.burst[i],
                     turnaround_time=turnaround,
-                    response_time=response,
+                    response_time=table.start[i] - arrival,
+                    usuario=table.usuarios[table.usuario[i]],
                 )
             )
+            if finish > metrics.makespan:
+                metrics.makespan = finish
+        return metrics
 
-        return metrics
\ No newline at end of file
+    def merge_latency(self, other: "SimulationMetrics") -> None:
+        """Fold the histograms of another run or shard into this one."""
+        self.latency.merge(other.latency)
+        for usuario, histograms in other.latency_by_user.items():
+            self.latency_by_user.setdefault(usuario, LatencyHistograms()).merge(histograms)
@@ -0,0 +1,376 @@
+"""Multi-core variant of the dispatcher: per-CPU run queues plus a load balancer."""
+
+from __future__ import annotations
+
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List
+
+from .algorithms.base import SchedulingAlgorithm
+from .metrics import CPUMetrics, SimulationMetrics
+from .pcb import PCB
+from .queues import BlockedQueue, ReadyQueue
+from .simulator import (
+    _UNBOUNDED,
+    ENGINES,
+    SchedulerSimulator,
+    SimulationConfig,
+    SimulationStep,
+    _BUDGET_CHECK_EVERY,
+    _PendingArrivals,
+    _RunState,
+)
+from .states import ProcessState
+from .timeline import NullTimeline, Timeline
+
+
+@dataclass(slots=True)
+class LoadBalancer:
+    """
+    How work moves between CPUs.
+
+    Every `push_interval` ticks (None disables it) processes are pushed from
+    the busiest CPU to the least busy one while their loads (queued plus
+    running) differ by more than `imbalance`. With `steal`, a CPU with
+    nothing to run pulls the next process of the busiest run queue.
+    """
+
+    push_interval: int | None = 8
+    imbalance: int = 1
+    steal: bool = True
+
+    def __post_init__(self) -> None:
+        if self.push_interval is not None and self.push_interval <= 0:
+            raise ValueError("push_interval must be positive")
+        if self.imbalance < 1:
+            raise ValueError("imbalance must be >= 1")
+
+
+@dataclass(slots=True)
+class CPU:
+    """One core: its own algorithm instance, run queue, blocked queue and timeline."""
+
+    index: int
+    algorithm: SchedulingAlgorithm
+    ready_queue: ReadyQueue
+    blocked_queue: BlockedQueue = field(default_factory=BlockedQueue)
+    timeline: Timeline = field(default_factory=Timeline)
+    running: PCB | None = None
+    metrics: CPUMetrics = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.metrics = CPUMetrics(cpu=self.index)
+
+    @property
+    def load(self) -> int:
+        return len(self.ready_queue) + (self.running is not None)
+
+
+class MultiCoreSimulator(SchedulerSimulator):
+    """
+    `cpus` cores sharing one clock. Each core runs its own copy of
+    `config.algorithm` over its own run queue, so every algorithm works
+    unchanged. Arrivals go to the least loaded core; a process that blocks
+    for I/O wakes up on the core it ran on. Moving work between cores is
+    the `LoadBalancer`'s job.
+
+    `timelines[i]` is core i's Gantt (`timeline` is core 0's) and
+    `SimulationMetrics.per_cpu` holds per-core utilization, context
+    switches and migrations. With one core and no balancing it reproduces
+    SchedulerSimulator exactly. `wall_clock_budget` and `cancel_event` work
+    as in SchedulerSimulator; `iter_run` and `SimulationConfig.profiler`
+    are not supported.
+    """
+
+    def __init__(
+        self, config: SimulationConfig, *, cpus: int = 2, balancer: LoadBalancer | None = None
+    ) -> None:
+        if cpus < 1:
+            raise ValueError("cpus must be >= 1")
+        if config.profiler is not None:
+            raise NotImplementedError("profiling only supports single-CPU simulations")
+        self.cpu_count = cpus
+        self.balancer = balancer if balancer is not None else LoadBalancer()
+        super().__init__(config)
+        self._build_cpus()
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._build_cpus()
+
+    def _build_cpus(self) -> None:
+        self.cpus: List[CPU] = []
+        for index in range(self.cpu_count):
+            algorithm = copy.deepcopy(self.config.algorithm)
+            factory = getattr(algorithm, "create_ready_queue", None)
+            self.cpus.append(
+                CPU(
+                    index=index,
+                    algorithm=algorithm,
+                    ready_queue=factory() if factory is not None else ReadyQueue(),
+                    timeline=NullTimeline() if self.config.summary_only else Timeline(),
+                )
+            )
+        self.timelines = [cpu.timeline for cpu in self.cpus]
+        self.timeline = self.timelines[0]
+        self._next_push: int | None = self.balancer.push_interval
+
+    def iter_run(self, *, batch_size: int = 256) -> Iterator[SimulationStep]:
+        raise NotImplementedError("iter_run only supports single-CPU simulations")
+
+    # ---------- main loop ----------
+
+    def _advance(
+        self,
+        progress: Callable[[int, int | None], None] | None = None,
+        *,
+        deadline: float | None = None,
+        max_iterations: int | None = None,
+    ) -> bool:
+        if self.config.engine not in ENGINES:
+            raise ValueError(f"Unknown simulation engine: {self.config.engine!r}")
+        state = self._state
+        if state is None:
+            state = self._start()
+        event_driven = self.config.engine == "event"
+        retain_completed = self.config.retain_completed and not self.config.summary_only
+        pending = state.pending
+        metrics = state.metrics
+        cpus = self.cpus
+        cancel = self.config.cancel_event
+        timed = deadline is not None or cancel is not None
+        limited = timed or max_iterations is not None
+        until_check = _BUDGET_CHECK_EVERY
+        finished = False
+
+        while True:
+            if limited:
+                if max_iterations is not None:
+                    if max_iterations == 0:
+                        break
+                    max_iterations -= 1
+                if timed:
+                    until_check -= 1
+                    if until_check == 0:
+                        until_check = _BUDGET_CHECK_EVERY
+                        if cancel is not None and cancel.is_set():
+                            break
+                        if deadline is not None and time.perf_counter() >= deadline:
+                            break
+
+            if self.config.max_time is not None and self.clock >= self.config.max_time:
+                finished = True
+                break
+
+            # Arrivals go to the least loaded core.
+            while pending and pending.head.arrival_time <= self.clock:
+                job = pending.pop()
+                job.set_state(ProcessState.READY)
+                min(cpus, key=_load).ready_queue.enqueue(job)
+
+            # I/O completions return to the core the process blocked on.
+            for cpu in cpus:
+                if len(cpu.blocked_queue) > 0:
+                    woken = cpu.blocked_queue.pop_due(self.clock)
+                    if woken:
+                        for pcb in woken:
+                            pcb.set_state(ProcessState.READY)
+                        cpu.ready_queue.extend(woken)
+
+            if all(cpu.running is None and len(cpu.ready_queue) == 0 for cpu in cpus):
+                if any(len(cpu.blocked_queue) > 0 for cpu in cpus):
+                    idle = self._ticks_to_next_event(pending) if event_driven else 1
+                elif pending:
+                    idle = max(self.clock + 1, pending.head.arrival_time) - self.clock
+                else:
+                    finished = True
+                    break
+                for cpu in cpus:
+                    cpu.timeline.record(self.clock, None, idle)
+                self.clock += idle
+                continue
+
+            if self._next_push is not None and self.clock >= self._next_push:
+                self._push_migrate()
+                interval = self.balancer.push_interval
+                self._next_push = (self.clock // interval + 1) * interval
+            if self.balancer.steal:
+                for cpu in cpus:
+                    if cpu.running is None and len(cpu.ready_queue) == 0:
+                        self._steal(cpu)
+
+            span = 1
+            if event_driven:
+                span = self._ticks_to_next_event(pending, balancing=True)
+            for cpu in cpus:
+                running = cpu.running
+                if running is None and len(cpu.ready_queue) == 0:
+                    continue
+                decision = cpu.algorithm.next_tick(
+                    current_time=self.clock, running=running, ready_queue=cpu.ready_queue
+                )
+                if decision.preempt_current and running is not None and running is not decision.next_process:
+                    running.set_state(ProcessState.READY)
+                    cpu.ready_queue.enqueue(running)
+                    running = None
+                if decision.next_process is not None and decision.next_process is not running:
+                    previous_pid = running.pid if running else None
+                    running = decision.next_process
+                    if running.start_time is None:
+                        running.start_time = self.clock
+                        running.response_time = self.clock - running.arrival_time
+                    if running.pid != previous_pid:
+                        cpu.metrics.context_switches += 1
+                cpu.running = running
+                if event_driven and running is not None:
+                    span = min(span, self._run_span(running, decision.timeslice))
+            if event_driven and self.balancer.steal and span > 1 and self._can_steal():
+                # A preemption just queued work that an idle core will steal next tick.
+                span = 1
+
+            for cpu in cpus:
+                running = cpu.running
+                if running is None:
+                    cpu.timeline.record(self.clock, None, span)
+                    continue
+                cpu.timeline.record(self.clock, running.pid, span)
+                running.set_state(ProcessState.RUNNING)
+                running.consume(span)
+                cpu.metrics.busy_time += span
+                blocked_now, duration = running.io_request_due()
+                if blocked_now:
+                    running.set_state(ProcessState.BLOCKED)
+                    cpu.blocked_queue.block(running, self.clock + span - 1 + duration)
+                    cpu.running = None
+
+            self.clock += span
+
+            for cpu in cpus:
+                running = cpu.running
+                if running is not None and running.remaining_time == 0:
+                    running.finish_time = self.clock
+                    running.turnaround_time = running.finish_time - running.arrival_time
+                    running.waiting_time = running.turnaround_time - running.burst_time
+                    running.set_state(ProcessState.TERMINATED)
+                    metrics.record_pcb(running)
+                    if retain_completed:
+                        self.completed.append(running)
+                    cpu.running = None
+                    if progress is not None:
+                        progress(metrics.completed, self.total_jobs)
+
+        return finished
+
+    def _start(self) -> _RunState:
+        pending = _PendingArrivals(
+            self._source, self._prepare_io if self._prepare_on_arrival else None
+        )
+        for cpu in self.cpus:
+            algorithm = cpu.algorithm
+            if self.config.time_slice is not None and hasattr(algorithm, "quantum"):
+                try:
+                    algorithm.quantum = self.config.time_slice
+                except Exception:
+                    pass
+            algorithm.reset()
+
+        # Time-0 jobs are dealt round-robin and loaded through each core's priming hook.
+        initial_jobs: list[list[PCB]] = [[] for _ in self.cpus]
+        dealt = 0
+        while pending and pending.head.arrival_time <= self.clock:
+            job = pending.pop()
+            job.set_state(ProcessState.READY)
+            initial_jobs[dealt % len(self.cpus)].append(job)
+            dealt += 1
+        for cpu, jobs in zip(self.cpus, initial_jobs):
+            if jobs:
+                cpu.algorithm.prime(cpu.ready_queue, jobs)
+
+        self._state = _RunState(
+            pending=pending,
+            metrics=SimulationMetrics(per_process=not self.config.summary_only),
+        )
+        return self._state
+
+    def _finish(self) -> SimulationMetrics:
+        state = self._state
+        self._state = None
+        metrics = state.metrics
+        for cpu in self.cpus:
+            if len(cpu.blocked_queue) > 0:
+                cpu.blocked_queue.sync(self.clock - 1)
+            if self.clock > 0:
+                cpu.metrics.utilization = cpu.metrics.busy_time / self.clock
+        metrics.per_cpu = [copy.copy(cpu.metrics) for cpu in self.cpus]
+        busy_time = sum(cpu.metrics.busy_time for cpu in self.cpus)
+        if self.clock > 0:
+            metrics.throughput = metrics.completed / self.clock
+            metrics.cpu_utilization = busy_time / (self.clock * len(self.cpus))
+        metrics.context_switches = sum(cpu.metrics.context_switches for cpu in self.cpus)
+        metrics.migrations = sum(cpu.metrics.migrations_in for cpu in self.cpus)
+        return metrics
+
+    # ---------- load balancing ----------
+
+    def _push_migrate(self) -> None:
+        """Move queued processes from the busiest core to the idlest until balanced."""
+        cpus = self.cpus
+        while True:
+            busiest = max(cpus, key=_load)
+            idlest = min(cpus, key=_load)
+            if busiest.load - idlest.load <= self.balancer.imbalance or len(busiest.ready_queue) == 0:
+                return
+            self._migrate(busiest, idlest)
+
+    def _steal(self, thief: CPU) -> None:
+        victim = max(self.cpus, key=lambda cpu: len(cpu.ready_queue))
+        if len(victim.ready_queue) == 0:
+            return
+        self._migrate(victim, thief)
+        thief.metrics.steals += 1
+
+    def _can_steal(self) -> bool:
+        idle = any(cpu.running is None and len(cpu.ready_queue) == 0 for cpu in self.cpus)
+        return idle and any(len(cpu.ready_queue) for cpu in self.cpus)
+
+    @staticmethod
+    def _migrate(source: CPU, target: CPU) -> None:
+        pcb = source.ready_queue.dequeue()
+        # Queues that keep per-process state (MLFQ levels, CFS vruntime) drop it.
+        forget = getattr(source.ready_queue, "forget", None)
+        if forget is not None:
+            forget(pcb)
+        target.ready_queue.enqueue(pcb)
+        source.metrics.migrations_out += 1
+        target.metrics.migrations_in += 1
+
+    # ---------- helpers ----------
+
+    def _ticks_to_next_event(self, pending: _PendingArrivals, balancing: bool = False) -> int:
+        """
+        Ticks until the next arrival, I/O completion on any core or
+        `max_time`; with `balancing`, also until the next push migration.
+        """
+        horizon: int | None = None
+        if pending:
+            horizon = pending.head.arrival_time - self.clock
+        for cpu in self.cpus:
+            next_wake = cpu.blocked_queue.next_wake_time()
+            if next_wake is not None and (horizon is None or next_wake - self.clock < horizon):
+                horizon = next_wake - self.clock
+        if balancing and self._next_push is not None:
+            until_push = self._next_push - self.clock
+            if horizon is None or until_push < horizon:
+                horizon = until_push
+        if self.config.max_time is not None:
+            until_limit = self.config.max_time - self.clock
+            if horizon is None or until_limit < horizon:
+                horizon = until_limit
+        if horizon is None:
+            return _UNBOUNDED
+        return max(1, horizon)
+
+
+def _load(cpu: CPU) -> int:
+    return cpu.load
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from typing import Any
 
+from .io_schedule import IOScheduleTable, generate_io_schedules
 from .states import ProcessState
 
 
@@ -27,9 +29,11 @@ class PCB:
     turnaround_time: int | None = field(default=None, init=False)
     executed_time: int = field(default=0, init=False)
 
-    # I/O
-    io_schedule: list[tuple[int, int]] = field(default_factory=list, init=False, repr=False)
+    # I/O: events live in a shared IOScheduleTable, [_io_start, _io_end) is this PCB's row.
+    io_table: IOScheduleTable | None = field(default=None, init=False, repr=False)
     io_remaining_time: int | None = field(default=None, init=False)
+    _io_start: int = field(default=0, init=False, repr=False)
+    _io_end: int = field(default=0, init=False, repr=False)
     _next_io_index: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -51,6 +55,25 @@ class PCB:
 
     # ---------- I/O helpers ----------
 
+    @property
+    def io_schedule(self) -> list[tuple[int, int]]:
+        """This PCB's I/O events as (cpu_time_at_request, io_duration) tuples."""
+        if self.io_table is None:
+            return []
+        triggers = self.io_table.triggers[self._io_start:self._io_end]
+        durations = self.io_table.durations[self._io_start:self._io_end]
+        return list(zip(triggers, durations))
+
+    @io_schedule.setter
+    def io_schedule(self, events: list[tuple[int, int]]) -> None:
+        self.attach_io_schedule(IOScheduleTable.from_events(events), 0)
+
+    def attach_io_schedule(self, table: IOScheduleTable, row: int) -> None:
+        """Point this PCB at `row` of a (usually shared) schedule table."""
+        self.io_table = table
+        self._io_start, self._io_end = table.row_bounds(row)
+        self._next_io_index = self._io_start
+
     def prepare_io_schedule(
         self,
         *,
@@ -60,48 +83,50 @@ class PCB:
         duration_stddev: float,
         max_events: int | None = None,
         enabled: bool = True,
+        rng: random.Random | None = None,
     ) -> None:
         """
         Attach an I/O schedule generated from normal distributions.
 
         Each event is a tuple (cpu_time_at_request, io_duration). Events are
         bounded to the total burst time to avoid overshooting completion.
+        Pass `rng` for reproducible schedules; the global `random` module is
+        used otherwise. Use `generate_io_schedules` to build many at once.
         """
-        if not enabled or interval_mean <= 0 or duration_mean <= 0:
-            self.io_schedule = []
-            return
-
-        import random
-
-        events: list[tuple[int, int]] = []
-        cpu_cursor = 0
-        while True:
-            if max_events is not None and len(events) >= max_events:
-                break
-            gap = max(1, round(random.normalvariate(interval_mean, interval_stddev)))
-            cpu_cursor += gap
-            if cpu_cursor >= self.burst_time:
-                break
-            duration = max(1, round(random.normalvariate(duration_mean, duration_stddev)))
-            events.append((cpu_cursor, duration))
-        self.io_schedule = events
-        self._next_io_index = 0
+        table = generate_io_schedules(
+            [self.burst_time],
+            interval_mean=interval_mean,
+            interval_stddev=interval_stddev,
+            duration_mean=duration_mean,
+            duration_stddev=duration_stddev,
+            max_events=max_events,
+            enabled=[enabled],
+            rng=rng,
+        )
+        self.attach_io_schedule(table, 0)
 
     def io_request_due(self) -> tuple[bool, int | None]:
         """Return whether an I/O should start after the last CPU consumption."""
-        if self._next_io_index >= len(self.io_schedule):
+        if self._next_io_index >= self._io_end:
             return (False, None)
-        trigger_at, duration = self.io_schedule[self._next_io_index]
+        trigger_at = self.io_table.triggers[self._next_io_index]
         if self.executed_time >= trigger_at and self.remaining_time > 0:
+            duration = self.io_table.durations[self._next_io_index]
             self._next_io_index += 1
             self.io_remaining_time = duration
             return (True, duration)
         return (False, None)
 
-    def tick_io(self) -> None:
-        """Advance I/O timer for a blocked process."""
+    def cpu_until_next_io(self) -> int | None:
+        """CPU ticks left before the next scheduled I/O request, or None."""
+        if self._next_io_index >= self._io_end:
+            return None
+        return max(1, self.io_table.triggers[self._next_io_index] - self.executed_time)
+
+    def tick_io(self, ticks: int = 1) -> None:
+        """Advance I/O timer for a blocked process by one or more ticks."""
         if self.io_remaining_time is None:
             return
-        self.io_remaining_time = max(0, self.io_remaining_time - 1)
+        self.io_remaining_time = max(0, self.io_remaining_time - ticks)
         if self.io_remaining_time == 0:
             self.io_remaining_time = None
@@ -0,0 +1,405 @@
+"""Struct-of-arrays process table with lightweight PCB views."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Sequence
+
+from .io_schedule import IOScheduleTable
+from .pcb import PCB
+from .states import ProcessState
+
+# Sentinels for optional integer columns.
+_NONE = -(1 << 63)
+_STATES: tuple[ProcessState, ...] = tuple(ProcessState)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+
+
+def _opt(value: int) -> int | None:
+    return None if value == _NONE else value
+
+
+class ProcessTable:
+    """
+    Workload stored column-wise: one typed array per PCB field.
+
+    A million processes cost ~100 bytes each instead of a dataclass, a
+    metadata dict and an I/O list per PCB. `usuario` strings are interned in
+    `usuarios` and referenced by index. Algorithms that need objects get
+    `PCBView`s, created once per process by the simulator when it arrives.
+
+    The static columns (pid, arrival, burst, priority, usuario, io_enabled)
+    are only read during a run, so `from_arrays` can wrap read-only buffers
+    such as the memory-mapped columns of a workload file.
+    `sorted_by_arrival` lets `arrival_order` skip the sort.
+    """
+
+    __slots__ = (
+        "pid", "arrival", "burst", "remaining", "executed", "start", "finish",
+        "state", "priority", "usuario", "io_enabled", "io_remaining",
+        "io_next", "io_row", "io_table", "usuarios", "_usuario_codes",
+        "sorted_by_arrival",
+    )
+
+    def __init__(self) -> None:
+        self.pid = array("q")
+        self.arrival = array("q")
+        self.burst = array("q")
+        self.remaining = array("q")
+        self.executed = array("q")
+        self.start = array("q")
+        self.finish = array("q")
+        self.state = array("b")
+        self.priority = array("q")
+        self.usuario = array("i")
+        self.io_enabled = array("b")
+        self.io_remaining = array("q")
+        # Absolute index of the next I/O event and row in `io_table`.
+        self.io_next = array("q")
+        self.io_row = array("q")
+        self.io_table: IOScheduleTable | None = None
+        self.usuarios: list[str] = []
+        self._usuario_codes: dict[str, int] = {}
+        self.sorted_by_arrival = False
+
+    # ---------- construction ----------
+
+    def append(
+        self,
+        pid: int,
+        arrival_time: int,
+        burst_time: int,
+        *,
+        priority: int | None = None,
+        usuario: str = "root",
+        io_enabled: bool = True,
+    ) -> int:
+        """Add a process in the NEW state; returns its row index."""
+        self.sorted_by_arrival = False
+        self.pid.append(pid)
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.remaining.append(burst_time)
+        self.executed.append(0)
+        self.start.append(_NONE)
+        self.finish.append(_NONE)
+        self.state.append(_STATE_CODES[ProcessState.NEW])
+        self.priority.append(_NONE if priority is None else priority)
+        self.usuario.append(self.intern_usuario(usuario))
+        self.io_enabled.append(1 if io_enabled else 0)
+        self.io_remaining.append(_NONE)
+        self.io_next.append(0)
+        self.io_row.append(-1)
+        return len(self.pid) - 1
+
+    def intern_usuario(self, usuario: str) -> int:
+        """Return the code for `usuario`, registering it on first use."""
+        code = self._usuario_codes.get(usuario)
+        if code is None:
+            code = len(self.usuarios)
+            self.usuarios.append(usuario)
+            self._usuario_codes[usuario] = code
+        return code
+
+    @classmethod
+    def from_pcbs(cls, pcbs: Iterable[PCB]) -> "ProcessTable":
+        """Columnar copy of fresh PCBs (runtime state is not copied)."""
+        table = cls()
+        for pcb in pcbs:
+            table.append(
+                pcb.pid,
+                pcb.arrival_time,
+                pcb.burst_time,
+                priority=pcb.priority,
+                usuario=pcb.metadata.get("usuario", "root"),
+                io_enabled=pcb.metadata.get("io_enabled", True),
+            )
+        return table
+
+    @classmethod
+    def from_columns(
+        cls,
+        pids: Sequence[int],
+        arrivals: Sequence[int],
+        bursts: Sequence[int],
+        *,
+        priorities: Sequence[int | None] | None = None,
+        usuarios: Sequence[str] | None = None,
+    ) -> "ProcessTable":
+        """Build a table from parallel sequences."""
+        table = cls()
+        for i, pid in enumerate(pids):
+            table.append(
+                pid,
+                arrivals[i],
+                bursts[i],
+                priority=None if priorities is None else priorities[i],
+                usuario="root" if usuarios is None else usuarios[i],
+            )
+        return table
+
+    @classmethod
+    def from_arrays(
+        cls,
+        pid: Sequence[int],
+        arrival: Sequence[int],
+        burst: Sequence[int],
+        *,
+        priority: Sequence[int] | None = None,
+        usuario: Sequence[int] | None = None,
+        io_enabled: Sequence[int] | None = None,
+        usuarios: Sequence[str] = ("root",),
+        sorted_by_arrival: bool = False,
+    ) -> "ProcessTable":
+        """
+        Table over existing static columns, which are used as given (not
+        copied): arrays or memoryviews of 64-bit `pid`/`arrival`/`burst`/
+        `priority` (missing priorities hold the None sentinel), 32-bit `usuario`
+        codes indexing `usuarios` and 0/1 `io_enabled` bytes. Runtime
+        columns are allocated in bulk. Do not `append` to the result.
+        """
+        n = len(pid)
+        if len(arrival) != n or len(burst) != n:
+            raise ValueError("pid, arrival and burst must have the same length")
+        table = cls()
+        table.pid = pid
+        table.arrival = arrival
+        table.burst = burst
+        table.priority = array("q", [_NONE]) * n if priority is None else priority
+        table.usuario = array("i", [0]) * n if usuario is None else usuario
+        table.io_enabled = array("b", [1]) * n if io_enabled is None else io_enabled
+        for name in usuarios:
+            table.intern_usuario(name)
+        table.remaining = array("q")
+        table.remaining.frombytes(memoryview(burst).cast("B"))
+        table.executed = array("q", [0]) * n
+        table.start = array("q", [_NONE]) * n
+        table.finish = array("q", [_NONE]) * n
+        table.state = array("b", [_STATE_CODES[ProcessState.NEW]]) * n
+        table.io_remaining = array("q", [_NONE]) * n
+        table.io_next = array("q", [0]) * n
+        table.io_row = array("q", [-1]) * n
+        table.sorted_by_arrival = sorted_by_arrival
+        return table
+
+    def to_pcbs(self) -> list[PCB]:
+        """Fresh PCBs (NEW state) with this table's static columns, in row order."""
+        usuarios = self.usuarios
+        return [
+            PCB(
+                pid,
+                arrival,
+                burst,
+                _opt(priority),
+                {"usuario": usuarios[code], "io_enabled": bool(io_enabled)},
+            )
+            for pid, arrival, burst, priority, code, io_enabled in zip(
+                self.pid, self.arrival, self.burst, self.priority, self.usuario, self.io_enabled
+            )
+        ]
+
+    def fresh(self) -> "ProcessTable":
+        """New table in the NEW state sharing this table's static columns."""
+        return ProcessTable.from_arrays(
+            self.pid,
+            self.arrival,
+            self.burst,
+            priority=self.priority,
+            usuario=self.usuario,
+            io_enabled=self.io_enabled,
+            usuarios=self.usuarios,
+            sorted_by_arrival=self.sorted_by_arrival,
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {name: getattr(self, name) for name in self.__slots__}
+        for name, value in state.items():
+            if isinstance(value, memoryview):
+                # Mapped columns are pickled as plain arrays.
+                column = array(value.format)
+                column.frombytes(value.cast("B"))
+                state[name] = column
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    # ---------- access ----------
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def view(self, index: int) -> "PCBView":
+        """New view over row `index`; keep it, views are compared by identity."""
+        return PCBView(self, index)
+
+    def arrival_order(self) -> list[int]:
+        """Row indices sorted (stably) by arrival time."""
+        if self.sorted_by_arrival:
+            return list(range(len(self)))
+        return sorted(range(len(self)), key=self.arrival.__getitem__)
+
+    def finished_rows(self) -> Iterator[int]:
+        """Rows that reached TERMINATED."""
+        terminated = _STATE_CODES[ProcessState.TERMINATED]
+        return (i for i, code in enumerate(self.state) if code == terminated)
+
+
+class PCBView:
+    """
+    PCB-compatible window over one row of a ProcessTable.
+
+    Exposes the attributes and methods the simulator and algorithms use.
+    `response_time`, `waiting_time` and `turnaround_time` are derived from
+    the start/finish columns, so assigning them is accepted and ignored.
+    `metadata` is rebuilt on each access and is read-only in practice.
+    """
+
+    __slots__ = ("_table", "index")
+
+    def __init__(self, table: ProcessTable, index: int) -> None:
+        self._table = table
+        self.index = index
+
+    # ---- static fields ----
+
+    @property
+    def pid(self) -> int:
+        return self._table.pid[self.index]
+
+    @property
+    def arrival_time(self) -> int:
+        return self._table.arrival[self.index]
+
+    @property
+    def burst_time(self) -> int:
+        return self._table.burst[self.index]
+
+    @property
+    def priority(self) -> int | None:
+        return _opt(self._table.priority[self.index])
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        table = self._table
+        return {
+            "usuario": table.usuarios[table.usuario[self.index]],
+            "io_enabled": bool(table.io_enabled[self.index]),
+        }
+
+    # ---- runtime fields ----
+
+    @property
+    def remaining_time(self) -> int:
+        return self._table.remaining[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value: int) -> None:
+        self._table.remaining[self.index] = value
+
+    @property
+    def executed_time(self) -> int:
+        return self._table.executed[self.index]
+
+    @property
+    def state(self) -> ProcessState:
+        return _STATES[self._table.state[self.index]]
+
+    @property
+    def start_time(self) -> int | None:
+        return _opt(self._table.start[self.index])
+
+    @start_time.setter
+    def start_time(self, value: int | None) -> None:
+        self._table.start[self.index] = _NONE if value is None else value
+
+    @property
+    def finish_time(self) -> int | None:
+        return _opt(self._table.finish[self.index])
+
+    @finish_time.setter
+    def finish_time(self, value: int | None) -> None:
+        self._table.finish[self.index] = _NONE if value is None else value
+
+    @property
+    def response_time(self) -> int | None:
+        start = self.start_time
+        return None if start is None else start - self.arrival_time
+
+    @response_time.setter
+    def response_time(self, value: int | None) -> None:
+        """Derived from start_time."""
+
+    @property
+    def turnaround_time(self) -> int | None:
+        finish = self.finish_time
+        return None if finish is None else finish - self.arrival_time
+
+    @turnaround_time.setter
+    def turnaround_time(self, value: int | None) -> None:
+        """Derived from finish_time."""
+
+    @property
+    def waiting_time(self) -> int | None:
+        turnaround = self.turnaround_time
+        return None if turnaround is None else turnaround - self.burst_time
+
+    @waiting_time.setter
+    def waiting_time(self, value: int | None) -> None:
+        """Derived from finish_time."""
+
+    @property
+    def io_remaining_time(self) -> int | None:
+        return _opt(self._table.io_remaining[self.index])
+
+    @io_remaining_time.setter
+    def io_remaining_time(self, value: int | None) -> None:
+        self._table.io_remaining[self.index] = _NONE if value is None else value
+
+    # ---- PCB behaviour ----
+
+    def set_state(self, state: ProcessState) -> None:
+        self._table.state[self.index] = _STATE_CODES[state]
+
+    def consume(self, time_slice: int) -> None:
+        table, i = self._table, self.index
+        table.remaining[i] = max(0, table.remaining[i] - time_slice)
+        table.executed[i] += time_slice
+
+    def _io_end(self) -> int:
+        table = self._table
+        row = table.io_row[self.index]
+        if row < 0 or table.io_table is None:
+            return -1
+        return table.io_table.offsets[row + 1]
+
+    def io_request_due(self) -> tuple[bool, int | None]:
+        table, i = self._table, self.index
+        position = table.io_next[i]
+        if position >= self._io_end():
+            return (False, None)
+        io = table.io_table
+        if table.executed[i] >= io.triggers[position] and table.remaining[i] > 0:
+            duration = io.durations[position]
+            table.io_next[i] = position + 1
+            table.io_remaining[i] = duration
+            return (True, duration)
+        return (False, None)
+
+    def cpu_until_next_io(self) -> int | None:
+        table, i = self._table, self.index
+        position = table.io_next[i]
+        if position >= self._io_end():
+            return None
+        return max(1, table.io_table.triggers[position] - table.executed[i])
+
+    def tick_io(self, ticks: int = 1) -> None:
+        remaining = self.io_remaining_time
+        if remaining is None:
+            return
+        remaining = max(0, remaining - ticks)
+        self.io_remaining_time = remaining or None
+
+    def __repr__(self) -> str:
+        return f"PCBView(pid={self.pid}, index={self.index}, state={self.state.value})"
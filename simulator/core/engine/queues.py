@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import deque
-from typing import Deque, Iterable, Iterator
+from typing import Any, Callable, Deque, Iterable, Iterator
 
 from .pcb import PCB
 
@@ -49,8 +50,345 @@ class ReadyQueue(ProcessQueue):
         super().__init__(name="ready")
 
 
-class BlockedQueue(ProcessQueue):
-    """Queue for processes waiting on I/O or similar events."""
+class PriorityReadyQueue(ReadyQueue):
+    """
+    Ready queue ordered by `key` (smallest first), backed by a binary heap.
+
+    push, pop and update (decrease-key) are O(log n); arbitrary removal is
+    O(1) through lazy deletion. Ties are served in enqueue order, matching
+    the FIFO behaviour of `ReadyQueue`. Keys are computed when a PCB is
+    enqueued or updated, so callers must call `update` if a queued PCB's key
+    changes.
+    """
+
+    def __init__(self, *, key: Callable[[PCB], Any]) -> None:
+        super().__init__()
+        self._key = key
+        # Heap entries are [key, seq, pcb]; removed entries keep pcb=None.
+        self._heap: list[list[Any]] = []
+        self._entries: dict[int, list[Any]] = {}
+        self._seq = 0
+
+    def enqueue(self, pcb: PCB) -> None:
+        """Add a PCB to the queue (re-keys it if it is already queued)."""
+        if id(pcb) in self._entries:
+            self.update(pcb)
+            return
+        self._push(pcb, self._seq)
+        self._seq += 1
+
+    def dequeue(self) -> PCB | None:
+        """Remove and return the PCB with the smallest key, or None when empty."""
+        self._discard_removed()
+        if not self._heap:
+            return None
+        _key, _seq, pcb = heapq.heappop(self._heap)
+        del self._entries[id(pcb)]
+        return pcb
+
+    def peek(self) -> PCB | None:
+        """Return the PCB with the smallest key without dequeuing it."""
+        self._discard_removed()
+        if not self._heap:
+            return None
+        return self._heap[0][2]
+
+    def update(self, pcb: PCB) -> None:
+        """Recompute the key of a queued PCB (decrease- or increase-key)."""
+        entry = self._entries.get(id(pcb))
+        if entry is None:
+            raise KeyError(f"PCB {pcb.pid} is not in the {self.name} queue")
+        self._invalidate(entry)
+        self._push(pcb, entry[1])
+
+    def remove(self, pcb: PCB) -> bool:
+        """Remove an arbitrary PCB; returns False if it was not queued."""
+        entry = self._entries.get(id(pcb))
+        if entry is None:
+            return False
+        self._invalidate(entry)
+        return True
+
+    def __contains__(self, pcb: object) -> bool:
+        return id(pcb) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate queued PCBs in heap (not sorted) order."""
+        return (entry[2] for entry in self._heap if entry[2] is not None)
+
+    def extend(self, items: Iterable[PCB]) -> None:
+        """Bulk enqueue preserving the iteration order for ties."""
+        for pcb in items:
+            self.enqueue(pcb)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # `_entries` is keyed by id(), which does not survive pickling.
+        state = self.__dict__.copy()
+        del state["_entries"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._entries = {id(entry[2]): entry for entry in self._heap if entry[2] is not None}
+
+    def _push(self, pcb: PCB, seq: int) -> None:
+        entry = [self._key(pcb), seq, pcb]
+        self._entries[id(pcb)] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _invalidate(self, entry: list[Any]) -> None:
+        del self._entries[id(entry[2])]
+        entry[2] = None
+        # Rebuild once stale entries dominate so memory stays O(len).
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [item for item in self._heap if item[2] is not None]
+            heapq.heapify(self._heap)
+
+    def _discard_removed(self) -> None:
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+
+
+class FairReadyQueue(PriorityReadyQueue):
+    """
+    CFS run queue: a `PriorityReadyQueue` keyed by virtual runtime.
+
+    A PCB's vruntime grows by `rate(pcb)` per tick of CPU it has executed,
+    where the rate is inversely proportional to `weight(pcb)`. It is stored
+    as an offset over `executed_time * rate`, so it is exact no matter how
+    the simulator batches ticks. On enqueue a PCB is placed at no less than
+    `min_vruntime`, the smallest vruntime among queued processes and
+    `current`, so arrivals and wakers cannot monopolize the CPU.
+    """
+
+    # rate = RATE_SCALE // weight: 65536 vruntime units per tick at weight 1024.
+    RATE_SCALE = 1024 << 16
+
+    def __init__(self, *, weight: Callable[[PCB], int]) -> None:
+        super().__init__(key=self.vruntime)
+        self._weight = weight
+        # [pcb, offset, weight, rate] keyed by id(pcb); the PCB is kept so
+        # the map can be rebuilt after unpickling.
+        self._info: dict[int, list[Any]] = {}
+        self.min_vruntime = 0
+        # Sum of the weights of queued processes.
+        self.load = 0
+        # Process on the CPU, set by the algorithm on dispatch.
+        self.current: PCB | None = None
+
+    def _lookup(self, pcb: PCB) -> list[Any]:
+        info = self._info.get(id(pcb))
+        if info is None:
+            weight = self._weight(pcb)
+            info = self._info[id(pcb)] = [pcb, 0, weight, self.RATE_SCALE // weight]
+        return info
+
+    def weight(self, pcb: PCB) -> int:
+        return self._lookup(pcb)[2]
+
+    def rate(self, pcb: PCB) -> int:
+        """vruntime charged per tick of CPU."""
+        return self._lookup(pcb)[3]
+
+    def vruntime(self, pcb: PCB) -> int:
+        info = self._lookup(pcb)
+        return info[1] + pcb.executed_time * info[3]
+
+    def forget(self, pcb: PCB) -> None:
+        """Drop the bookkeeping of a PCB that will not be enqueued again."""
+        self._info.pop(id(pcb), None)
+        if self.current is pcb:
+            self.current = None
+
+    def enqueue(self, pcb: PCB) -> None:
+        if id(pcb) in self._entries:
+            self.update(pcb)
+            return
+        self._update_min_vruntime()
+        info = self._lookup(pcb)
+        lag = self.min_vruntime - info[1] - pcb.executed_time * info[3]
+        if lag > 0:
+            info[1] += lag
+        self.load += info[2]
+        super().enqueue(pcb)
+
+    def dequeue(self) -> PCB | None:
+        pcb = super().dequeue()
+        if pcb is not None:
+            self.load -= self._info[id(pcb)][2]
+        return pcb
+
+    def remove(self, pcb: PCB) -> bool:
+        removed = super().remove(pcb)
+        if removed:
+            self.load -= self._info[id(pcb)][2]
+        return removed
+
+    def _update_min_vruntime(self) -> None:
+        head = self.peek()
+        if head is None:
+            if self.current is None:
+                return
+            candidate = self.vruntime(self.current)
+        else:
+            candidate = self._heap[0][0]
+            if self.current is not None:
+                candidate = min(candidate, self.vruntime(self.current))
+        if candidate > self.min_vruntime:
+            self.min_vruntime = candidate
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state["_info"] = list(self._info.values())
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._info = {id(info[0]): info for info in state["_info"]}
+
+
+class MultiLevelReadyQueue(ReadyQueue):
+    """
+    Ready queue split into priority levels (0 = highest), one FIFO
+    `ProcessQueue` per level plus an occupancy bitmap.
+
+    Enqueue and dequeue are O(1) regardless of how many processes are
+    queued: the highest non-empty level is the lowest set bit of the bitmap.
+    Each PCB is enqueued at the level recorded with `set_level` (0 until
+    set); levels are remembered while the PCB is running or blocked.
+    """
+
+    def __init__(self, levels: int) -> None:
+        if levels < 1:
+            raise ValueError("levels must be >= 1")
+        super().__init__()
+        self.levels = [ProcessQueue(name=f"ready[{level}]") for level in range(levels)]
+        self._bitmap = 0
+        self._count = 0
+        # Non-zero levels keyed by id(pcb); the PCB is kept so the map can
+        # be rebuilt after unpickling.
+        self._level: dict[int, tuple[PCB, int]] = {}
+
+    def level_of(self, pcb: PCB) -> int:
+        entry = self._level.get(id(pcb))
+        return entry[1] if entry else 0
+
+    def set_level(self, pcb: PCB, level: int) -> None:
+        """Record the level `pcb` is enqueued at from now on (it must not be queued)."""
+        if not 0 <= level < len(self.levels):
+            raise ValueError(f"level {level} out of range")
+        if level:
+            self._level[id(pcb)] = (pcb, level)
+        else:
+            self._level.pop(id(pcb), None)
+
+    def forget(self, pcb: PCB) -> None:
+        """Drop the level of a PCB that will not be enqueued again."""
+        self._level.pop(id(pcb), None)
+
+    def highest_level(self) -> int | None:
+        """Highest-priority non-empty level, or None when empty."""
+        bitmap = self._bitmap
+        return (bitmap & -bitmap).bit_length() - 1 if bitmap else None
+
+    def enqueue(self, pcb: PCB) -> None:
+        level = self.level_of(pcb)
+        self.levels[level].enqueue(pcb)
+        self._bitmap |= 1 << level
+        self._count += 1
+
+    def dequeue(self) -> PCB | None:
+        bitmap = self._bitmap
+        if not bitmap:
+            return None
+        level = (bitmap & -bitmap).bit_length() - 1
+        queue = self.levels[level]
+        pcb = queue.dequeue()
+        if not len(queue):
+            self._bitmap = bitmap & ~(1 << level)
+        self._count -= 1
+        return pcb
+
+    def peek(self) -> PCB | None:
+        level = self.highest_level()
+        return None if level is None else self.levels[level].peek()
+
+    def boost(self) -> None:
+        """Move every process, queued or not, back to level 0 (queued ones keep their order)."""
+        top = self.levels[0]
+        for queue in self.levels[1:]:
+            while len(queue):
+                top.enqueue(queue.dequeue())
+        self._level.clear()
+        self._bitmap = 1 if self._count else 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate in dispatch order (level by level, FIFO inside a level)."""
+        for queue in self.levels:
+            yield from queue
+
+    def extend(self, items: Iterable[PCB]) -> None:
+        for pcb in items:
+            self.enqueue(pcb)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Levels are keyed by id(), which does not survive pickling.
+        state = self.__dict__.copy()
+        state["_level"] = list(self._level.values())
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._level = {id(pcb): (pcb, level) for pcb, level in state["_level"]}
+
+
+class BlockedQueue:
+    """
+    Processes waiting on I/O, ordered by the tick at which their I/O completes.
+
+    Backed by a min-heap of (wake_time, seq, pcb) so each tick only touches
+    the processes that actually wake up; ties wake in blocking order.
+    """
 
     def __init__(self) -> None:
-        super().__init__(name="blocked")
+        self.name = "blocked"
+        self._timers: list[tuple[int, int, PCB]] = []
+        self._seq = 0
+
+    def block(self, pcb: PCB, wake_time: int) -> None:
+        """Park `pcb` until the loop iteration at `wake_time`."""
+        heapq.heappush(self._timers, (wake_time, self._seq, pcb))
+        self._seq += 1
+
+    def pop_due(self, now: int) -> list[PCB]:
+        """Remove and return every PCB whose I/O completes at or before `now`."""
+        woken: list[PCB] = []
+        while self._timers and self._timers[0][0] <= now:
+            _wake, _seq, pcb = heapq.heappop(self._timers)
+            pcb.io_remaining_time = None
+            woken.append(pcb)
+        return woken
+
+    def next_wake_time(self) -> int | None:
+        """Earliest pending wake-up time, or None when nobody is blocked."""
+        if not self._timers:
+            return None
+        return self._timers[0][0]
+
+    def sync(self, now: int) -> None:
+        """Refresh `io_remaining_time` on every blocked PCB as seen at tick `now`."""
+        for wake_time, _seq, pcb in self._timers:
+            pcb.io_remaining_time = wake_time - now
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Iterate blocked PCBs by wake-up time."""
+        return (pcb for _wake, _seq, pcb in sorted(self._timers, key=lambda t: t[:2]))
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import os
+import pickle
+import random
+import tempfile
+import threading
+import time
+import zlib
+from array import array
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
 
 from .algorithms.base import SchedulingAlgorithm
+from .io_schedule import IOScheduleTable, generate_io_schedules
 from .metrics import SimulationMetrics
 from .pcb import PCB
+from .process_table import ProcessTable
+from .profiling import RunProfiler
 from .queues import BlockedQueue, ReadyQueue
 from .states import ProcessState
+from .timeline import NullTimeline, Timeline
 
 
 @dataclass
@@ -25,6 +37,178 @@ class SimulationConfig:
     io_duration_mean: float = 3.0
     io_duration_stddev: float = 1.0
     io_max_events: int | None = None
+    # "tick" advances the clock one unit at a time; "event" jumps straight to
+    # the next arrival, I/O completion, quantum expiry or completion.
+    engine: str = "tick"
+    # Keep finished PCBs in SchedulerSimulator.completed; disable for long
+    # streamed runs so they are released once their metrics are folded in.
+    retain_completed: bool = True
+    # Seed for the I/O schedule generator; None draws from the global `random`.
+    seed: int | None = None
+    # Keep only streaming metric summaries: no per-process records, no
+    # completed PCBs and no timeline, so memory stays constant.
+    summary_only: bool = False
+    # Wall-clock seconds each `run` call may spend; when exceeded the run is
+    # checkpointed and SimulationPaused is raised (see SchedulerSimulator.restore).
+    wall_clock_budget: float | None = None
+    # File that automatic checkpoints are also written to (atomically).
+    checkpoint_path: str | None = None
+    # Per-phase timings of the run loop (see profiling.RunProfiler); None
+    # leaves the loop uninstrumented.
+    profiler: RunProfiler | None = None
+    # Set from another thread to stop the run; polled with the wall-clock
+    # budget, after which `run` raises SimulationCancelled.
+    cancel_event: threading.Event | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Events hold locks and only make sense in this process; snapshots drop them.
+        state = self.__dict__.copy()
+        state["cancel_event"] = None
+        return state
+
+
+ENGINES = ("tick", "event")
+# Horizon used when no external event is pending.
+_UNBOUNDED = 1 << 62
+SNAPSHOT_VERSION = 1
+# Loop iterations between wall-clock budget checks.
+_BUDGET_CHECK_EVERY = 256
+
+
+class SimulationPaused(Exception):
+    """Raised by `run` when the wall-clock budget runs out; carries the checkpoint."""
+
+    def __init__(self, snapshot: bytes, *, clock: int, completed: int) -> None:
+        super().__init__(f"simulation paused at t={clock} after {completed} completions")
+        self.snapshot = snapshot
+        self.clock = clock
+        self.completed = completed
+
+
+class SimulationCancelled(Exception):
+    """Raised by `run` and `iter_run` once `config.cancel_event` is set."""
+
+    def __init__(self, *, clock: int, completed: int) -> None:
+        super().__init__(f"simulation cancelled at t={clock} after {completed} completions")
+        self.clock = clock
+        self.completed = completed
+
+
+@dataclass(slots=True)
+class SimulationStep:
+    """One batch of progress from `SchedulerSimulator.iter_run`."""
+
+    clock: int
+    completed: int
+    total_jobs: int | None
+    # Timeline segments ({'t', 'pid', 'evento', 'dur'}) recorded since the last step.
+    segments: list[dict[str, Any]]
+    avg_wait: float
+    avg_turnaround: float
+    avg_response: float
+    cpu_utilization: float | None
+    context_switches: int
+    percentiles: dict[str, dict[str, int | None]]
+    done: bool = False
+    # Final metrics, only on the last step.
+    metrics: SimulationMetrics | None = None
+
+    @classmethod
+    def from_metrics(
+        cls,
+        sim: "SchedulerSimulator",
+        metrics: SimulationMetrics,
+        segments: list[dict[str, Any]],
+        *,
+        done: bool,
+    ) -> "SimulationStep":
+        if done:
+            utilization, switches = metrics.cpu_utilization, metrics.context_switches
+        else:
+            state = sim._state  # pylint: disable=protected-access
+            utilization = state.busy_time / sim.clock if sim.clock else None
+            switches = state.context_switches
+        return cls(
+            clock=sim.clock,
+            completed=metrics.completed,
+            total_jobs=sim.total_jobs,
+            segments=segments,
+            avg_wait=metrics.waiting.mean,
+            avg_turnaround=metrics.turnaround.mean,
+            avg_response=metrics.response.mean,
+            cpu_utilization=utilization,
+            context_switches=switches,
+            percentiles=metrics.latency.summary(),
+            done=done,
+            metrics=metrics if done else None,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-friendly view (without the final SimulationMetrics object)."""
+        return {
+            "clock": self.clock,
+            "completed": self.completed,
+            "total_jobs": self.total_jobs,
+            "segments": self.segments,
+            "avg_wait": self.avg_wait,
+            "avg_turnaround": self.avg_turnaround,
+            "avg_response": self.avg_response,
+            "cpu_utilization": self.cpu_utilization,
+            "context_switches": self.context_switches,
+            "percentiles": self.percentiles,
+            "done": self.done,
+        }
+
+
+@dataclass(slots=True)
+class _RunState:
+    """Loop state that outlives a single `run` call when the run is paused."""
+
+    pending: "_PendingArrivals"
+    metrics: SimulationMetrics
+    running: PCB | None = None
+    context_switches: int = 0
+    busy_time: int = 0
+
+
+class _PendingArrivals:
+    """One-element lookahead over an arrival-ordered PCB iterator."""
+
+    __slots__ = ("_source", "_prepare", "_last_arrival", "head")
+
+    def __init__(
+        self,
+        source: Iterable[PCB],
+        prepare: Callable[[PCB], None] | None = None,
+    ) -> None:
+        self._source: Iterator[PCB] = iter(source)
+        self._prepare = prepare
+        self._last_arrival: int | None = None
+        self.head: PCB | None = None
+        self._advance()
+
+    def _advance(self) -> None:
+        pcb = next(self._source, None)
+        if pcb is not None:
+            if self._last_arrival is not None and pcb.arrival_time < self._last_arrival:
+                raise ValueError(
+                    f"Arrival source is not ordered: PCB {pcb.pid} arrives at "
+                    f"{pcb.arrival_time} after a job arriving at {self._last_arrival}"
+                )
+            self._last_arrival = pcb.arrival_time
+            if self._prepare is not None:
+                self._prepare(pcb)
+        self.head = pcb
+
+    def pop(self) -> PCB:
+        """Return the next arrival and load the one after it."""
+        pcb = self.head
+        assert pcb is not None
+        self._advance()
+        return pcb
+
+    def __bool__(self) -> bool:
+        return self.head is not None
 
 
 class SchedulerSimulator:
@@ -32,119 +216,266 @@ class SchedulerSimulator:
 
     def __init__(self, config: SimulationConfig) -> None:
         self.config = config
-        self.ready_queue = ReadyQueue()
+        self.ready_queue = self._new_ready_queue()
         self.blocked_queue = BlockedQueue()
         self.clock: int = 0
         self.completed: List[PCB] = []
         self._jobs: list[PCB] = []
+        self._source: Iterable[PCB] = self._jobs
+        self._prepare_on_arrival = False
+        # Number of jobs loaded, when known (None for streams).
+        self.total_jobs: int | None = 0
+        self.rng: random.Random | None = None
+        self._state: _RunState | None = None
 
-        # Timeline para la UI de Django: lista de segmentos
+        # Timeline para la UI de Django: segmentos comprimidos que se iteran como
         # {'t': tiempo_inicio, 'pid': int|None, 'evento': 'run'|'idle', 'dur': int}
-        self.timeline: list[dict] = []
+        self.timeline = Timeline()
 
-    def load_jobs(self, jobs: Sequence[PCB] | Iterable[PCB]) -> None:
-        """Reset internal state and register the PCBs to simulate."""
-        self.clock = 0
-        self.ready_queue = ReadyQueue()
-        self.blocked_queue = BlockedQueue()
-        self.completed = []
-        self.timeline = []
+    def load_jobs(self, jobs: Sequence[PCB] | Iterable[PCB] | ProcessTable) -> None:
+        """
+        Reset internal state and register the PCBs to simulate. A
+        ProcessTable (e.g. from `open_workload`) is passed to `load_table`.
+        """
+        if isinstance(jobs, ProcessTable):
+            self.load_table(jobs)
+            return
+        self._reset()
         self._jobs = list(jobs)
         self._jobs.sort(key=lambda pcb: pcb.arrival_time)
+        self._source = self._jobs
+        self._prepare_on_arrival = False
+        self.total_jobs = len(self._jobs)
+
+        # All schedules in one pass into a shared flat table.
+        table = self._generate_io(
+            [job.burst_time for job in self._jobs],
+            [job.metadata.get("io_enabled", True) for job in self._jobs],
+        )
+        for row, job in enumerate(self._jobs):
+            job.attach_io_schedule(table, row)
 
-        for job in self._jobs:
-            job.prepare_io_schedule(
-                interval_mean=self.config.io_interval_mean,
-                interval_stddev=self.config.io_interval_stddev,
-                duration_mean=self.config.io_duration_mean,
-                duration_stddev=self.config.io_duration_stddev,
-                max_events=self.config.io_max_events,
-                enabled=self.config.io_enabled and job.metadata.get("io_enabled", True),
+    def load_table(self, table: ProcessTable) -> None:
+        """
+        Reset internal state and simulate the rows of a columnar ProcessTable.
+
+        Runtime state is written back into the table's columns; a PCBView is
+        created for each process when it arrives, so algorithms run
+        unchanged. I/O schedules are generated as in `load_jobs`, in arrival
+        order, into `table.io_table`.
+        """
+        self._reset()
+        order = table.arrival_order()
+        if table.sorted_by_arrival:
+            # Rows are already in arrival order: whole columns, no gathers.
+            io_table = self._generate_io(table.burst, table.io_enabled)
+            table.io_row = array("q", order)
+            table.io_next = io_table.offsets[:-1]
+        else:
+            io_table = self._generate_io(
+                [table.burst[i] for i in order],
+                [bool(table.io_enabled[i]) for i in order],
             )
+            for row, index in enumerate(order):
+                table.io_row[index] = row
+                table.io_next[index] = io_table.offsets[row]
+        table.io_table = io_table
+        # A map (not a generator) so the pending source can be checkpointed.
+        self._source = map(table.view, order)
+        self._prepare_on_arrival = False
+        self.total_jobs = len(order)
+
+    def load_stream(self, source: Iterable[PCB]) -> None:
+        """
+        Reset internal state and register a lazy, arrival-ordered PCB source.
+
+        The source is consumed one PCB at a time as the clock reaches each
+        arrival, and I/O schedules are prepared on admission, so workloads of
+        any length run without being materialized. Combine with
+        `SimulationConfig.retain_completed=False` to also release finished
+        PCBs. Raises ValueError during `run` if arrivals go back in time.
+        """
+        self._reset()
+        self._source = source
+        self._prepare_on_arrival = True
+        self.total_jobs = None
+
+    def _reset(self) -> None:
+        self.clock = 0
+        self.ready_queue = self._new_ready_queue()
+        self.blocked_queue = BlockedQueue()
+        self.completed = []
+        self.timeline = NullTimeline() if self.config.summary_only else Timeline()
+        self._jobs = []
+        self.total_jobs = 0
+        self._state = None
+        self.rng = random.Random(self.config.seed) if self.config.seed is not None else None
+
+    def _generate_io(self, bursts: Sequence[int], enabled: Sequence[bool]) -> IOScheduleTable:
+        return generate_io_schedules(
+            bursts,
+            interval_mean=self.config.io_interval_mean,
+            interval_stddev=self.config.io_interval_stddev,
+            duration_mean=self.config.io_duration_mean,
+            duration_stddev=self.config.io_duration_stddev,
+            max_events=self.config.io_max_events,
+            enabled=[self.config.io_enabled and flag for flag in enabled],
+            rng=self.rng,
+        )
+
+    def _prepare_io(self, job: PCB) -> None:
+        job.prepare_io_schedule(
+            interval_mean=self.config.io_interval_mean,
+            interval_stddev=self.config.io_interval_stddev,
+            duration_mean=self.config.io_duration_mean,
+            duration_stddev=self.config.io_duration_stddev,
+            max_events=self.config.io_max_events,
+            enabled=self.config.io_enabled and job.metadata.get("io_enabled", True),
+            rng=self.rng,
+        )
 
-    def run(self) -> SimulationMetrics:
+    def run(
+        self, progress: Callable[[int, int | None], None] | None = None
+    ) -> SimulationMetrics:
         """
         Execute the simulation using the configured algorithm.
         Returns SimulationMetrics; los PCBs finales quedan en self.completed
         y la línea de tiempo en self.timeline.
+
+        `progress(completed, total_jobs)` is called after every completion;
+        an exception raised from it aborts the run and propagates. With
+        `config.wall_clock_budget`, a call that runs out of time raises
+        SimulationPaused; calling `run` again (on this object or on one
+        rebuilt with `restore`) continues where it stopped. Setting
+        `config.cancel_event` stops it within a few hundred loop iterations
+        and raises SimulationCancelled.
         """
-        if not self._jobs:
-            return SimulationMetrics()
+        budget = self.config.wall_clock_budget
+        deadline = None if budget is None else time.perf_counter() + budget
+        if not self._advance(progress, deadline=deadline):
+            self._check_cancelled()
+            self._pause()
+        return self._finish()
 
-        algorithm = self.config.algorithm
-        if self.config.time_slice is not None and hasattr(algorithm, "quantum"):
-            try:
-                algorithm.quantum = self.config.time_slice
-            except Exception:
-                # Si el algoritmo no permite cambiar el quantum, ignoramos.
-                pass
-        algorithm.reset()
+    def iter_run(self, *, batch_size: int = 256) -> Iterator[SimulationStep]:
+        """
+        Run the simulation incrementally, yielding a SimulationStep every
+        `batch_size` loop iterations (scheduling events in event mode).
 
-        total_jobs = len(self._jobs)
-        jobs_pending: list[PCB] = list(self._jobs)
-        running: PCB | None = None
-        context_switches = 0
-        busy_time = 0
+        Each step carries the timeline segments recorded since the previous
+        one and a running metric snapshot; the last step has `done=True` and
+        the final SimulationMetrics. Nothing runs while the consumer is not
+        pulling, so slow consumers throttle the simulation. Segments are
+        keyed by their start `t`: a segment already yielded may reappear
+        with a longer `dur` when the same process keeps the CPU.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        sent = 0
+        last_duration = 0
+        while True:
+            finished = self._advance(None, max_iterations=batch_size)
+            if not finished:
+                self._check_cancelled()
+            timeline = self.timeline
+            start = sent
+            if sent and timeline[sent - 1]["dur"] != last_duration:
+                start = sent - 1
+            segments = timeline[start:]
+            sent = len(timeline)
+            if sent:
+                last_duration = timeline[sent - 1]["dur"]
+            if finished:
+                metrics = self._finish()
+                yield SimulationStep.from_metrics(self, metrics, segments, done=True)
+                return
+            yield SimulationStep.from_metrics(self, self._state.metrics, segments, done=False)
 
-        # Load jobs that arrive at time 0 through the algorithm's priming hook.
-        initial_jobs: list[PCB] = []
-        while jobs_pending and jobs_pending[0].arrival_time <= self.clock:
-            job = jobs_pending.pop(0)
-            job.set_state(ProcessState.READY)
-            initial_jobs.append(job)
-        if initial_jobs:
-            algorithm.prime(self.ready_queue, initial_jobs)
+    def _advance(
+        self,
+        progress: Callable[[int, int | None], None] | None = None,
+        *,
+        deadline: float | None = None,
+        max_iterations: int | None = None,
+    ) -> bool:
+        """
+        Drive the main loop until the run ends (True) or it is interrupted by
+        `deadline` (perf_counter time), `max_iterations` or the config's
+        `cancel_event` (False).
+        """
+        if self.config.engine not in ENGINES:
+            raise ValueError(f"Unknown simulation engine: {self.config.engine!r}")
+        state = self._state
+        if state is None:
+            state = self._start()
+        algorithm = self.config.algorithm
+        event_driven = self.config.engine == "event"
+        retain_completed = self.config.retain_completed and not self.config.summary_only
+        pending = state.pending
+        metrics = state.metrics
+        blocked_queue = self.blocked_queue
+        timeline = self.timeline
+        if self.config.profiler is not None:
+            algorithm, pending, blocked_queue, timeline, metrics = self.config.profiler.instrument(
+                algorithm, pending, blocked_queue, timeline, metrics
+            )
+        running = state.running
+        context_switches = state.context_switches
+        busy_time = state.busy_time
+        cancel = self.config.cancel_event
+        timed = deadline is not None or cancel is not None
+        limited = timed or max_iterations is not None
+        until_check = _BUDGET_CHECK_EVERY
+        finished = False
+
+        while True:
+            if limited:
+                if max_iterations is not None:
+                    if max_iterations == 0:
+                        break
+                    max_iterations -= 1
+                if timed:
+                    until_check -= 1
+                    if until_check == 0:
+                        until_check = _BUDGET_CHECK_EVERY
+                        if cancel is not None and cancel.is_set():
+                            break
+                        if deadline is not None and time.perf_counter() >= deadline:
+                            break
 
-        while len(self.completed) < total_jobs:
             if self.config.max_time is not None and self.clock >= self.config.max_time:
+                finished = True
                 break
 
             # Enqueue jobs that have just arrived.
-            while jobs_pending and jobs_pending[0].arrival_time <= self.clock:
-                job = jobs_pending.pop(0)
+            while pending and pending.head.arrival_time <= self.clock:
+                job = pending.pop()
                 job.set_state(ProcessState.READY)
                 self.ready_queue.enqueue(job)
 
-            # Advance blocked processes and return them to the ready queue when I/O completes.
-            if len(self.blocked_queue) > 0:
-                unblock: list[PCB] = []
-                for _ in range(len(self.blocked_queue)):
-                    blocked = self.blocked_queue.dequeue()
-                    if blocked is None:
-                        continue
-                    blocked.tick_io()
-                    if blocked.io_remaining_time is None:
-                        unblock.append(blocked)
-                    else:
-                        self.blocked_queue.enqueue(blocked)
-                if unblock:
-                    for pcb in unblock:
+            # Return processes whose I/O completes now to the ready queue.
+            if len(blocked_queue) > 0:
+                woken = blocked_queue.pop_due(self.clock)
+                if woken:
+                    for pcb in woken:
                         pcb.set_state(ProcessState.READY)
-                    self.ready_queue.extend(unblock)
+                    self.ready_queue.extend(woken)
 
             # If the CPU is idle and no jobs are ready, jump to the next arrival.
             if running is None and len(self.ready_queue) == 0:
-                if len(self.blocked_queue) > 0:
-                    # CPU ociosa 1 tick
-                    self.timeline.append(
-                        {"t": self.clock, "pid": None, "evento": "idle", "dur": 1}
-                    )
-                    self.clock += 1
+                if len(blocked_queue) > 0:
+                    # CPU ociosa hasta el siguiente evento (1 tick en modo tick)
+                    idle = self._ticks_to_next_event(pending) if event_driven else 1
+                    timeline.record(self.clock, None, idle)
+                    self.clock += idle
                     continue
-                if jobs_pending:
-                    next_time = max(self.clock + 1, jobs_pending[0].arrival_time)
-                    if next_time > self.clock:
-                        self.timeline.append(
-                            {
-                                "t": self.clock,
-                                "pid": None,
-                                "evento": "idle",
-                                "dur": next_time - self.clock,
-                            }
-                        )
+                if pending:
+                    next_time = max(self.clock + 1, pending.head.arrival_time)
+                    timeline.record(self.clock, None, next_time - self.clock)
                     self.clock = next_time
                     continue
                 # Nothing left to do.
+                finished = True
                 break
 
             decision = algorithm.next_tick(
@@ -167,35 +498,181 @@ class SchedulerSimulator:
                 if running.pid != previous_pid:
                     context_switches += 1
 
-            # Ejecutamos un tick de CPU si hay proceso
+            span = 1
+            # Ejecutamos la CPU si hay proceso (un tick, o hasta el siguiente evento)
             if running is not None:
-                # Guardar en timeline este tick de ejecución
-                self.timeline.append(
-                    {"t": self.clock, "pid": running.pid, "evento": "run", "dur": 1}
-                )
+                if event_driven:
+                    span = min(
+                        self._ticks_to_next_event(pending),
+                        self._run_span(running, decision.timeslice),
+                    )
+
+                # Guardar en timeline este tramo de ejecución
+                timeline.record(self.clock, running.pid, span)
 
                 running.set_state(ProcessState.RUNNING)
-                running.consume(1)
-                busy_time += 1
-                blocked_now, _duration = running.io_request_due()
+                running.consume(span)
+                busy_time += span
+                blocked_now, duration = running.io_request_due()
                 if blocked_now:
                     running.set_state(ProcessState.BLOCKED)
-                    self.blocked_queue.enqueue(running)
+                    # The request happens in the span's last tick; the process is
+                    # ready again `duration` ticks later.
+                    blocked_queue.block(running, self.clock + span - 1 + duration)
                     running = None
 
-            self.clock += 1
+            self.clock += span
 
             if running is not None and running.remaining_time == 0:
                 running.finish_time = self.clock
                 running.turnaround_time = running.finish_time - running.arrival_time
                 running.waiting_time = running.turnaround_time - running.burst_time
                 running.set_state(ProcessState.TERMINATED)
-                self.completed.append(running)
+                metrics.record_pcb(running)
+                if retain_completed:
+                    self.completed.append(running)
                 running = None
+                if progress is not None:
+                    # Consistent state, so `progress` may take a snapshot.
+                    state.running, state.context_switches, state.busy_time = (
+                        None, context_switches, busy_time
+                    )
+                    progress(metrics.completed, self.total_jobs)
 
-        metrics = SimulationMetrics.from_pcbs(self.completed)
+        state.running, state.context_switches, state.busy_time = (
+            running, context_switches, busy_time
+        )
+        return finished
+
+    def _finish(self) -> SimulationMetrics:
+        """Close a finished run: final I/O sync and aggregate metrics."""
+        state = self._state
+        self._state = None
+        if len(self.blocked_queue) > 0:
+            # Leave io_remaining_time as the last processed tick saw it.
+            self.blocked_queue.sync(self.clock - 1)
+
+        metrics = state.metrics
         if self.clock > 0:
-            metrics.throughput = len(self.completed) / self.clock
-            metrics.cpu_utilization = busy_time / self.clock
-        metrics.context_switches = context_switches
+            metrics.throughput = metrics.completed / self.clock
+            metrics.cpu_utilization = state.busy_time / self.clock
+        metrics.context_switches = state.context_switches
+        if self.config.profiler is not None:
+            metrics.profile = self.config.profiler.report()
         return metrics
+
+    def _start(self) -> _RunState:
+        """Prepare a fresh run: algorithm reset and time-0 priming."""
+        pending = _PendingArrivals(
+            self._source, self._prepare_io if self._prepare_on_arrival else None
+        )
+
+        algorithm = self.config.algorithm
+        if self.config.time_slice is not None and hasattr(algorithm, "quantum"):
+            try:
+                algorithm.quantum = self.config.time_slice
+            except Exception:
+                # Si el algoritmo no permite cambiar el quantum, ignoramos.
+                pass
+        algorithm.reset()
+
+        # Load jobs that arrive at time 0 through the algorithm's priming hook.
+        initial_jobs: list[PCB] = []
+        while pending and pending.head.arrival_time <= self.clock:
+            job = pending.pop()
+            job.set_state(ProcessState.READY)
+            initial_jobs.append(job)
+        if initial_jobs:
+            algorithm.prime(self.ready_queue, initial_jobs)
+
+        self._state = _RunState(
+            pending=pending,
+            metrics=SimulationMetrics(per_process=not self.config.summary_only),
+        )
+        return self._state
+
+    # ---------- checkpoints ----------
+
+    def snapshot(self) -> bytes:
+        """
+        Compact checkpoint of the whole simulator: clock, queues, PCB and
+        table state, algorithm internals, RNG state, pending arrivals,
+        timeline and partial metrics (a zlib-compressed pickle).
+
+        Valid before `run`, between `run` calls and from a `progress`
+        callback. Arrival sources must be picklable (lists, tables and the
+        classes in `sources` are; generators are not). When I/O draws from
+        the global `random` module, its state is captured too.
+        """
+        global_rng = random.getstate() if self.rng is None else None
+        payload = (SNAPSHOT_VERSION, self, global_rng)
+        return zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @classmethod
+    def restore(cls, data: bytes) -> "SchedulerSimulator":
+        """
+        Rebuild a simulator from `snapshot` output; `run()` then resumes it.
+        Snapshots are pickles: only restore data you produced yourself.
+        """
+        version, sim, global_rng = pickle.loads(zlib.decompress(data))
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version!r}")
+        if global_rng is not None:
+            random.setstate(global_rng)
+        return sim
+
+    def _check_cancelled(self) -> None:
+        cancel = self.config.cancel_event
+        if cancel is not None and cancel.is_set():
+            raise SimulationCancelled(clock=self.clock, completed=self._state.metrics.completed)
+
+    def _pause(self) -> None:
+        data = self.snapshot()
+        path = self.config.checkpoint_path
+        if path is not None:
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+        raise SimulationPaused(data, clock=self.clock, completed=self._state.metrics.completed)
+
+    # ---------- helpers ----------
+
+    def _new_ready_queue(self) -> ReadyQueue:
+        """Let the algorithm pick its ready structure; plain FIFO otherwise."""
+        factory = getattr(self.config.algorithm, "create_ready_queue", None)
+        return factory() if factory is not None else ReadyQueue()
+
+    def _ticks_to_next_event(self, pending: _PendingArrivals) -> int:
+        """Ticks until the next arrival, I/O completion or `max_time` (at least 1)."""
+        horizon: int | None = None
+        if pending:
+            horizon = pending.head.arrival_time - self.clock
+        next_wake = self.blocked_queue.next_wake_time()
+        if next_wake is not None and (horizon is None or next_wake - self.clock < horizon):
+            horizon = next_wake - self.clock
+        if self.config.max_time is not None:
+            until_limit = self.config.max_time - self.clock
+            if horizon is None or until_limit < horizon:
+                horizon = until_limit
+        if horizon is None:
+            # Only reachable with a running process; its own span bounds the jump.
+            return _UNBOUNDED
+        return max(1, horizon)
+
+    @staticmethod
+    def _run_span(pcb: PCB, timeslice: int | None) -> int:
+        """Ticks `pcb` can run before it finishes, requests I/O or exhausts its slice."""
+        span = max(1, pcb.remaining_time)
+        until_io = pcb.cpu_until_next_io()
+        if until_io is not None:
+            span = min(span, until_io)
+        if timeslice is not None:
+            span = min(span, max(1, timeslice))
+        return span
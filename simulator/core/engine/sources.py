@@ -0,0 +1,104 @@
+"""Lazy, arrival-ordered PCB sources for `SchedulerSimulator.load_stream`."""
+
+from __future__ import annotations
+
+import csv
+import random
+from typing import Any, Iterable, Iterator, Mapping
+
+from .pcb import PCB
+
+
+class PoissonArrivals:
+    """
+    Open-system workload: Poisson arrivals with exponentially distributed bursts.
+
+    Arrivals are generated on demand, so the source holds O(1) state no matter
+    how many jobs it yields. Generation stops after `count` jobs or once an
+    arrival would reach `horizon`; with neither set the stream is infinite and
+    the run must be bounded with `SimulationConfig.max_time`.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst_mean: float,
+        count: int | None = None,
+        horizon: int | None = None,
+        seed: int | None = None,
+        first_pid: int = 1,
+        usuario: str = "root",
+    ) -> None:
+        if rate <= 0 or burst_mean <= 0:
+            raise ValueError("rate and burst_mean must be positive")
+        self.rate = rate
+        self.burst_mean = burst_mean
+        self.count = count
+        self.horizon = horizon
+        self.usuario = usuario
+        self._rng = random.Random(seed)
+        self._next_pid = first_pid
+        self._generated = 0
+        self._clock = 0.0
+
+    def __iter__(self) -> Iterator[PCB]:
+        return self
+
+    def __next__(self) -> PCB:
+        if self.count is not None and self._generated >= self.count:
+            raise StopIteration
+        self._clock += self._rng.expovariate(self.rate)
+        arrival = int(self._clock)
+        if self.horizon is not None and arrival >= self.horizon:
+            raise StopIteration
+        burst = max(1, round(self._rng.expovariate(1.0 / self.burst_mean)))
+        pcb = PCB(
+            pid=self._next_pid,
+            arrival_time=arrival,
+            burst_time=burst,
+            metadata={"usuario": self.usuario},
+        )
+        self._next_pid += 1
+        self._generated += 1
+        return pcb
+
+
+class TraceArrivals:
+    """
+    Replay a recorded trace of processes in the Planificador row format:
+    {"pid": 1, "llegada": 0, "rafaga": 5, "prioridad": 0, "usuario": "usuario1"}.
+
+    Rows must already be sorted by `llegada`; they are converted to PCBs one
+    at a time as the simulator asks for them.
+    """
+
+    def __init__(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        self._rows = iter(rows)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "TraceArrivals":
+        """Stream a CSV trace with a `pid,llegada,rafaga[,prioridad,usuario]` header."""
+        return cls(_read_csv_rows(path))
+
+    def __iter__(self) -> Iterator[PCB]:
+        return self
+
+    def __next__(self) -> PCB:
+        row = next(self._rows)
+        prioridad = row.get("prioridad")
+        metadata: dict[str, Any] = {"usuario": row.get("usuario") or "root"}
+        if "io_enabled" in row:
+            metadata["io_enabled"] = bool(row["io_enabled"])
+        return PCB(
+            pid=int(row["pid"]),
+            arrival_time=int(row.get("llegada", 0)),
+            burst_time=int(row.get("rafaga", 0)),
+            priority=int(prioridad) if prioridad not in (None, "") else None,
+            metadata=metadata,
+        )
+
+
+def _read_csv_rows(path: str) -> Iterator[dict[str, str]]:
+    with open(path, newline="", encoding="utf-8") as handle:
+        yield from csv.DictReader(handle)
@@ -0,0 +1,148 @@
+"""Compact, run-length encoded CPU timeline."""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, overload
+
+# Sentinel stored in the pid column for idle CPU segments.
+IDLE_PID = -(1 << 63)
+
+
+class Timeline:
+    """
+    CPU timeline stored as parallel int arrays (start, pid, duration).
+
+    Consecutive segments for the same pid (or idle) are merged as they are
+    recorded, so memory grows with the number of context switches instead of
+    the makespan. Iterating yields the dict view the templates expect:
+    {'t': inicio, 'pid': int|None, 'evento': 'run'|'idle', 'dur': int}.
+    """
+
+    __slots__ = ("_starts", "_pids", "_durations")
+
+    def __init__(self) -> None:
+        self._starts = array("q")
+        self._pids = array("q")
+        self._durations = array("q")
+
+    def record(self, start: int, pid: int | None, duration: int) -> None:
+        """Append a segment, extending the last one when it is contiguous and identical."""
+        if duration <= 0:
+            return
+        code = IDLE_PID if pid is None else pid
+        if self._pids and self._pids[-1] == code and self._starts[-1] + self._durations[-1] == start:
+            self._durations[-1] += duration
+            return
+        self._starts.append(start)
+        self._pids.append(code)
+        self._durations.append(duration)
+
+    def segments(self) -> Iterator[tuple[int, int | None, int]]:
+        """Yield (start, pid, duration) tuples; pid is None for idle segments."""
+        for start, code, duration in zip(self._starts, self._pids, self._durations):
+            yield start, (None if code == IDLE_PID else code), duration
+
+    def window(self, start: int, end: int) -> Iterator[tuple[int, int | None, int]]:
+        """
+        (start, pid, duration) of the segments overlapping [start, end),
+        clipped to it. Starts are sorted, so this costs O(log n) plus the
+        segments returned.
+        """
+        starts = self._starts
+        first = max(0, bisect_right(starts, start) - 1)
+        last = bisect_left(starts, end)
+        window = zip(starts[first:last], self._pids[first:last], self._durations[first:last])
+        for begin, code, duration in window:
+            finish = begin + duration
+            if finish <= start:
+                continue
+            if begin < start:
+                begin = start
+            if finish > end:
+                finish = end
+            yield begin, (None if code == IDLE_PID else code), finish - begin
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact serialization for storage: the segment count followed by
+        the three columns as little-endian int64, zlib-compressed.
+        """
+        columns = [array("q", column) for column in (self._starts, self._pids, self._durations)]
+        if sys.byteorder == "big":
+            for column in columns:
+                column.byteswap()
+        header = struct.pack("<Q", len(self._starts))
+        return zlib.compress(header + b"".join(column.tobytes() for column in columns))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Timeline":
+        """Inverse of `to_bytes`; raises ValueError if `data` is malformed."""
+        try:
+            raw = zlib.decompress(data)
+        except zlib.error as exc:
+            raise ValueError(f"invalid timeline data ({exc})") from exc
+        if len(raw) < 8:
+            raise ValueError("invalid timeline data (truncated header)")
+        (count,) = struct.unpack_from("<Q", raw)
+        if len(raw) != 8 + 3 * 8 * count:
+            raise ValueError("invalid timeline data (length mismatch)")
+        timeline = cls()
+        for index, column in enumerate((timeline._starts, timeline._pids, timeline._durations)):
+            offset = 8 + index * 8 * count
+            column.frombytes(raw[offset:offset + 8 * count])
+            if sys.byteorder == "big":
+                column.byteswap()
+        return timeline
+
+    def _as_dict(self, index: int) -> dict[str, Any]:
+        code = self._pids[index]
+        idle = code == IDLE_PID
+        return {
+            "t": self._starts[index],
+            "pid": None if idle else code,
+            "evento": "idle" if idle else "run",
+            "dur": self._durations[index],
+        }
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Materialize the dict view of every segment."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self._starts)):
+            yield self._as_dict(index)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._as_dict(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("timeline index out of range")
+        return self._as_dict(index)
+
+    def __repr__(self) -> str:
+        return f"Timeline(segments={len(self)})"
+
+
+class NullTimeline(Timeline):
+    """Timeline that discards every segment (summary-only runs)."""
+
+    __slots__ = ()
+
+    def record(self, start: int, pid: int | None, duration: int) -> None:
+        return None
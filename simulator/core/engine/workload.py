@@ -0,0 +1,342 @@
+"""
+Seeded synthetic workloads and a compact, memory-mappable workload file.
+
+`generate_workload` draws a ProcessTable from a WorkloadSpec: an arrival
+process (Poisson, Bursty or Diurnal), a burst distribution (Exponential,
+Pareto or Bimodal) and a mix of usuarios, each with its own share of the
+processes and optionally its own bursts and priority. The same spec and
+seed always produce the same table.
+
+`write_workload` stores the static columns of a table in arrival order:
+
+    header   magic, version, flags, rows, length of the usuario names
+    names    JSON list of usuario names, padded to 8 bytes
+    columns  pid, arrival, burst, priority (int64), usuario (int32) and
+             io_enabled (int8), little-endian, each padded to 8 bytes
+
+`open_workload` maps the file and wraps those columns without copying or
+parsing them, so opening costs only the runtime columns the simulator
+writes to. The result feeds `SchedulerSimulator.load_jobs`/`load_table`
+and `Planificador` directly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import mmap
+import random
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Protocol, Sequence
+
+from .process_table import _NONE, ProcessTable
+
+MAGIC = b"SIMWKLD\x00"
+FORMAT_VERSION = 1
+# magic, version, flags, reserved, rows, length of the names blob
+_HEADER = struct.Struct("<8sHHIQQ")
+_SORTED = 0x1
+# (column, array typecode) in file order.
+_COLUMNS = (
+    ("pid", "q"),
+    ("arrival", "q"),
+    ("burst", "q"),
+    ("priority", "q"),
+    ("usuario", "i"),
+    ("io_enabled", "b"),
+)
+
+
+# ---------- distributions ----------
+
+
+class ArrivalProcess(Protocol):
+    def arrivals(self, count: int, rng: random.Random) -> array: ...
+
+
+class BurstDistribution(Protocol):
+    def sample(self, rng: random.Random) -> int: ...
+
+
+@dataclass(frozen=True)
+class Poisson:
+    """Homogeneous Poisson arrivals, `rate` processes per tick on average."""
+
+    rate: float
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+
+    def arrivals(self, count: int, rng: random.Random) -> array:
+        out = array("q")
+        draw, clock = rng.expovariate, 0.0
+        for _ in range(count):
+            clock += draw(self.rate)
+            out.append(int(clock))
+        return out
+
+
+@dataclass(frozen=True)
+class Bursty:
+    """
+    Two-state Markov-modulated Poisson arrivals: calm periods at `rate`
+    alternate with bursts at `burst_rate`. Period lengths are exponential
+    with means `calm_mean` and `burst_mean` ticks.
+    """
+
+    rate: float
+    burst_rate: float
+    calm_mean: float = 200.0
+    burst_mean: float = 20.0
+
+    def __post_init__(self) -> None:
+        if min(self.rate, self.burst_rate, self.calm_mean, self.burst_mean) <= 0:
+            raise ValueError("rates and period means must be positive")
+
+    def arrivals(self, count: int, rng: random.Random) -> array:
+        out = array("q")
+        draw = rng.expovariate
+        rates = (self.rate, self.burst_rate)
+        means = (self.calm_mean, self.burst_mean)
+        state = 0
+        clock = 0.0
+        period_end = draw(1 / means[state])
+        while len(out) < count:
+            gap = draw(rates[state])
+            if clock + gap >= period_end:
+                # Memoryless: restart the draw at the switch with the other rate.
+                clock = period_end
+                state ^= 1
+                period_end = clock + draw(1 / means[state])
+                continue
+            clock += gap
+            out.append(int(clock))
+        return out
+
+
+@dataclass(frozen=True)
+class Diurnal:
+    """
+    Poisson arrivals whose rate follows a daily cycle,
+    rate * (1 + amplitude * sin(2π t / period + phase)), drawn by thinning.
+    """
+
+    rate: float
+    amplitude: float = 0.8
+    period: float = 1440.0
+    phase: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.period <= 0:
+            raise ValueError("rate and period must be positive")
+        if not 0 <= self.amplitude <= 1:
+            raise ValueError("amplitude must be between 0 and 1")
+
+    def arrivals(self, count: int, rng: random.Random) -> array:
+        out = array("q")
+        draw, uniform, sin = rng.expovariate, rng.random, math.sin
+        peak = self.rate * (1 + self.amplitude)
+        scale = 2 * math.pi / self.period
+        clock = 0.0
+        while len(out) < count:
+            clock += draw(peak)
+            if uniform() * (1 + self.amplitude) <= 1 + self.amplitude * sin(clock * scale + self.phase):
+                out.append(int(clock))
+        return out
+
+
+@dataclass(frozen=True)
+class Exponential:
+    """Exponential bursts with the given mean, rounded, at least 1 tick."""
+
+    mean: float
+
+    def __post_init__(self) -> None:
+        if self.mean <= 0:
+            raise ValueError("mean must be positive")
+
+    def sample(self, rng: random.Random) -> int:
+        return max(1, round(rng.expovariate(1 / self.mean)))
+
+
+@dataclass(frozen=True)
+class Pareto:
+    """Heavy-tailed bursts: `minimum` times a Pareto(`alpha`) variate."""
+
+    alpha: float = 1.5
+    minimum: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.alpha <= 0 or self.minimum <= 0:
+            raise ValueError("alpha and minimum must be positive")
+
+    def sample(self, rng: random.Random) -> int:
+        return max(1, round(self.minimum * rng.paretovariate(self.alpha)))
+
+
+@dataclass(frozen=True)
+class Bimodal:
+    """Mostly short interactive bursts plus a `long_fraction` of long batch ones."""
+
+    short_mean: float = 3.0
+    long_mean: float = 50.0
+    long_fraction: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.short_mean <= 0 or self.long_mean <= 0:
+            raise ValueError("means must be positive")
+        if not 0 <= self.long_fraction <= 1:
+            raise ValueError("long_fraction must be between 0 and 1")
+
+    def sample(self, rng: random.Random) -> int:
+        mean = self.long_mean if rng.random() < self.long_fraction else self.short_mean
+        return max(1, round(rng.expovariate(1 / mean)))
+
+
+# ---------- generation ----------
+
+
+@dataclass(frozen=True)
+class UserMix:
+    """A usuario's share (`weight`) of the processes, its bursts and priority."""
+
+    usuario: str
+    weight: float = 1.0
+    bursts: BurstDistribution | None = None  # None: the spec's distribution
+    priority: int | None = None
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    count: int
+    arrivals: ArrivalProcess = Poisson(0.1)
+    bursts: BurstDistribution = Exponential(8.0)
+    usuarios: Sequence[UserMix] = field(default_factory=lambda: (UserMix("root"),))
+    max_burst: int | None = None
+    io_enabled: bool = True
+
+
+def generate_workload(spec: WorkloadSpec, seed: int | None = 0) -> ProcessTable:
+    """Draw the processes of `spec`; pids are 1..count in arrival order."""
+    if spec.count < 0:
+        raise ValueError("count must be >= 0")
+    mixes = list(spec.usuarios)
+    if not mixes or any(mix.weight < 0 for mix in mixes) or sum(mix.weight for mix in mixes) <= 0:
+        raise ValueError("usuarios needs at least one mix and a positive total weight")
+    rng = random.Random(seed)
+    count = spec.count
+
+    arrival = spec.arrivals.arrivals(count, rng)
+    codes = array("i", rng.choices(range(len(mixes)), [mix.weight for mix in mixes], k=count))
+    samplers = [(mix.bursts or spec.bursts).sample for mix in mixes]
+    cap = spec.max_burst or sys.maxsize
+    burst = array("q", [min(cap, samplers[code](rng)) for code in codes])
+    priorities = [_NONE if mix.priority is None else mix.priority for mix in mixes]
+    priority = array("q", [priorities[code] for code in codes])
+
+    return ProcessTable.from_arrays(
+        array("q", range(1, count + 1)),
+        arrival,
+        burst,
+        priority=priority,
+        usuario=codes,
+        io_enabled=array("b", [1 if spec.io_enabled else 0]) * count,
+        usuarios=[mix.usuario for mix in mixes],
+        sorted_by_arrival=True,
+    )
+
+
+# ---------- binary format ----------
+
+
+def write_workload(table: ProcessTable, path: str) -> None:
+    """Store the static columns of `table`, reordered by arrival (stably) if needed."""
+    order = None if table.sorted_by_arrival else table.arrival_order()
+    names = json.dumps(table.usuarios).encode()
+    with open(path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, FORMAT_VERSION, _SORTED, 0, len(table), len(names)))
+        _write_padded(out, names)
+        for name, typecode in _COLUMNS:
+            column = getattr(table, name)
+            if order is not None:
+                column = array(typecode, [column[i] for i in order])
+            elif _typecode(column) != typecode:
+                column = array(typecode, column)
+            if sys.byteorder != "little":
+                column = array(typecode, column)
+                column.byteswap()
+            _write_padded(out, memoryview(column).cast("B"))
+
+
+def open_workload(path: str) -> ProcessTable:
+    """
+    Map a file written by `write_workload`. The static columns are
+    read-only views of the mapping, which stays open while they are alive.
+    """
+    with open(path, "rb") as source:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapped)
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{path}: not a workload file")
+    magic, version, flags, _reserved, rows, names_size = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a workload file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported workload format version {version}")
+
+    offset = _HEADER.size
+    usuarios = json.loads(bytes(buffer[offset:offset + names_size]))
+    offset += _padded(names_size)
+    columns = {}
+    for name, typecode in _COLUMNS:
+        size = rows * array(typecode).itemsize
+        if offset + size > len(buffer):
+            raise ValueError(f"{path}: truncated workload file")
+        column = buffer[offset:offset + size].cast(typecode)
+        if sys.byteorder != "little":
+            column = array(typecode, column)
+            column.byteswap()
+        columns[name] = column
+        offset += _padded(size)
+
+    return ProcessTable.from_arrays(
+        columns.pop("pid"),
+        columns.pop("arrival"),
+        columns.pop("burst"),
+        usuarios=usuarios,
+        sorted_by_arrival=bool(flags & _SORTED),
+        **columns,
+    )
+
+
+def workload_digest(table: ProcessTable) -> str:
+    """Hash of the static columns; equal for a table and its written/opened copy."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps(table.usuarios).encode())
+    order = None if table.sorted_by_arrival else table.arrival_order()
+    for name, typecode in _COLUMNS:
+        column = getattr(table, name)
+        if order is not None:
+            column = array(typecode, [column[i] for i in order])
+        elif _typecode(column) != typecode:
+            column = array(typecode, column)
+        digest.update(memoryview(column).cast("B"))
+    return digest.hexdigest()
+
+
+def _typecode(column: Sequence[int]) -> str:
+    return column.typecode if isinstance(column, array) else column.format
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _write_padded(out, data) -> None:
+    out.write(data)
+    out.write(bytes(_padded(len(data)) - len(data)))
@@ -0,0 +1,237 @@
+"""
+Diagramas de Gantt renderizados en el servidor, como SVG o PNG.
+
+Antes de dibujar, la línea de tiempo se reduce al ancho pedido: cada
+columna de píxeles toma el color del proceso (o de la CPU ociosa) que más
+tiempo ocupa en ella, y las columnas consecutivas del mismo color se funden
+en una sola barra. Así la imagen tiene como mucho `ancho` barras, dure lo
+que dure la simulación. `inicio` y `fin` eligen la ventana de tiempo que se
+dibuja (zoom); fuera de ella no se recorre ningún segmento.
+
+Acepta una Timeline o la lista de segmentos serializada
+({"t", "pid", "dur", ...}, ordenada por "t") que guardan los trabajos.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+
+from .engine.timeline import Timeline
+
+# Formato -> content type.
+FORMATOS = {"svg": "image/svg+xml", "png": "image/png"}
+ANCHO_MAX = 4096
+ALTO_MAX = 1024
+_ALTO_EJE = 16
+_COLOR_OCIOSA = "#dee2e6"
+_COLOR_EJE = "#6c757d"
+
+
+@dataclass(frozen=True, slots=True)
+class Barra:
+    """Columnas [x0, x1) del mismo color; `mezcla` si resume varios segmentos por columna."""
+
+    x0: int
+    x1: int
+    pid: int | None
+    mezcla: bool = False
+
+
+def color(pid: int | None) -> str:
+    """Mismo color por PID que el Gantt en vivo de la plantilla."""
+    return _COLOR_OCIOSA if pid is None else f"hsl({pid * 47 % 360}, 65%, 55%)"
+
+
+def fin_timeline(segmentos: Timeline | Sequence[dict[str, Any]]) -> int:
+    """Instante en que termina el último segmento (0 si no hay ninguno)."""
+    if not len(segmentos):
+        return 0
+    ultimo = segmentos[-1]
+    return ultimo["t"] + ultimo["dur"]
+
+
+def reducir(
+    segmentos: Timeline | Sequence[dict[str, Any]],
+    ancho: int,
+    inicio: int = 0,
+    fin: int | None = None,
+) -> list[Barra]:
+    """Barras de la ventana [inicio, fin) escalada a `ancho` píxeles."""
+    if ancho < 1:
+        raise ValueError("ancho debe ser >= 1")
+    if fin is None:
+        fin = fin_timeline(segmentos)
+    if fin <= inicio:
+        return []
+    escala = ancho / (fin - inicio)
+    barras: list[Barra] = []
+    # Tiempo (en píxeles) que ocupa cada PID en la columna `columna`.
+    ocupacion: dict[int | None, float] = {}
+    columna = -1
+
+    def volcar() -> None:
+        if ocupacion:
+            pid = max(ocupacion, key=ocupacion.__getitem__)
+            _anadir(barras, columna, columna + 1, pid, len(ocupacion) > 1)
+            ocupacion.clear()
+
+    ocupado = ocupacion.get
+    for t, pid, dur in _ventana(segmentos, inicio, fin):
+        a = (t - inicio) * escala
+        b = a + dur * escala
+        if b > ancho:
+            b = ancho
+        actual = int(a)
+        if b <= actual + 1:
+            # Caso habitual al alejar el zoom: el segmento cabe en una columna.
+            if actual != columna:
+                volcar()
+                columna = actual
+            ocupacion[pid] = ocupado(pid, 0.0) + (b - a)
+            continue
+        while a < b:
+            actual = int(a)
+            if actual != columna:
+                volcar()
+                columna = actual
+            borde = actual + 1
+            if b <= borde:
+                ocupacion[pid] = ocupacion.get(pid, 0.0) + (b - a)
+                break
+            ocupacion[pid] = ocupacion.get(pid, 0.0) + (borde - a)
+            a = borde
+            llenas = int(b - a)
+            if llenas:
+                # Columnas enteras de este segmento: una barra sin pasar por `ocupacion`.
+                volcar()
+                _anadir(barras, borde, borde + llenas, pid, False)
+                columna = -1
+                a += llenas
+    volcar()
+    return barras
+
+
+def renderizar(
+    segmentos: Timeline | Sequence[dict[str, Any]],
+    formato: str,
+    *,
+    ancho: int = 800,
+    alto: int = 60,
+    inicio: int = 0,
+    fin: int | None = None,
+) -> bytes:
+    """Gantt de la ventana [inicio, fin) como SVG o PNG de ancho x alto píxeles."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+    if not (1 <= ancho <= ANCHO_MAX and _ALTO_EJE < alto <= ALTO_MAX):
+        raise ValueError(f"El tamaño debe estar entre 1x{_ALTO_EJE + 1} y {ANCHO_MAX}x{ALTO_MAX}")
+    if fin is None:
+        fin = fin_timeline(segmentos)
+    fin = max(fin, inicio + 1)
+    barras = reducir(segmentos, ancho, inicio, fin)
+    if formato == "svg":
+        return _svg(barras, ancho, alto, inicio, fin).encode()
+    return _png(barras, ancho, alto, inicio, fin)
+
+
+def clave_imagen(
+    clave: str, formato: str, ancho: int, alto: int, inicio: int, fin: int | None
+) -> str:
+    """Clave de caché de una imagen: el hash del resultado más la vista pedida."""
+    return f"{clave}:{formato}:{ancho}x{alto}:{inicio}-{'fin' if fin is None else fin}"
+
+
+# ---------- auxiliares ----------
+
+
+def _ventana(
+    segmentos: Timeline | Sequence[dict[str, Any]], inicio: int, fin: int
+) -> Iterator[tuple[int, int | None, int]]:
+    if isinstance(segmentos, Timeline):
+        yield from segmentos.window(inicio, fin)
+        return
+    indice = max(0, bisect_right(segmentos, inicio, key=lambda s: s["t"]) - 1)
+    for indice in range(indice, len(segmentos)):
+        segmento = segmentos[indice]
+        t, dur = segmento["t"], segmento["dur"]
+        if t >= fin:
+            break
+        if t + dur <= inicio:
+            continue
+        desde = max(t, inicio)
+        yield desde, segmento["pid"], min(t + dur, fin) - desde
+
+
+def _anadir(barras: list[Barra], x0: int, x1: int, pid: int | None, mezcla: bool) -> None:
+    if barras and barras[-1].pid == pid and barras[-1].x1 == x0:
+        anterior = barras.pop()
+        barras.append(Barra(anterior.x0, x1, pid, anterior.mezcla or mezcla))
+    else:
+        barras.append(Barra(x0, x1, pid, mezcla))
+
+
+def _marcas(inicio: int, fin: int, ancho: int) -> list[tuple[int, int]]:
+    """(x, t) de las marcas del eje: pasos 1/2/5 x 10^k, una cada ~100 px."""
+    bruto = (fin - inicio) / max(1, ancho // 100)
+    potencia = 10 ** max(0, math.floor(math.log10(bruto))) if bruto >= 1 else 1
+    paso = next((p * potencia for p in (1, 2, 5, 10) if p * potencia >= bruto), 10 * potencia)
+    escala = ancho / (fin - inicio)
+    primero = -(-inicio // paso) * paso
+    return [(round((t - inicio) * escala), t) for t in range(primero, fin + 1, paso)]
+
+
+def _etiqueta(barra: Barra, inicio: int, escala: float) -> str:
+    nombre = "CPU ociosa" if barra.pid is None else f"P{barra.pid}"
+    if barra.mezcla:
+        nombre += " y otros"
+    desde = inicio + math.floor(barra.x0 / escala)
+    hasta = inicio + math.ceil(barra.x1 / escala)
+    return f"{nombre} · t={desde}–{hasta}"
+
+
+def _svg(barras: list[Barra], ancho: int, alto: int, inicio: int, fin: int) -> str:
+    carril = alto - _ALTO_EJE
+    escala = ancho / (fin - inicio)
+    partes = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{ancho}" height="{alto}" '
+        f'viewBox="0 0 {ancho} {alto}" shape-rendering="crispEdges" font-family="sans-serif" font-size="10">'
+    ]
+    for barra in barras:
+        partes.append(
+            f'<rect x="{barra.x0}" y="0" width="{barra.x1 - barra.x0}" height="{carril}" '
+            f'fill="{color(barra.pid)}"><title>{_etiqueta(barra, inicio, escala)}</title></rect>'
+        )
+    partes.append(f'<line x1="0" y1="{carril}" x2="{ancho}" y2="{carril}" stroke="{_COLOR_EJE}"/>')
+    for x, t in _marcas(inicio, fin, ancho):
+        anclaje = "end" if x >= ancho - 20 else "start"
+        partes.append(
+            f'<line x1="{x}" y1="{carril}" x2="{x}" y2="{carril + 4}" stroke="{_COLOR_EJE}"/>'
+            f'<text x="{x + (2 if anclaje == "start" else -2)}" y="{alto - 3}" '
+            f'fill="{_COLOR_EJE}" text-anchor="{anclaje}">{t}</text>'
+        )
+    partes.append("</svg>")
+    return "".join(partes)
+
+
+def _png(barras: list[Barra], ancho: int, alto: int, inicio: int, fin: int) -> bytes:
+    from PIL import Image, ImageDraw  # pylint: disable=import-outside-toplevel
+
+    carril = alto - _ALTO_EJE
+    imagen = Image.new("RGB", (ancho, alto), "white")
+    dibujo = ImageDraw.Draw(imagen)
+    for barra in barras:
+        dibujo.rectangle((barra.x0, 0, barra.x1 - 1, carril - 1), fill=color(barra.pid))
+    dibujo.line((0, carril, ancho, carril), fill=_COLOR_EJE)
+    for x, t in _marcas(inicio, fin, ancho):
+        dibujo.line((x, carril, x, carril + 4), fill=_COLOR_EJE)
+        texto = str(t)
+        if x >= ancho - 20:
+            x -= int(dibujo.textlength(texto)) + 4
+        dibujo.text((x + 2, carril + 3), texto, fill=_COLOR_EJE)
+    salida = io.BytesIO()
+    imagen.save(salida, format="PNG", optimize=True)
+    return salida.getvalue()
@@ -0,0 +1,129 @@
+"""
+Ejecución de muchas cargas independientes en una sola petición.
+
+Cada carga es {"procesos": [...], "algoritmo": str, "quantum": int|None,
+"id": opcional}, más las opciones del algoritmo si las tiene (MLFQ:
+"niveles", "boost"; CFS: "latencia", "granularidad"). Las simulaciones corren en un pool de procesos y se
+entregan en orden de finalización, así la API puede escribir cada
+resultado en cuanto está listo. Con una caché, los aciertos se entregan
+de inmediato y solo los fallos viajan al pool.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from .cache import OPCIONES_ALGORITMO, CacheResultados, clave_resultado
+from .metrics import Resultado, resultado_a_dict
+from .scheduler import Planificador
+
+
+def simular_lote(
+    cargas: Sequence[Dict[str, Any]],
+    *,
+    max_workers: int | None = None,
+    cache: CacheResultados | None = None,
+    timeline: bool = False,
+    timeline_page: int = 1,
+    timeline_page_size: int = 500,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Simula cada carga y entrega un dict por carga en cuanto termina:
+    {"index", "id", "algoritmo", "quantum", "resultado"} o, si la carga
+    falla, {"index", "id", "error"}. Cerrar el iterador cancela lo pendiente.
+    """
+    opciones = {
+        "timeline": timeline,
+        "timeline_page": timeline_page,
+        "timeline_page_size": timeline_page_size,
+    }
+    pendientes: List[tuple[int, str | None]] = []
+    for index, carga in enumerate(cargas):
+        clave = None
+        if cache is not None:
+            try:
+                clave = clave_resultado(
+                    carga["procesos"],
+                    carga["algoritmo"],
+                    carga.get("quantum"),
+                    Planificador.IO_CONFIG,
+                    opciones_carga(carga),
+                )
+            except (KeyError, TypeError, ValueError) as exc:
+                yield _error(index, carga, exc)
+                continue
+            resultado = cache.obtener(clave)
+            if resultado is not None:
+                yield _linea(index, carga, resultado, opciones)
+                continue
+        pendientes.append((index, clave))
+
+    if not pendientes:
+        return
+    if max_workers == 1 or len(pendientes) == 1:
+        for index, clave in pendientes:
+            yield _resolver(index, clave, cargas[index], partial(_simular, cargas[index]), cache, opciones)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futuros: Dict[Future, tuple[int, str | None]] = {
+            pool.submit(_simular, cargas[index]): (index, clave) for index, clave in pendientes
+        }
+        try:
+            restantes = set(futuros)
+            while restantes:
+                listos, restantes = wait(restantes, return_when=FIRST_COMPLETED)
+                for futuro in listos:
+                    index, clave = futuros[futuro]
+                    yield _resolver(index, clave, cargas[index], futuro.result, cache, opciones)
+        finally:
+            for futuro in futuros:
+                futuro.cancel()
+
+
+def opciones_carga(carga: Dict[str, Any]) -> Dict[str, Any] | None:
+    """Opciones del algoritmo de una carga (None si el algoritmo no tiene)."""
+    nombres = OPCIONES_ALGORITMO.get(carga.get("algoritmo"))
+    if nombres is None:
+        return None
+    return {nombre: carga.get(nombre) for nombre in nombres}
+
+
+def _simular(carga: Dict[str, Any]) -> Resultado:
+    return Planificador()._run(
+        carga["procesos"], carga["algoritmo"], carga.get("quantum"), opciones=opciones_carga(carga)
+    )
+
+
+def _resolver(
+    index: int,
+    clave: str | None,
+    carga: Dict[str, Any],
+    obtener: Callable[[], Resultado],
+    cache: CacheResultados | None,
+    opciones: Dict[str, Any],
+) -> Dict[str, Any]:
+    try:
+        resultado = obtener()
+    except Exception as exc:  # pylint: disable=broad-except
+        return _error(index, carga, exc)
+    if cache is not None and clave is not None:
+        resultado.clave = clave
+        cache.guardar(clave, resultado)
+    return _linea(index, carga, resultado, opciones)
+
+
+def _linea(index: int, carga: Dict[str, Any], resultado: Resultado, opciones: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "id": carga.get("id"),
+        "algoritmo": carga["algoritmo"],
+        "quantum": carga.get("quantum"),
+        "resultado": resultado_a_dict(resultado, **opciones),
+    }
+
+
+def _error(index: int, carga: Dict[str, Any], exc: Exception) -> Dict[str, Any]:
+    return {"index": index, "id": carga.get("id"), "error": str(exc)}
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, List
+from dataclasses import dataclass, field
+from typing import Any, List, Sequence
 
-from .engine.metrics import SimulationMetrics
+from .engine.batch import BatchSchedule
+from .engine.histogram import LatencyHistograms
+from .engine.metrics import RunningStat, SimulationMetrics
 from .engine.simulator import SchedulerSimulator
 from .engine.pcb import PCB
+from .engine.timeline import Timeline
 
 
 @dataclass
 class Resultado:
-    timeline: list[dict[str, Any]]
+    timeline: Timeline
     completed: list[dict[str, Any]]
     avg_wait: float
     avg_turnaround: float
@@ -19,6 +22,16 @@ class Resultado:
     throughput: float | None
     cpu_utilization: float | None
     context_switches: int
+    # count/mean/stddev/min/max por métrica ("waiting", "turnaround", "response")
+    resumen: dict[str, dict[str, float | None]] = field(default_factory=dict)
+    # count/p50/p95/p99/max de "waiting" y "response", global y por usuario
+    percentiles: dict[str, dict[str, int | None]] = field(default_factory=dict)
+    percentiles_por_usuario: dict[str, dict[str, dict[str, int | None]]] = field(
+        default_factory=dict
+    )
+    # clave_resultado cuando Planificador simula con caché o con_clave;
+    # identifica el resultado para pedir su Gantt en /sim/gantt/<clave>.svg.
+    clave: str | None = None
 
 
 def construir_resultado(
@@ -48,27 +61,13 @@ def construir_resultado(
             }
         )
 
-    # Promedios a partir de metrics.processes
-    waits = [
-        p.waiting_time for p in metrics.processes if p.waiting_time is not None
-    ]
-    turns = [
-        p.turnaround_time for p in metrics.processes if p.turnaround_time is not None
-    ]
-    resps = [
-        p.response_time for p in metrics.processes if p.response_time is not None
-    ]
-
-    avg_wait = sum(waits) / len(waits) if waits else 0.0
-    avg_turn = sum(turns) / len(turns) if turns else 0.0
-    avg_resp = sum(resps) / len(resps) if resps else 0.0
-
-    # Makespan: último tiempo de finalización
-    makespan = 0
-    if pcbs:
-        finishes = [pcb.finish_time for pcb in pcbs if pcb.finish_time is not None]
-        if finishes:
-            makespan = max(finishes)
+    # Promedios a partir de los acumuladores en línea (no requieren metrics.processes)
+    avg_wait = metrics.waiting.mean
+    avg_turn = metrics.turnaround.mean
+    avg_resp = metrics.response.mean
+
+    # Makespan: último tiempo de finalización (también sin PCBs retenidos)
+    makespan = metrics.makespan
 
     return Resultado(
         timeline=sim.timeline,
@@ -80,4 +79,124 @@ def construir_resultado(
         throughput=metrics.throughput,
         cpu_utilization=metrics.cpu_utilization,
         context_switches=metrics.context_switches,
+        resumen={
+            "waiting": metrics.waiting.as_dict(),
+            "turnaround": metrics.turnaround.as_dict(),
+            "response": metrics.response.as_dict(),
+        },
+        percentiles=metrics.latency.summary(),
+        percentiles_por_usuario={
+            usuario: hist.summary() for usuario, hist in sorted(metrics.latency_by_user.items())
+        },
+    )
+
+
+def construir_resultado_lote(
+    pids: Sequence[int],
+    llegadas: Sequence[int],
+    rafagas: Sequence[int],
+    schedule: BatchSchedule,
+    usuarios: Sequence[str] | None = None,
+) -> Resultado:
+    """
+    Equivalente de construir_resultado para un BatchSchedule: produce el mismo
+    Resultado que daría el simulador sin instanciar PCBs ni recorrer ticks.
+    """
+    timeline = Timeline()
+    completed_info: list[dict[str, Any]] = []
+    clock = 0
+    for idx in schedule.order:
+        inicio = schedule.start[idx]
+        fin = schedule.finish[idx]
+        timeline.record(clock, None, inicio - clock)
+        timeline.record(inicio, pids[idx], fin - inicio)
+        clock = fin
+        completed_info.append(
+            {
+                "pid": pids[idx],
+                "arrival_time": llegadas[idx],
+                "burst_time": rafagas[idx],
+                "start_time": inicio,
+                "finish_time": fin,
+                "waiting_time": schedule.waiting[idx],
+                "turnaround_time": schedule.turnaround[idx],
+                "response_time": schedule.response[idx],
+            }
+        )
+
+    resumen = {nombre: RunningStat() for nombre in ("waiting", "turnaround", "response")}
+    latencia = LatencyHistograms()
+    por_usuario: dict[str, LatencyHistograms] = {}
+    for idx in schedule.order:
+        resumen["waiting"].add(schedule.waiting[idx])
+        resumen["turnaround"].add(schedule.turnaround[idx])
+        resumen["response"].add(schedule.response[idx])
+        latencia.record(schedule.waiting[idx], schedule.response[idx])
+        usuario = "root" if usuarios is None else usuarios[idx]
+        por_usuario.setdefault(usuario, LatencyHistograms()).record(
+            schedule.waiting[idx], schedule.response[idx]
+        )
+
+    n = len(schedule.order)
+    return Resultado(
+        timeline=timeline,
+        completed=completed_info,
+        avg_wait=sum(schedule.waiting) / n if n else 0.0,
+        avg_turnaround=sum(schedule.turnaround) / n if n else 0.0,
+        avg_response=sum(schedule.response) / n if n else 0.0,
+        makespan=schedule.makespan,
+        throughput=schedule.throughput,
+        cpu_utilization=schedule.cpu_utilization,
+        context_switches=schedule.context_switches,
+        resumen={nombre: stat.as_dict() for nombre, stat in resumen.items()},
+        percentiles=latencia.summary(),
+        percentiles_por_usuario={
+            usuario: hist.summary() for usuario, hist in sorted(por_usuario.items())
+        },
     )
+
+
+def resultado_a_dict(
+    resultado: Resultado,
+    *,
+    timeline: bool = False,
+    timeline_page: int = 1,
+    timeline_page_size: int = 500,
+    procesos: bool = True,
+) -> dict[str, Any]:
+    """
+    Vista JSON de un Resultado. La línea de tiempo es opcional y se entrega
+    paginada: {"page", "page_size", "total", "segments"} con la página
+    `timeline_page` (base 1) de `timeline_page_size` segmentos. Con
+    `procesos=False` se omiten las filas por proceso ("completed") y queda
+    solo el resumen, de tamaño independiente de la carga.
+    """
+    datos: dict[str, Any] = {
+        "avg_wait": resultado.avg_wait,
+        "avg_turnaround": resultado.avg_turnaround,
+        "avg_response": resultado.avg_response,
+        "makespan": resultado.makespan,
+        "throughput": resultado.throughput,
+        "cpu_utilization": resultado.cpu_utilization,
+        "context_switches": resultado.context_switches,
+        "resumen": resultado.resumen,
+        "percentiles": resultado.percentiles,
+        "percentiles_por_usuario": resultado.percentiles_por_usuario,
+    }
+    if procesos:
+        datos = {"completed": resultado.completed, **datos}
+    if timeline:
+        datos["timeline"] = pagina_timeline(resultado.timeline, timeline_page, timeline_page_size)
+    return datos
+
+
+def pagina_timeline(segmentos: Sequence[Any], page: int, page_size: int) -> dict[str, Any]:
+    """Página `page` (base 1) de una Timeline o de una lista de segmentos ya serializada."""
+    page = max(1, page)
+    inicio = (page - 1) * page_size
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total": len(segmentos),
+        "segments": list(segmentos[inicio : inicio + page_size]),
+    }
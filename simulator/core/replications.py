@@ -0,0 +1,224 @@
+"""
+Réplicas Monte Carlo con semilla para configuraciones con I/O aleatoria.
+
+Cada réplica ejecuta la misma carga con una semilla derivada de
+`base_seed`, así que un estudio completo se puede reproducir. Las réplicas
+corren en un pool de procesos y sus métricas se entregan por orden de
+índice, sea cual sea el orden en que terminen: el estudio se detiene en
+cuanto todos los intervalos de confianza alcanzan la precisión pedida y
+el conjunto de réplicas aceptadas no depende de `max_workers`.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import math
+import os
+import statistics
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterator, Sequence
+
+from .engine.histogram import LatencyHistograms
+from .engine.pcb import PCB
+from .engine.simulator import SchedulerSimulator, SimulationConfig
+
+METRICAS = ("avg_wait", "avg_turnaround", "avg_response", "throughput", "cpu_utilization")
+
+
+@dataclass(slots=True)
+class MetricEstimate:
+    """Media muestral con su intervalo de confianza (media ± half_width)."""
+
+    mean: float
+    half_width: float
+    stddev: float
+    n: int
+
+    @property
+    def low(self) -> float:
+        return self.mean - self.half_width
+
+    @property
+    def high(self) -> float:
+        return self.mean + self.half_width
+
+
+@dataclass(slots=True)
+class ReplicationReport:
+    """Resumen de un estudio de réplicas."""
+
+    replications: int
+    confidence: float
+    estimates: dict[str, MetricEstimate] = field(default_factory=dict)
+    converged: bool = False
+    samples: list[dict[str, float]] = field(default_factory=list)
+    # Histogramas de todas las réplicas aceptadas, combinados sin muestras crudas.
+    latency: LatencyHistograms = field(default_factory=LatencyHistograms)
+    latency_by_user: dict[str, LatencyHistograms] = field(default_factory=dict)
+
+
+def replication_seed(base_seed: int, index: int) -> int:
+    """Semilla independiente y estable para la réplica `index`."""
+    digest = hashlib.blake2b(f"{base_seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def iter_replications(
+    config: SimulationConfig,
+    jobs: Sequence[PCB],
+    *,
+    replications: int,
+    base_seed: int = 0,
+    max_workers: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Ejecuta hasta `replications` réplicas y entrega las métricas de cada una
+    por orden de índice, junto con sus histogramas ("latency",
+    "latency_by_user"). Las que terminan antes de tiempo esperan a las
+    anteriores; la ventana de réplicas en vuelo incluye las que esperan, así
+    que la memoria sigue acotada. Si el consumidor deja de iterar, las
+    réplicas que aún no empezaron se cancelan.
+    """
+    if max_workers == 1:
+        for index in range(replications):
+            yield _replicar(config, jobs, index, replication_seed(base_seed, index))
+        return
+
+    # Ventana acotada de réplicas en vuelo para poder parar pronto.
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pending: set[Future] = set()
+        finished: dict[int, dict[str, Any]] = {}
+        submitted = 0
+        following = 0
+        try:
+            while following < replications:
+                while submitted < replications and len(pending) + len(finished) < window:
+                    pending.add(
+                        pool.submit(
+                            _replicar, config, jobs, submitted,
+                            replication_seed(base_seed, submitted),
+                        )
+                    )
+                    submitted += 1
+                if following not in finished:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        sample = future.result()
+                        finished[sample["replica"]] = sample
+                while following in finished:
+                    yield finished.pop(following)
+                    following += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run_replications(
+    config: SimulationConfig,
+    jobs: Sequence[PCB],
+    *,
+    max_replications: int = 30,
+    min_replications: int = 5,
+    target_precision: float | None = None,
+    confidence: float = 0.95,
+    base_seed: int = 0,
+    max_workers: int | None = None,
+) -> ReplicationReport:
+    """
+    Estima la media de cada métrica en METRICAS con intervalos de confianza t.
+
+    Con `target_precision` (relativa, p. ej. 0.05 = ±5 % de la media) el
+    estudio se detiene al alcanzarla en todas las métricas, tras al menos
+    `min_replications` réplicas. Las réplicas se aceptan por orden de
+    índice, así que el informe solo depende de `base_seed`, no de
+    `max_workers`.
+    """
+    report = ReplicationReport(replications=0, confidence=confidence)
+    stream = iter_replications(
+        config, jobs, replications=max_replications, base_seed=base_seed, max_workers=max_workers
+    )
+    with closing(stream):
+        for sample in stream:
+            report.latency.merge(sample.pop("latency"))
+            for usuario, hist in sample.pop("latency_by_user").items():
+                report.latency_by_user.setdefault(usuario, LatencyHistograms()).merge(hist)
+            report.samples.append(sample)
+            report.replications += 1
+            if report.replications < max(2, min_replications):
+                continue
+            report.estimates = _estimar(report.samples, confidence)
+            if target_precision is not None and _precision_alcanzada(
+                report.estimates, target_precision
+            ):
+                report.converged = True
+                break
+    if len(report.samples) >= 2 and not report.converged:
+        report.estimates = _estimar(report.samples, confidence)
+    return report
+
+
+def _replicar(config: SimulationConfig, jobs: Sequence[PCB], index: int, seed: int) -> dict[str, Any]:
+    run_config = replace(
+        config, algorithm=copy.deepcopy(config.algorithm), seed=seed, summary_only=True
+    )
+    sim = SchedulerSimulator(run_config)
+    sim.load_jobs(copy.deepcopy(list(jobs)))
+    metrics = sim.run()
+
+    return {
+        "replica": index,
+        "seed": seed,
+        "avg_wait": metrics.waiting.mean,
+        "avg_turnaround": metrics.turnaround.mean,
+        "avg_response": metrics.response.mean,
+        "throughput": metrics.throughput or 0.0,
+        "cpu_utilization": metrics.cpu_utilization or 0.0,
+        "latency": metrics.latency,
+        "latency_by_user": metrics.latency_by_user,
+    }
+
+
+def _estimar(samples: list[dict[str, float]], confidence: float) -> dict[str, MetricEstimate]:
+    n = len(samples)
+    t = t_critical(confidence, n - 1)
+    estimates: dict[str, MetricEstimate] = {}
+    for name in METRICAS:
+        values = [sample[name] for sample in samples]
+        mean = statistics.fmean(values)
+        stddev = statistics.stdev(values)
+        estimates[name] = MetricEstimate(
+            mean=mean, half_width=t * stddev / math.sqrt(n), stddev=stddev, n=n
+        )
+    return estimates
+
+
+def _precision_alcanzada(estimates: dict[str, MetricEstimate], target: float) -> bool:
+    return all(
+        est.half_width <= target * abs(est.mean) if est.mean else est.half_width == 0
+        for est in estimates.values()
+    )
+
+
+def t_critical(confidence: float, df: int) -> float:
+    """Cuantil bilateral de la t de Student (exacto para df<=2, Cornish-Fisher después)."""
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+    if df < 1:
+        raise ValueError("df must be >= 1")
+    p = 1 - (1 - confidence) / 2
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = statistics.NormalDist().inv_cdf(p)
+    z3, z5, z7 = z**3, z**5, z**7
+    return (
+        z
+        + (z3 + z) / (4 * df)
+        + (5 * z5 + 16 * z3 + 3 * z) / (96 * df**2)
+        + (3 * z7 + 19 * z5 + 17 * z3 - 15 * z) / (384 * df**3)
+    )
@@ -1,13 +1,70 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Mapping
 
+from .engine.algorithms.base import SchedulingAlgorithm
+from .engine.algorithms.cfs import CFSAlgorithm
 from .engine.algorithms.fcfs import FCFSAlgorithm
+from .engine.algorithms.mlfq import MLFQAlgorithm
 from .engine.algorithms.sjf import SJFAlgorithm
 from .engine.algorithms.rr import RoundRobinAlgorithm
+from .engine.algorithms.srtf import SRTFAlgorithm
+from .cache import CacheResultados, clave_resultado, normalizar_opciones, normalizar_procesos
+from .engine.batch import BATCH_ALGORITHMS, evaluate
 from .engine.pcb import PCB
-from .engine.simulator import SchedulerSimulator, SimulationConfig
-from .metrics import Resultado, construir_resultado
+from .engine.process_table import ProcessTable
+from .engine.simulator import SchedulerSimulator, SimulationConfig, SimulationStep
+from .metrics import Resultado, construir_resultado, construir_resultado_lote
+
+
+MAX_NIVELES_MLFQ = 16
+
+# Filas {"pid", "llegada", "rafaga", ...} o una carga columnar.
+Procesos = List[Dict[str, Any]] | ProcessTable
+
+
+def crear_algoritmo(
+    algoritmo: str, quantum: int | None = None, opciones: Mapping[str, Any] | None = None
+) -> SchedulingAlgorithm:
+    """
+    Instancia el algoritmo por nombre ("fcfs", "sjf", "srtf", "rr", "mlfq", "cfs").
+
+    `opciones` (ver OPCIONES_ALGORITMO) las usan:
+      - MLFQ: {"niveles": 3, "boost": None}. El quantum del nivel i es
+        quantum * 2**i y "boost" es el periodo (en ticks) con el que todos
+        los procesos vuelven al nivel 0 (None = sin boost).
+      - CFS: {"latencia": 24, "granularidad": 3}, la latencia objetivo y la
+        granularidad mínima en ticks. La prioridad de cada proceso se lee
+        como valor nice (-20..19).
+    """
+    if algoritmo == "fcfs":
+        return FCFSAlgorithm()
+    if algoritmo == "sjf":
+        return SJFAlgorithm()
+    if algoritmo == "srtf":
+        return SRTFAlgorithm()
+    if algoritmo == "rr":
+        if quantum is None or quantum <= 0:
+            quantum = 2
+        return RoundRobinAlgorithm(quantum=quantum)
+    if algoritmo == "mlfq":
+        if quantum is None or quantum <= 0:
+            quantum = 2
+        opciones = normalizar_opciones(algoritmo, opciones)
+        niveles = opciones["niveles"]
+        if not 1 <= niveles <= MAX_NIVELES_MLFQ:
+            raise ValueError(f"niveles debe estar entre 1 y {MAX_NIVELES_MLFQ}")
+        return MLFQAlgorithm(
+            quanta=[quantum << nivel for nivel in range(niveles)],
+            boost_interval=opciones["boost"],
+        )
+    if algoritmo == "cfs":
+        opciones = normalizar_opciones(algoritmo, opciones)
+        return CFSAlgorithm(
+            target_latency=opciones["latencia"], min_granularity=opciones["granularidad"]
+        )
+    raise ValueError(f"Algoritmo no soportado: {algoritmo}")
 
 
 class Planificador:
@@ -16,17 +73,29 @@ class Planificador:
 
     Recibe una lista de diccionarios:
       {"pid": 1, "llegada": 0, "rafaga": 5, "prioridad": 0, "usuario": "usuario1"}
+    o una ProcessTable (p. ej. una carga binaria abierta con `open_workload`)
     y devuelve un Resultado listo para el template.
+
+    Con `cache`, las simulaciones repetidas (misma carga normalizada,
+    algoritmo, quantum y configuración de I/O) se sirven sin simular. Con
+    caché o con `con_clave`, el Resultado lleva su clave_resultado.
     """
 
+    # Configuración de I/O con la que simula la fachada; forma parte de la clave de caché.
+    IO_CONFIG = {"io_enabled": False}
+
+    def __init__(self, cache: CacheResultados | None = None, *, con_clave: bool = False) -> None:
+        self.cache = cache
+        self.con_clave = con_clave
+
     def _pcbs_from_procesos(self, procesos: List[Dict[str, Any]]) -> list[PCB]:
         pcbs: list[PCB] = []
         for p in procesos:
             pid = int(p["pid"])
             llegada = int(p.get("llegada", 0))
             rafaga = int(p.get("rafaga", 0))
-            prioridad = p.get("prioridad")
-            usuario = p.get("usuario", "root")
+            prioridad = None if p.get("prioridad") is None else int(p["prioridad"])
+            usuario = str(p.get("usuario", "root"))
 
             pcb = PCB(
                 pid=pid,
@@ -42,44 +111,166 @@ class Planificador:
             pcbs.append(pcb)
         return pcbs
 
+    def tabla(self, procesos: Procesos) -> ProcessTable:
+        """
+        Valida y convierte la carga una sola vez a una ProcessTable. Cada
+        simulación sobre ella parte de `fresh()`, así que puede reutilizarse
+        con todos los algoritmos (ver core.comparacion). Lanza ValueError
+        indicando la fila si algún proceso no es válido.
+        """
+        if isinstance(procesos, ProcessTable):
+            return procesos
+        tabla = ProcessTable()
+        for p in normalizar_procesos(procesos):
+            tabla.append(
+                p["pid"],
+                p["llegada"],
+                p["rafaga"],
+                priority=p["prioridad"],
+                usuario=p["usuario"],
+                io_enabled=self.IO_CONFIG["io_enabled"],
+            )
+        return tabla
+
+    def _columnas_from_procesos(
+        self, procesos: List[Dict[str, Any]]
+    ) -> tuple[list[int], list[int], list[int], list[str]]:
+        pids = [int(p["pid"]) for p in procesos]
+        llegadas = [int(p.get("llegada", 0)) for p in procesos]
+        rafagas = [int(p.get("rafaga", 0)) for p in procesos]
+        usuarios = [str(p.get("usuario", "root")) for p in procesos]
+        return pids, llegadas, rafagas, usuarios
+
     def _run(
         self,
-        procesos: List[Dict[str, Any]],
+        procesos: Procesos,
         algoritmo: str,
         quantum: int | None = None,
+        progreso: Callable[[int, int | None], None] | None = None,
+        opciones: Mapping[str, Any] | None = None,
+        cancelar: threading.Event | None = None,
     ) -> Resultado:
-        pcbs = self._pcbs_from_procesos(procesos)
-
-        if algoritmo == "fcfs":
-            alg = FCFSAlgorithm()
-        elif algoritmo == "sjf":
-            alg = SJFAlgorithm()
-        elif algoritmo == "rr":
-            if quantum is None or quantum <= 0:
-                quantum = 2
-            alg = RoundRobinAlgorithm(quantum=quantum)
-        else:
-            raise ValueError(f"Algoritmo no soportado: {algoritmo}")
+        """
+        Simula (o sirve desde la caché) una carga. `progreso(terminados, total)`
+        se llama a medida que terminan procesos; si lanza una excepción, la
+        simulación se aborta y la excepción se propaga. `opciones` son las
+        del algoritmo (ver crear_algoritmo). Las filas se normalizan antes
+        de calcular la clave y de simular (ver normalizar_procesos).
+
+        Si otro hilo activa `cancelar`, el motor por ticks se detiene y lanza
+        SimulationCancelled; FCFS y SJF (solución cerrada) no se interrumpen.
+        """
+        if not isinstance(procesos, ProcessTable):
+            procesos = normalizar_procesos(procesos)
+        if self.cache is None and not self.con_clave:
+            return self._simular(procesos, algoritmo, quantum, progreso, opciones, cancelar)
+        clave = clave_resultado(procesos, algoritmo, quantum, self.IO_CONFIG, opciones)
+        resultado = self.cache.obtener(clave) if self.cache is not None else None
+        if resultado is None:
+            resultado = self._simular(procesos, algoritmo, quantum, progreso, opciones, cancelar)
+            resultado.clave = clave
+            if self.cache is not None:
+                self.cache.guardar(clave, resultado)
+        return resultado
+
+    def _simular(
+        self,
+        procesos: Procesos | List[PCB],
+        algoritmo: str,
+        quantum: int | None = None,
+        progreso: Callable[[int, int | None], None] | None = None,
+        opciones: Mapping[str, Any] | None = None,
+        cancelar: threading.Event | None = None,
+    ) -> Resultado:
+        if algoritmo in BATCH_ALGORITHMS:
+            # Sin I/O, FCFS y SJF tienen solución cerrada: no hace falta el bucle de ticks.
+            if isinstance(procesos, ProcessTable):
+                pids, llegadas, rafagas = procesos.pid, procesos.arrival, procesos.burst
+                usuarios = [procesos.usuarios[codigo] for codigo in procesos.usuario]
+            else:
+                pids, llegadas, rafagas, usuarios = self._columnas_from_procesos(procesos)
+            schedule = evaluate(llegadas, rafagas, algoritmo)
+            if progreso is not None:
+                progreso(len(pids), len(pids))
+            return construir_resultado_lote(pids, llegadas, rafagas, schedule, usuarios)
+
+        alg = crear_algoritmo(algoritmo, quantum, opciones)
 
         config = SimulationConfig(
             algorithm=alg,
             time_slice=None,      # usamos el quantum del algoritmo tal cual
             max_time=None,
-            io_enabled=False,     # I/O desactivado por ahora (lo puedes exponer en el form luego)
+            # I/O desactivado por ahora (lo puedes exponer en el form luego)
+            io_enabled=self.IO_CONFIG["io_enabled"],
+            cancel_event=cancelar,
         )
 
         sim = SchedulerSimulator(config)
-        sim.load_jobs(pcbs)
-        metrics = sim.run()
+        self._cargar(sim, procesos)
+        metrics = sim.run(progreso)
         return construir_resultado(sim, metrics)
 
+    def pasos(
+        self,
+        procesos: Procesos,
+        algoritmo: str,
+        quantum: int | None = None,
+        *,
+        tamano_lote: int = 256,
+        opciones: Mapping[str, Any] | None = None,
+    ) -> Iterator[SimulationStep]:
+        """
+        Simulación incremental para la vista en vivo: entrega un
+        SimulationStep cada `tamano_lote` eventos. Usa el motor por eventos
+        para todos los algoritmos (mismos resultados que `_run`).
+        """
+        config = SimulationConfig(
+            algorithm=crear_algoritmo(algoritmo, quantum, opciones),
+            io_enabled=self.IO_CONFIG["io_enabled"],
+            engine="event",
+        )
+        if not isinstance(procesos, ProcessTable):
+            procesos = normalizar_procesos(procesos)
+        sim = SchedulerSimulator(config)
+        self._cargar(sim, procesos)
+        return sim.iter_run(batch_size=tamano_lote)
+
+    def _cargar(self, sim: SchedulerSimulator, procesos: Procesos | List[PCB]) -> None:
+        if isinstance(procesos, ProcessTable):
+            # Estado de ejecución nuevo; las columnas estáticas (quizá mapeadas) se comparten.
+            sim.load_table(procesos.fresh())
+        elif procesos and isinstance(procesos[0], PCB):
+            # PCBs nuevos de una carga ya validada (ver core.comparacion).
+            sim.load_jobs(procesos)
+        else:
+            sim.load_jobs(self._pcbs_from_procesos(procesos))
+
     # ---- Métodos públicos para la vista (mantienen la interfaz) ----
 
-    def fcfs(self, procesos: List[Dict[str, Any]]) -> Resultado:
+    def fcfs(self, procesos: Procesos) -> Resultado:
         return self._run(procesos, algoritmo="fcfs")
 
-    def round_robin(self, procesos: List[Dict[str, Any]], quantum: int = 2) -> Resultado:
+    def round_robin(self, procesos: Procesos, quantum: int = 2) -> Resultado:
         return self._run(procesos, algoritmo="rr", quantum=quantum)
 
-    def sjf(self, procesos: List[Dict[str, Any]]) -> Resultado:
+    def sjf(self, procesos: Procesos) -> Resultado:
         return self._run(procesos, algoritmo="sjf")
+
+    def srtf(self, procesos: Procesos) -> Resultado:
+        return self._run(procesos, algoritmo="srtf")
+
+    def mlfq(
+        self,
+        procesos: Procesos,
+        quantum: int = 2,
+        niveles: int = 3,
+        boost: int | None = None,
+    ) -> Resultado:
+        return self._run(
+            procesos, algoritmo="mlfq", quantum=quantum, opciones={"niveles": niveles, "boost": boost}
+        )
+
+    def cfs(self, procesos: Procesos, latencia: int = 24, granularidad: int = 3) -> Resultado:
+        return self._run(
+            procesos, algoritmo="cfs", opciones={"latencia": latencia, "granularidad": granularidad}
+        )
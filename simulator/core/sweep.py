@@ -0,0 +1,143 @@
+"""
+Barrido de parámetros: la misma carga con varios (algoritmo, quantum, config)
+repartidos en un pool de procesos.
+
+La carga se valida con Planificador.tabla (las mismas reglas que el resto
+de la aplicación) y se publica una sola vez en memoria compartida como
+columnas int64 (pid, llegada, rafaga, prioridad); cada worker la adjunta al
+arrancar y reconstruye PCBs nuevos por caso, así que solo viajan por pickle
+los casos y las filas de resultado.
+"""
+
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import shared_memory
+from typing import Any, Iterable, Mapping
+
+from .engine.pcb import PCB
+from .engine.simulator import SchedulerSimulator, SimulationConfig
+from .metrics import construir_resultado
+from .engine.process_table import ProcessTable
+from .scheduler import Planificador, Procesos, crear_algoritmo
+
+# Valor de la columna prioridad cuando el proceso no trae prioridad (el de ProcessTable).
+_SIN_PRIORIDAD = -(1 << 63)
+_COLUMNAS = 4
+
+
+@dataclass(frozen=True)
+class SweepCase:
+    """
+    Una combinación a evaluar dentro del barrido. `opciones` son las del
+    algoritmo (ver crear_algoritmo: niveles/boost de MLFQ, latencia/
+    granularidad de CFS) y `seed` la semilla de la I/O aleatoria, sin la
+    cual los casos con `io_enabled` no son reproducibles.
+    """
+
+    algoritmo: str
+    quantum: int | None = None
+    io_enabled: bool = False
+    engine: str = "event"
+    opciones: Mapping[str, Any] | None = None
+    seed: int | None = None
+
+
+def run_sweep(
+    procesos: Procesos,
+    cases: Iterable[SweepCase],
+    *,
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Ejecuta cada caso sobre la misma carga y devuelve una tabla comparativa
+    (una fila por caso, en el orden recibido) con las métricas agregadas.
+
+    `max_workers=1` ejecuta en el proceso actual, sin pool ni memoria compartida.
+    Lanza ValueError si la carga o algún caso no es válido, antes de simular.
+    """
+    cases = list(cases)
+    columnas = _columnas(Planificador().tabla(procesos))
+    for case in cases:
+        crear_algoritmo(case.algoritmo, case.quantum, case.opciones)
+    if max_workers == 1 or len(cases) <= 1:
+        return [_evaluar(columnas, case) for case in cases]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(8, len(columnas) * 8))
+    try:
+        shm.buf[: len(columnas) * 8] = columnas.tobytes()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_adjuntar_carga,
+            initargs=(shm.name, len(columnas)),
+        ) as pool:
+            return list(pool.map(_evaluar_compartido, cases))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _columnas(tabla: ProcessTable) -> array:
+    """Empaqueta la carga como [pids..., llegadas..., rafagas..., prioridades...]."""
+    columnas = array("q")
+    for columna in (tabla.pid, tabla.arrival, tabla.burst, tabla.priority):
+        columnas.extend(columna)
+    return columnas
+
+
+def _pcbs(columnas: Any, io_enabled: bool) -> list[PCB]:
+    n = len(columnas) // _COLUMNAS
+    pcbs: list[PCB] = []
+    for i in range(n):
+        prioridad = columnas[3 * n + i]
+        pcbs.append(
+            PCB(
+                pid=columnas[i],
+                arrival_time=columnas[n + i],
+                burst_time=columnas[2 * n + i],
+                priority=None if prioridad == _SIN_PRIORIDAD else prioridad,
+                metadata={"io_enabled": io_enabled},
+            )
+        )
+    return pcbs
+
+
+def _evaluar(columnas: Any, case: SweepCase) -> dict[str, Any]:
+    config = SimulationConfig(
+        algorithm=crear_algoritmo(case.algoritmo, case.quantum, case.opciones),
+        io_enabled=case.io_enabled,
+        engine=case.engine,
+        summary_only=True,
+        seed=case.seed,
+    )
+    sim = SchedulerSimulator(config)
+    sim.load_jobs(_pcbs(columnas, case.io_enabled))
+    resultado = construir_resultado(sim, sim.run())
+    return {
+        **asdict(case),
+        "avg_wait": resultado.avg_wait,
+        "avg_turnaround": resultado.avg_turnaround,
+        "avg_response": resultado.avg_response,
+        "makespan": resultado.makespan,
+        "throughput": resultado.throughput,
+        "cpu_utilization": resultado.cpu_utilization,
+        "context_switches": resultado.context_switches,
+    }
+
+
+# ---- Estado por worker ----
+
+_carga_compartida: tuple[shared_memory.SharedMemory, memoryview] | None = None
+
+
+def _adjuntar_carga(nombre: str, longitud: int) -> None:
+    global _carga_compartida  # pylint: disable=global-statement
+    shm = shared_memory.SharedMemory(name=nombre)
+    _carga_compartida = (shm, shm.buf[: longitud * 8].cast("q"))
+
+
+def _evaluar_compartido(case: SweepCase) -> dict[str, Any]:
+    assert _carga_compartida is not None, "worker sin carga adjunta"
+    return _evaluar(_carga_compartida[1], case)
@@ -3,6 +3,9 @@ ALGORITHMS = [
     ('fcfs', 'FCFS'),
     ('rr', 'Round Robin'),
     ('sjf', 'SJF (No expropiativo)'),
+    ('srtf', 'SRTF (SJF expropiativo)'),
+    ('mlfq', 'MLFQ (colas multinivel)'),
+    ('cfs', 'CFS (reparto justo por prioridad)'),
 ]
 class ProcessForm(forms.Form):
     procesos_json = forms.CharField(
@@ -11,4 +14,49 @@ class ProcessForm(forms.Form):
         initial='[\n  {"pid": 1, "llegada": 0, "rafaga": 5, "usuario": "usuario1"},\n  {"pid": 2, "llegada": 1, "rafaga": 3, "usuario": "usuario2"}\n]'
     )
     algoritmo = forms.ChoiceField(choices=ALGORITHMS, initial='fcfs', label='Algoritmo')
-    quantum = forms.IntegerField(min_value=1, initial=2, required=False, label='Quantum (RR)')
+    quantum = forms.IntegerField(min_value=1, initial=2, required=False, label='Quantum (RR / MLFQ nivel 0)')
+    niveles = forms.IntegerField(min_value=1, max_value=16, initial=3, required=False, label='Niveles (MLFQ)')
+    boost = forms.IntegerField(min_value=1, required=False, label='Boost cada (ticks, MLFQ)')
+    latencia = forms.IntegerField(min_value=1, initial=24, required=False, label='Latencia objetivo (ticks, CFS)')
+    granularidad = forms.IntegerField(min_value=1, initial=3, required=False, label='Granularidad mínima (ticks, CFS)')
+    comparar = forms.MultipleChoiceField(
+        choices=ALGORITHMS,
+        required=False,
+        widget=forms.CheckboxSelectMultiple(attrs={'class': 'form-check-input'}),
+        label='Comparar algoritmos',
+        help_text='Si marcas alguno, se simula la carga con todos ellos y se muestran lado a lado.',
+    )
+
+    def clean(self):
+        datos = super().clean()
+        latencia, granularidad = datos.get('latencia'), datos.get('granularidad')
+        if latencia and granularidad and granularidad > latencia:
+            self.add_error('granularidad', 'granularidad no puede superar a latencia.')
+        return datos
+
+    def opciones(self, algoritmo=None):
+        """Opciones de `algoritmo` (por defecto, el elegido) para Planificador; MLFQ y CFS las usan."""
+        algoritmo = algoritmo or self.cleaned_data.get('algoritmo')
+        if algoritmo == 'mlfq':
+            return {
+                'niveles': self.cleaned_data.get('niveles') or 3,
+                'boost': self.cleaned_data.get('boost'),
+            }
+        if algoritmo == 'cfs':
+            return {
+                'latencia': self.cleaned_data.get('latencia') or 24,
+                'granularidad': self.cleaned_data.get('granularidad') or 3,
+            }
+        return None
+
+    def variantes(self):
+        """Algoritmos marcados en `comparar`, con el quantum y las opciones del formulario."""
+        quantum = self.cleaned_data.get('quantum') or 2
+        variantes = []
+        for algoritmo in self.cleaned_data.get('comparar') or []:
+            variante = {'algoritmo': algoritmo}
+            if algoritmo in ('rr', 'mlfq'):
+                variante['quantum'] = quantum
+            variante.update(self.opciones(algoritmo) or {})
+            variantes.append(variante)
+        return variantes
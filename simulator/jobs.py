@@ -0,0 +1,212 @@
+"""
+Cola de simulaciones en segundo plano sobre la base de datos.
+
+La vista encola un SimulationJob y responde de inmediato; los procesos
+lanzados con `manage.py simworker` reclaman trabajos con
+`SELECT ... FOR UPDATE SKIP LOCKED` y guardan el resultado. Mientras un
+trabajo corre, un hilo de latido publica su progreso cada pocos segundos
+(también durante fases largas sin procesos terminados) y consulta si se
+pidió cancelarlo; si es así, el motor se detiene (ver
+SimulationConfig.cancel_event). El resultado se escribe solo si el
+trabajo sigue asignado a este worker: uno reencolado por huérfano y
+reclamado por otro no se pisa.
+
+`resultado` guarda solo el resumen (resultado_a_dict sin filas por
+proceso); la línea de tiempo va comprimida a LineaTiempo con la clave del
+resultado.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .core.engine.simulator import SimulationCancelled
+from .core.metrics import resultado_a_dict
+from .core.scheduler import Planificador
+from .models import LineaTiempo, SimulationJob
+
+logger = logging.getLogger(__name__)
+
+Estado = SimulationJob.Estado
+
+
+class Latido(threading.Thread):
+    """
+    Hilo que mantiene vivo un trabajo en ejecución: cada `intervalo`
+    segundos escribe `progreso` y `actualizado` y activa `cancelar` si se
+    pidió la cancelación o si el trabajo ya no es de este worker. Usa su
+    propia conexión a la base de datos y la cierra al terminar.
+    """
+
+    def __init__(self, job: SimulationJob, intervalo: float) -> None:
+        super().__init__(name=f"latido-{job.pk}", daemon=True)
+        self.job = job
+        self.intervalo = intervalo
+        # Fracción completada; la actualiza el callback de progreso del motor.
+        self.progreso = 0.0
+        self.cancelar = threading.Event()
+        # True si otro worker se quedó con el trabajo (o ya no está "running").
+        self.perdido = False
+        self._parar = threading.Event()
+
+    def run(self) -> None:
+        try:
+            while not self._parar.wait(self.intervalo):
+                self.latir()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Falló el latido del trabajo %s", self.job.pk)
+        finally:
+            connection.close()
+
+    def latir(self) -> None:
+        vivo = SimulationJob.objects.filter(
+            pk=self.job.pk, worker=self.job.worker, estado=Estado.EJECUTANDO
+        ).update(progreso=self.progreso, actualizado=timezone.now())
+        if not vivo:
+            self.perdido = True
+            self.cancelar.set()
+        elif SimulationJob.objects.filter(pk=self.job.pk, cancelacion_solicitada=True).exists():
+            self.cancelar.set()
+
+    def parar(self) -> None:
+        self._parar.set()
+        if self.is_alive():
+            self.join()
+
+
+def encolar(
+    procesos: List[Dict[str, Any]],
+    algoritmo: str,
+    quantum: int | None = None,
+    opciones: Dict[str, Any] | None = None,
+) -> SimulationJob:
+    return SimulationJob.objects.create(
+        procesos=procesos, algoritmo=algoritmo, quantum=quantum, opciones=opciones or {}
+    )
+
+
+def cancelar(job: SimulationJob) -> SimulationJob:
+    """Cancela en el acto si aún está en cola; si ya corre, lo marca para el worker."""
+    en_cola = SimulationJob.objects.filter(pk=job.pk, estado=Estado.EN_COLA).update(
+        estado=Estado.CANCELADO, cancelacion_solicitada=True, terminado=timezone.now()
+    )
+    if not en_cola:
+        SimulationJob.objects.filter(pk=job.pk, estado=Estado.EJECUTANDO).update(
+            cancelacion_solicitada=True
+        )
+    job.refresh_from_db()
+    return job
+
+
+def reclamar(worker: str) -> SimulationJob | None:
+    """Toma el trabajo en cola más antiguo sin bloquear a los demás workers."""
+    with transaction.atomic():
+        job = (
+            SimulationJob.objects.select_for_update(skip_locked=True)
+            .filter(estado=Estado.EN_COLA)
+            .order_by("creado", "id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.estado = Estado.EJECUTANDO
+        job.worker = worker
+        job.iniciado = timezone.now()
+        job.save(update_fields=["estado", "worker", "iniciado", "actualizado"])
+    return job
+
+
+def ejecutar(job: SimulationJob, *, intervalo: float = 2.0) -> SimulationJob:
+    """
+    Simula `job` con un Latido cada `intervalo` segundos. El estado final
+    se escribe solo si el trabajo sigue "running" y asignado a este worker;
+    si no, el resultado se descarta y se devuelve el trabajo tal como está.
+    """
+    latido = Latido(job, intervalo)
+
+    def progreso(terminados: int, total: int | None) -> None:
+        latido.progreso = terminados / total if total else 0.0
+
+    campos: Dict[str, Any] = {}
+    latido.start()
+    try:
+        resultado = Planificador(con_clave=True)._run(
+            job.procesos, job.algoritmo, job.quantum, progreso, job.opciones or None, latido.cancelar
+        )
+        LineaTiempo.guardar(resultado.clave, resultado.timeline)
+    except SimulationCancelled:
+        campos["estado"] = Estado.CANCELADO
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception("Falló la simulación del trabajo %s", job.pk)
+        campos.update(estado=Estado.FALLIDO, error=str(exc))
+    else:
+        campos.update(
+            estado=Estado.TERMINADO,
+            progreso=1.0,
+            clave=resultado.clave,
+            resultado=resultado_a_dict(resultado, procesos=False),
+        )
+    finally:
+        latido.parar()
+
+    ahora = timezone.now()
+    escrito = SimulationJob.objects.filter(
+        pk=job.pk, worker=job.worker, estado=Estado.EJECUTANDO
+    ).update(terminado=ahora, actualizado=ahora, **campos)
+    if not escrito:
+        logger.warning("El trabajo %s ya no es de %s; se descarta su resultado", job.pk, job.worker)
+    job.refresh_from_db()
+    return job
+
+
+def reencolar_huerfanos(vencimiento: timedelta) -> int:
+    """Devuelve a la cola los trabajos "running" cuyo worker no da señales desde hace `vencimiento`."""
+    limite = timezone.now() - vencimiento
+    huerfanos = SimulationJob.objects.filter(estado=Estado.EJECUTANDO, actualizado__lt=limite)
+    huerfanos.filter(cancelacion_solicitada=True).update(
+        estado=Estado.CANCELADO, terminado=timezone.now()
+    )
+    return huerfanos.filter(cancelacion_solicitada=False).update(
+        estado=Estado.EN_COLA, worker="", progreso=0.0, iniciado=None
+    )
+
+
+def purgar_lineas_tiempo(vencimiento: timedelta) -> int:
+    """Borra las líneas de tiempo guardadas hace más de `vencimiento`; devuelve cuántas."""
+    borradas, _ = LineaTiempo.objects.filter(creado__lt=timezone.now() - vencimiento).delete()
+    return borradas
+
+
+def bucle_worker(
+    nombre: str,
+    *,
+    espera: float = 1.0,
+    detener: threading.Event | Any | None = None,
+    max_trabajos: int | None = None,
+) -> int:
+    """
+    Reclama y ejecuta trabajos hasta que `detener` se activa (o tras
+    `max_trabajos`). Duerme `espera` segundos cuando la cola está vacía.
+    Devuelve cuántos trabajos ejecutó.
+    """
+    ejecutados = 0
+    while detener is None or not detener.is_set():
+        if max_trabajos is not None and ejecutados >= max_trabajos:
+            break
+        job = reclamar(nombre)
+        if job is None:
+            if detener is not None:
+                detener.wait(espera)
+            else:
+                time.sleep(espera)
+            continue
+        ejecutar(job)
+        ejecutados += 1
+    return ejecutados
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from simulator.core import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide SchedulerSimulator.run (FCFS, SJF y RR con varios quantum, con y sin I/O) "
+        "y opcionalmente falla si empeora respecto a una baseline JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tamanos", type=int, nargs="+", default=list(benchmark.TAMANOS),
+            help="Número de procesos de cada carga (por defecto de 10 a 1.000.000).",
+        )
+        parser.add_argument("--repeticiones", type=int, default=3, help="Se queda con el mejor tiempo.")
+        parser.add_argument("--motor", choices=["tick", "event"], default="event")
+        parser.add_argument("--semilla", type=int, default=0)
+        parser.add_argument(
+            "--sin-memoria", action="store_true",
+            help="No mide la memoria de pico ni las asignaciones (la pasada con tracemalloc es lenta).",
+        )
+        parser.add_argument(
+            "--perfil", action="store_true",
+            help="Añade una pasada instrumentada y muestra el tiempo de cada fase del bucle.",
+        )
+        parser.add_argument("--guardar", metavar="RUTA", help="Escribe los resultados como baseline JSON.")
+        parser.add_argument("--baseline", metavar="RUTA", help="Baseline JSON con la que comparar.")
+        parser.add_argument("--umbral-tiempo", type=float, default=0.25, help="Fracción (0.25 = +25 %%).")
+        parser.add_argument("--umbral-memoria", type=float, default=0.10, help="Fracción (0.10 = +10 %%).")
+        parser.add_argument(
+            "--umbral-asignaciones", type=float, default=0.10,
+            help="Fracción (0.10 = +10 %%) de bloques que retiene run().",
+        )
+
+    def handle(self, *args, **options):
+        base = benchmark.cargar(options["baseline"]) if options["baseline"] else None
+        casos = benchmark.casos_por_defecto(options["tamanos"], engine=options["motor"])
+        documento = benchmark.ejecutar(
+            casos,
+            repeticiones=options["repeticiones"],
+            semilla=options["semilla"],
+            memoria=not options["sin_memoria"],
+            perfil=options["perfil"],
+            al_medir=self._informar,
+        )
+
+        if options["guardar"]:
+            benchmark.guardar(documento, options["guardar"])
+            self.stdout.write(f"Resultados guardados en {options['guardar']}.")
+        if base is not None:
+            regresiones = benchmark.comparar(
+                documento,
+                base,
+                umbral_tiempo=options["umbral_tiempo"],
+                umbral_memoria=options["umbral_memoria"],
+                umbral_asignaciones=options["umbral_asignaciones"],
+            )
+            if regresiones:
+                raise CommandError(
+                    f"{len(regresiones)} regresiones:\n" + "\n".join(str(r) for r in regresiones)
+                )
+            self.stdout.write(self.style.SUCCESS("Sin regresiones respecto a la baseline."))
+
+    def _informar(self, caso, medida):
+        pico = medida["memoria_pico"]
+        asignaciones = medida["asignaciones"]
+        self.stdout.write(
+            f"{caso.clave:<36} {medida['segundos']:>10.4f} s "
+            f"{medida['ticks_por_segundo'] or 0:>12.0f} ticks/s "
+            f"{'-' if pico is None else f'{pico / 1024:.0f} KiB':>12} "
+            f"{'-' if asignaciones is None else f'{asignaciones} bloques':>16}"
+        )
+        if medida["perfil"] is not None:
+            fases = medida["perfil"]["phases"]
+            self.stdout.write(
+                "    " + "  ".join(f"{fase} {datos['share']:.0%}" for fase, datos in fases.items())
+            )
@@ -0,0 +1,95 @@
+import multiprocessing
+import os
+import signal
+import socket
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+def _proceso_worker(nombre: str, espera: float, detener) -> None:
+    # Con el método "spawn" el hijo arranca sin Django configurado.
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+    from simulator.jobs import bucle_worker
+
+    # El padre gestiona las señales; el hijo termina su trabajo actual y sale.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    bucle_worker(nombre, espera=espera, detener=detener)
+
+
+class Command(BaseCommand):
+    help = "Arranca un pool de procesos locales que ejecutan las simulaciones en cola."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1,
+            help="Número de procesos worker (por defecto, uno por núcleo).",
+        )
+        parser.add_argument(
+            "--espera", type=float, default=1.0,
+            help="Segundos entre consultas cuando la cola está vacía.",
+        )
+        parser.add_argument(
+            "--huerfanos", type=int, default=600,
+            help=(
+                "Reencola trabajos 'running' sin latido desde hace estos segundos (0 = no); "
+                "se comprueba al arrancar y periódicamente mientras los workers corren."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        from simulator.jobs import purgar_lineas_tiempo, reencolar_huerfanos
+
+        vencimiento = timedelta(seconds=options["huerfanos"]) if options["huerfanos"] > 0 else None
+        ttl = getattr(settings, "SIMULATOR_TIMELINE_TTL", 0)
+        retencion = timedelta(seconds=ttl) if ttl > 0 else None
+
+        def mantenimiento():
+            if vencimiento is not None:
+                reencolados = reencolar_huerfanos(vencimiento)
+                if reencolados:
+                    self.stdout.write(f"Reencolados {reencolados} trabajos huérfanos.")
+            if retencion is not None:
+                borradas = purgar_lineas_tiempo(retencion)
+                if borradas:
+                    self.stdout.write(f"Borradas {borradas} líneas de tiempo caducadas.")
+
+        mantenimiento()
+        # Los hijos no deben heredar las conexiones abiertas del padre.
+        connections.close_all()
+        detener = multiprocessing.Event()
+        base = f"{socket.gethostname()}:{os.getpid()}"
+        procesos = [
+            multiprocessing.Process(
+                target=_proceso_worker,
+                args=(f"{base}/{i}", options["espera"], detener),
+                name=f"simworker-{i}",
+            )
+            for i in range(max(1, options["workers"]))
+        ]
+
+        def parar(signum, frame):
+            detener.set()
+
+        signal.signal(signal.SIGINT, parar)
+        signal.signal(signal.SIGTERM, parar)
+        for proceso in procesos:
+            proceso.start()
+        self.stdout.write(self.style.SUCCESS(f"{len(procesos)} workers en marcha ({base})."))
+        # Un worker que muere (o una máquina que se apaga) deja trabajos "running";
+        # se reencolan mientras haya workers que los puedan retomar. De paso se
+        # purgan las líneas de tiempo caducadas.
+        periodo = max(1.0, min(60.0, options["huerfanos"] / 2)) if vencimiento is not None else 60.0
+        while any(proceso.is_alive() for proceso in procesos):
+            if detener.wait(periodo):
+                break
+            mantenimiento()
+        for proceso in procesos:
+            proceso.join()
+        self.stdout.write("Workers detenidos.")
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SimulationJob",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("algoritmo", models.CharField(max_length=16)),
+                ("quantum", models.PositiveIntegerField(blank=True, null=True)),
+                ("procesos", models.JSONField()),
+                (
+                    "estado",
+                    models.CharField(
+                        choices=[
+                            ("queued", "En cola"),
+                            ("running", "Ejecutando"),
+                            ("done", "Terminado"),
+                            ("failed", "Fallido"),
+                            ("cancelled", "Cancelado"),
+                        ],
+                        db_index=True,
+                        default="queued",
+                        max_length=16,
+                    ),
+                ),
+                ("progreso", models.FloatField(default=0.0)),
+                ("cancelacion_solicitada", models.BooleanField(default=False)),
+                ("resultado", models.JSONField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+                ("worker", models.CharField(blank=True, default="", max_length=128)),
+                ("creado", models.DateTimeField(auto_now_add=True)),
+                ("iniciado", models.DateTimeField(blank=True, null=True)),
+                ("terminado", models.DateTimeField(blank=True, null=True)),
+                ("actualizado", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["creado", "id"],
+                "indexes": [models.Index(fields=["estado", "creado"], name="simjob_estado_creado_idx")],
+            },
+        ),
+    ]
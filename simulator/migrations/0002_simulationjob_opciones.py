@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="simulationjob",
+            name="opciones",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
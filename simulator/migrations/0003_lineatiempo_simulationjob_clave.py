@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0002_simulationjob_opciones"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="simulationjob",
+            name="clave",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.CreateModel(
+            name="LineaTiempo",
+            fields=[
+                ("clave", models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ("segmentos", models.PositiveIntegerField()),
+                ("datos", models.BinaryField()),
+                ("creado", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
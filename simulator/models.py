@@ -0,0 +1,83 @@
+from django.db import models
+
+from .core.engine.timeline import Timeline
+
+
+class SimulationJob(models.Model):
+    """Simulación encolada para ejecutarse fuera del ciclo petición/respuesta."""
+
+    class Estado(models.TextChoices):
+        EN_COLA = "queued", "En cola"
+        EJECUTANDO = "running", "Ejecutando"
+        TERMINADO = "done", "Terminado"
+        FALLIDO = "failed", "Fallido"
+        CANCELADO = "cancelled", "Cancelado"
+
+    FINALES = (Estado.TERMINADO, Estado.FALLIDO, Estado.CANCELADO)
+
+    algoritmo = models.CharField(max_length=16)
+    quantum = models.PositiveIntegerField(null=True, blank=True)
+    # Opciones del algoritmo (MLFQ: {"niveles", "boost"}).
+    opciones = models.JSONField(default=dict, blank=True)
+    procesos = models.JSONField()
+    estado = models.CharField(
+        max_length=16, choices=Estado.choices, default=Estado.EN_COLA, db_index=True
+    )
+    # Fracción completada en [0, 1] (procesos terminados / total).
+    progreso = models.FloatField(default=0.0)
+    cancelacion_solicitada = models.BooleanField(default=False)
+    resultado = models.JSONField(null=True, blank=True)
+    # clave_resultado del resultado terminado; su línea de tiempo está en LineaTiempo.
+    clave = models.CharField(max_length=64, blank=True, default="")
+    error = models.TextField(blank=True, default="")
+    worker = models.CharField(max_length=128, blank=True, default="")
+    creado = models.DateTimeField(auto_now_add=True)
+    iniciado = models.DateTimeField(null=True, blank=True)
+    terminado = models.DateTimeField(null=True, blank=True)
+    # Latido del worker; un trabajo "running" sin latido reciente quedó huérfano.
+    actualizado = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["creado", "id"]
+        indexes = [models.Index(fields=["estado", "creado"], name="simjob_estado_creado_idx")]
+
+    def __str__(self) -> str:
+        return f"SimulationJob #{self.pk} ({self.algoritmo}, {self.estado})"
+
+    @property
+    def finalizado(self) -> bool:
+        return self.estado in self.FINALES
+
+
+class LineaTiempo(models.Model):
+    """
+    Línea de tiempo de un resultado (Timeline.to_bytes), indexada por su
+    clave_resultado. Permite dibujar el Gantt aunque el resultado ya no esté
+    en la caché (o no quepa en ella) y desde cualquier worker. La clave
+    identifica el contenido, así que una fila nunca cambia; `manage.py
+    simworker` borra las de más de SIMULATOR_TIMELINE_TTL segundos (ver
+    jobs.purgar_lineas_tiempo).
+    """
+
+    clave = models.CharField(max_length=64, primary_key=True)
+    segmentos = models.PositiveIntegerField()
+    datos = models.BinaryField()
+    creado = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"LineaTiempo {self.clave} ({self.segmentos} segmentos)"
+
+    @classmethod
+    def guardar(cls, clave: str, timeline: Timeline) -> None:
+        """Guarda la línea de tiempo de `clave` si aún no estaba guardada."""
+        if cls.objects.filter(clave=clave).exists():
+            return
+        cls.objects.bulk_create(
+            [cls(clave=clave, segmentos=len(timeline), datos=timeline.to_bytes())],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def cargar(cls, clave: str) -> Timeline | None:
+        datos = cls.objects.filter(clave=clave).values_list("datos", flat=True).first()
+        return None if datos is None else Timeline.from_bytes(bytes(datos))
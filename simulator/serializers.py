@@ -0,0 +1,74 @@
+from rest_framework import serializers
+
+from .core.comparacion import VARIANTES_POR_DEFECTO
+from .forms import ALGORITHMS
+from .models import SimulationJob
+
+
+class ProcesoSerializer(serializers.Serializer):
+    pid = serializers.IntegerField()
+    llegada = serializers.IntegerField(min_value=0, default=0)
+    rafaga = serializers.IntegerField(min_value=0)
+    prioridad = serializers.IntegerField(required=False, allow_null=True, default=None)
+    usuario = serializers.CharField(required=False, default="root")
+
+
+class VarianteSerializer(serializers.Serializer):
+    """Un algoritmo con su quantum y sus opciones."""
+
+    algoritmo = serializers.ChoiceField(choices=ALGORITHMS)
+    quantum = serializers.IntegerField(min_value=1, required=False, allow_null=True, default=None)
+    niveles = serializers.IntegerField(min_value=1, max_value=16, required=False, allow_null=True, default=None)
+    boost = serializers.IntegerField(min_value=1, required=False, allow_null=True, default=None)
+    latencia = serializers.IntegerField(min_value=1, required=False, allow_null=True, default=None)
+    granularidad = serializers.IntegerField(min_value=1, required=False, allow_null=True, default=None)
+
+    def validate(self, datos):
+        if datos["algoritmo"] == "cfs" and datos.get("latencia") and datos.get("granularidad"):
+            if datos["granularidad"] > datos["latencia"]:
+                raise serializers.ValidationError("granularidad no puede superar a latencia.")
+        return datos
+
+
+class CargaSerializer(VarianteSerializer):
+    id = serializers.CharField(required=False, allow_null=True, default=None)
+    procesos = ProcesoSerializer(many=True, allow_empty=False)
+
+
+class LoteSerializer(serializers.Serializer):
+    """Petición de /sim/api/batch/: varias cargas y opciones de la línea de tiempo."""
+
+    MAX_CARGAS = 64
+
+    cargas = CargaSerializer(many=True, allow_empty=False, max_length=MAX_CARGAS)
+    timeline = serializers.BooleanField(default=False)
+    timeline_page = serializers.IntegerField(min_value=1, default=1)
+    timeline_page_size = serializers.IntegerField(min_value=1, max_value=5000, default=500)
+
+
+class ComparacionSerializer(serializers.Serializer):
+    """Petición de /sim/api/compare/: una carga y los algoritmos con los que simularla."""
+
+    MAX_VARIANTES = 16
+
+    procesos = ProcesoSerializer(many=True, allow_empty=False)
+    algoritmos = VarianteSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=MAX_VARIANTES,
+        required=False,
+        default=lambda: [dict(variante) for variante in VARIANTES_POR_DEFECTO],
+    )
+    timeline = serializers.BooleanField(default=False)
+    timeline_page = serializers.IntegerField(min_value=1, default=1)
+    timeline_page_size = serializers.IntegerField(min_value=1, max_value=5000, default=500)
+
+
+class SimulationJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SimulationJob
+        fields = [
+            "id", "algoritmo", "quantum", "opciones", "estado", "progreso", "cancelacion_solicitada",
+            "error", "creado", "iniciado", "terminado",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from simulator.core.engine.algorithms.fcfs import FCFSAlgorithm
+from simulator.core.engine.algorithms.sjf import SJFAlgorithm
+from simulator.core.engine.batch import evaluate, evaluate_batch
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.metrics import construir_resultado, construir_resultado_lote
+from simulator.core.scheduler import Planificador
+
+
+def _procesos(semilla, n=60):
+    rnd = random.Random(semilla)
+    return [
+        {"pid": rnd.randint(1, n // 2), "llegada": rnd.randint(0, 4 * n), "rafaga": rnd.randint(0, 12)}
+        for _ in range(n)
+    ]
+
+
+class TestEvaluadorPorLotes(unittest.TestCase):
+    def test_coincide_con_el_simulador(self):
+        plan = Planificador()
+        for nombre, alg in (("fcfs", FCFSAlgorithm), ("sjf", SJFAlgorithm)):
+            for semilla in range(30):
+                procesos = _procesos(semilla)
+                sim = SchedulerSimulator(SimulationConfig(algorithm=alg(), io_enabled=False))
+                sim.load_jobs(plan._pcbs_from_procesos(procesos))
+                esperado = construir_resultado(sim, sim.run())
+
+                pids, llegadas, rafagas, usuarios = plan._columnas_from_procesos(procesos)
+                obtenido = construir_resultado_lote(
+                    pids, llegadas, rafagas, evaluate(llegadas, rafagas, nombre), usuarios
+                )
+                self.assertEqual(obtenido.timeline.to_list(), esperado.timeline.to_list())
+                self.assertEqual(obtenido.completed, esperado.completed)
+                for campo in ("avg_wait", "avg_turnaround", "avg_response", "makespan",
+                              "throughput", "cpu_utilization", "context_switches",
+                              "percentiles", "percentiles_por_usuario"):
+                    self.assertEqual(getattr(obtenido, campo), getattr(esperado, campo), campo)
+
+    def test_varias_cargas_en_una_llamada(self):
+        cargas = [([0, 0, 0], [5, 1, 3]), ([], []), ([4], [2])]
+        fcfs, vacia, unica = evaluate_batch(cargas, "sjf")
+        self.assertEqual(list(fcfs.order), [1, 2, 0])
+        self.assertEqual(list(fcfs.waiting), [4, 0, 1])
+        self.assertIsNone(vacia.throughput)
+        self.assertEqual((unica.start[0], unica.finish[0], unica.makespan), (4, 6, 6))
+
+    def test_algoritmo_no_soportado(self):
+        with self.assertRaises(ValueError):
+            evaluate([0], [1], "rr")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from simulator.core import benchmark
+from simulator.core.benchmark import CasoBenchmark
+
+
+def _documento(**resultados):
+    return {"version": benchmark.VERSION_BASELINE, "entorno": {}, "resultados": resultados}
+
+
+class TestCasos(unittest.TestCase):
+    def test_casos_por_defecto(self):
+        casos = benchmark.casos_por_defecto([10, 100])
+        # (FCFS, SJF, 3 quantum de RR) x (sin y con I/O) x 2 tamaños.
+        self.assertEqual(len(casos), 20)
+        self.assertEqual(len({caso.clave for caso in casos}), 20)
+        self.assertIn("rr-q8/io=1/event/n=100", {caso.clave for caso in casos})
+
+    def test_carga_sintetica_reproducible(self):
+        a = benchmark.carga_sintetica(50, semilla=3)
+        b = benchmark.carga_sintetica(50, semilla=3)
+        self.assertEqual(list(a.arrival), list(b.arrival))
+        self.assertEqual(list(a.burst), list(b.burst))
+        self.assertTrue(all(1 <= r <= 20 for r in a.burst))
+
+
+class TestMedir(unittest.TestCase):
+    def test_campos(self):
+        medida = benchmark.medir(CasoBenchmark("rr", 50, quantum=2, io_enabled=True), repeticiones=2)
+        self.assertEqual(medida["algoritmo"], "rr")
+        self.assertGreater(medida["ticks"], 0)
+        self.assertGreater(medida["segundos"], 0)
+        self.assertGreater(medida["memoria_pico"], 0)
+        self.assertIsNone(medida["perfil"])
+
+    def test_asignaciones_crecen_con_lo_que_retiene_run(self):
+        # Cada proceso terminado deja vivos al menos su PCB y su fila de métricas.
+        pequena = benchmark.medir(CasoBenchmark("fcfs", 100), repeticiones=1)["asignaciones"]
+        grande = benchmark.medir(CasoBenchmark("fcfs", 2000), repeticiones=1)["asignaciones"]
+        self.assertGreater(pequena, 0)
+        self.assertGreater(grande, pequena * 10)
+        sin_memoria = benchmark.medir(CasoBenchmark("fcfs", 10), repeticiones=1, memoria=False)
+        self.assertIsNone(sin_memoria["asignaciones"])
+
+    def test_perfil(self):
+        medida = benchmark.medir(CasoBenchmark("fcfs", 30), repeticiones=1, memoria=False, perfil=True)
+        # Las llegadas en t=0 entran por prime(), fuera del bucle.
+        self.assertLessEqual(medida["perfil"]["phases"]["admission"]["calls"], 30)
+        self.assertEqual(medida["perfil"]["phases"]["metrics"]["calls"], 30)
+        self.assertIn("fcfs", medida["perfil"]["decisions"])
+
+    def test_ejecutar_informa_cada_caso(self):
+        vistos = []
+        casos = benchmark.casos_por_defecto([10])
+        documento = benchmark.ejecutar(
+            casos, repeticiones=1, memoria=False, al_medir=lambda caso, medida: vistos.append(caso)
+        )
+        self.assertEqual(vistos, casos)
+        self.assertEqual(set(documento["resultados"]), {caso.clave for caso in casos})
+        self.assertIsNone(documento["resultados"][casos[0].clave]["memoria_pico"])
+
+
+class TestComparar(unittest.TestCase):
+    def test_detecta_regresiones(self):
+        base = _documento(a={"segundos": 1.0, "memoria_pico": 1000}, b={"segundos": 1.0, "memoria_pico": 1000})
+        actual = _documento(a={"segundos": 1.5, "memoria_pico": 1050}, b={"segundos": 1.1, "memoria_pico": 1200})
+        regresiones = benchmark.comparar(actual, base)
+        self.assertEqual([(r.caso, r.metrica) for r in regresiones], [("a", "segundos"), ("b", "memoria_pico")])
+        self.assertAlmostEqual(regresiones[0].cambio, 0.5)
+
+    def test_detecta_regresiones_de_asignaciones(self):
+        base = _documento(a={"segundos": 1.0, "asignaciones": 100}, b={"segundos": 1.0, "asignaciones": 100})
+        actual = _documento(a={"segundos": 1.0, "asignaciones": 150}, b={"segundos": 1.0, "asignaciones": 105})
+        regresiones = benchmark.comparar(actual, base)
+        self.assertEqual([(r.caso, r.metrica) for r in regresiones], [("a", "asignaciones")])
+        self.assertEqual(benchmark.comparar(actual, base, umbral_asignaciones=0.6), [])
+
+    def test_ignora_tiempos_pequenos_y_casos_nuevos(self):
+        base = _documento(a={"segundos": 0.001, "memoria_pico": None})
+        actual = _documento(a={"segundos": 0.005, "memoria_pico": 10}, c={"segundos": 9.0, "memoria_pico": 1})
+        self.assertEqual(benchmark.comparar(actual, base), [])
+
+    def test_guardar_y_cargar(self):
+        documento = benchmark.ejecutar(benchmark.casos_por_defecto([10])[:1], repeticiones=1, memoria=False)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "base.json")
+            benchmark.guardar(documento, ruta)
+            self.assertEqual(benchmark.cargar(ruta), documento)
+            benchmark.guardar({**documento, "version": 0}, ruta)
+            with self.assertRaises(ValueError):
+                benchmark.cargar(ruta)
+
+
+if __name__ == "__main__":
+    unittest.main()
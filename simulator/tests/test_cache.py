@@ -0,0 +1,135 @@
+import unittest
+from unittest import mock
+
+from simulator.core.cache import CacheResultados, cache_desde_settings, clave_resultado
+from simulator.core.metrics import resultado_a_dict
+from simulator.core.scheduler import Planificador
+
+
+def _procesos(n=8, desfase=0):
+    return [{"pid": i, "llegada": i + desfase, "rafaga": 2 + i % 3} for i in range(1, n + 1)]
+
+
+class _BackendDict:
+    """Backend mínimo con la API get/set/delete de las cachés de Django."""
+
+    def __init__(self):
+        self.datos = {}
+
+    def get(self, key, default=None):
+        return self.datos.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.datos[key] = value
+
+    def delete(self, key):
+        self.datos.pop(key, None)
+
+
+class TestClave(unittest.TestCase):
+    def test_normaliza_la_carga(self):
+        a = [{"pid": "1", "llegada": "0", "rafaga": 3}]
+        b = [{"pid": 1, "rafaga": 3, "usuario": "root"}]
+        self.assertEqual(clave_resultado(a, "rr", None), clave_resultado(b, "rr", 2))
+        self.assertEqual(clave_resultado(a, "fcfs", 7), clave_resultado(b, "fcfs", None))
+        self.assertNotEqual(clave_resultado(a, "rr", 3), clave_resultado(b, "rr", 2))
+        self.assertNotEqual(
+            clave_resultado(a, "rr", 2, {"io_enabled": True}),
+            clave_resultado(a, "rr", 2, {"io_enabled": False}),
+        )
+
+    def test_normaliza_las_opciones_del_algoritmo(self):
+        carga = [{"pid": 1, "rafaga": 3}]
+        self.assertEqual(
+            clave_resultado(carga, "mlfq", None, None, None),
+            clave_resultado(carga, "mlfq", 2, None, {"niveles": 3, "boost": 0}),
+        )
+        self.assertNotEqual(
+            clave_resultado(carga, "cfs", None, None, {"latencia": 12}),
+            clave_resultado(carga, "cfs", None, None, None),
+        )
+        # Las opciones de otros algoritmos no cuentan.
+        self.assertEqual(
+            clave_resultado(carga, "fcfs", None, None, {"latencia": 12}),
+            clave_resultado(carga, "fcfs"),
+        )
+
+    def test_misma_clave_mismo_resultado(self):
+        # La clave normaliza los valores; la simulación debe usar los mismos.
+        crudos = [{"pid": "1", "rafaga": "3", "usuario": 1}, {"pid": 2, "llegada": 1, "rafaga": 2}]
+        limpios = [{"pid": 1, "rafaga": 3, "usuario": "1"}, {"pid": 2, "llegada": 1, "rafaga": 2}]
+        self.assertEqual(clave_resultado(crudos, "rr"), clave_resultado(limpios, "rr"))
+        plan = Planificador()
+        self.assertEqual(
+            resultado_a_dict(plan.round_robin(crudos)), resultado_a_dict(plan.round_robin(limpios))
+        )
+        self.assertEqual(
+            list(plan.round_robin(crudos).percentiles_por_usuario), ["1", "root"]
+        )
+
+    def test_con_clave_sin_cache(self):
+        self.assertIsNone(Planificador().sjf(_procesos()).clave)
+        self.assertEqual(
+            Planificador(con_clave=True).sjf(_procesos()).clave,
+            clave_resultado(_procesos(), "sjf", None, Planificador.IO_CONFIG),
+        )
+
+    def test_carga_invalida(self):
+        plan = Planificador(cache=CacheResultados())
+        with self.assertRaises(ValueError):
+            plan.fcfs([{"pid": 1, "rafaga": "x"}])
+        with self.assertRaises(ValueError):
+            plan.fcfs([{"pid": 1, "rafaga": -1}])
+
+
+class TestCacheResultados(unittest.TestCase):
+    def test_acierto_no_simula(self):
+        plan = Planificador(cache=CacheResultados())
+        primero = plan.round_robin(_procesos(), quantum=3)
+        with mock.patch.object(Planificador, "_simular") as simular:
+            segundo = plan.round_robin(_procesos(), quantum=3)
+        simular.assert_not_called()
+        self.assertIs(segundo, primero)
+        self.assertEqual(plan.cache.estadisticas.hits, 1)
+
+    def test_limites_de_entradas_y_bytes(self):
+        cache = CacheResultados(max_entradas=2, max_bytes=None)
+        plan = Planificador(cache=cache)
+        for desfase in range(3):
+            plan.fcfs(_procesos(desfase=desfase))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.estadisticas.evictions, 1)
+        self.assertNotIn(clave_resultado(_procesos(), "fcfs", None, Planificador.IO_CONFIG), cache)
+
+        tamano = cache.estadisticas.bytes // 2
+        por_bytes = CacheResultados(max_bytes=tamano + tamano // 2)
+        plan = Planificador(cache=por_bytes)
+        plan.fcfs(_procesos())
+        plan.fcfs(_procesos(desfase=1))
+        self.assertEqual(len(por_bytes), 1)
+        self.assertLessEqual(por_bytes.estadisticas.bytes, por_bytes.max_bytes)
+
+    def test_nivel_compartido(self):
+        backend = _BackendDict()
+        esperado = Planificador(cache=CacheResultados(backend=backend)).srtf(_procesos())
+        otro = CacheResultados(backend=backend)
+        with mock.patch.object(Planificador, "_simular") as simular:
+            obtenido = Planificador(cache=otro).srtf(_procesos())
+        simular.assert_not_called()
+        self.assertEqual(obtenido.timeline.to_list(), esperado.timeline.to_list())
+        self.assertEqual(obtenido.completed, esperado.completed)
+        self.assertEqual(obtenido.percentiles, esperado.percentiles)
+        self.assertEqual(otro.estadisticas.hits_backend, 1)
+
+        otro.invalidar(clave_resultado(_procesos(), "srtf", None, Planificador.IO_CONFIG))
+        self.assertEqual(backend.datos, {})
+
+    def test_desde_settings(self):
+        self.assertIsNone(cache_desde_settings({"ENABLED": False}))
+        cache = cache_desde_settings({"MAX_ENTRIES": 4, "BACKEND": None})
+        self.assertEqual(cache.max_entradas, 4)
+        self.assertIsNone(cache.backend)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import pickle
+import unittest
+from collections import Counter
+
+from simulator.core.engine.algorithms.cfs import CFSAlgorithm, nice_weight
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.queues import FairReadyQueue
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.scheduler import Planificador
+
+
+def _cpu_por_pid(pcbs, max_time, engine="event"):
+    sim = SchedulerSimulator(
+        SimulationConfig(algorithm=CFSAlgorithm(), io_enabled=False, engine=engine, max_time=max_time)
+    )
+    sim.load_jobs(pcbs)
+    sim.run()
+    cpu = Counter()
+    for tramo in sim.timeline.to_list():
+        cpu[tramo["pid"]] += tramo["dur"]
+    return cpu
+
+
+class TestFairReadyQueue(unittest.TestCase):
+    def test_saca_el_menor_vruntime_y_coloca_en_min_vruntime(self):
+        cola = FairReadyQueue(weight=nice_weight)
+        a, b = PCB(pid=1, arrival_time=0, burst_time=50), PCB(pid=2, arrival_time=0, burst_time=50)
+        cola.extend([a, b])
+        self.assertEqual(cola.load, 2 * 1024)
+        self.assertIs(cola.dequeue(), a)
+        a.consume(10)
+        cola.enqueue(a)
+        self.assertGreater(cola.vruntime(a), cola.vruntime(b))
+        self.assertIs(cola.dequeue(), b)
+        cola.current = b
+        b.consume(4)
+        # Un proceso nuevo no empieza en 0: se coloca en el mínimo actual (el de b).
+        nuevo = PCB(pid=3, arrival_time=14, burst_time=5)
+        cola.enqueue(nuevo)
+        self.assertEqual(cola.vruntime(nuevo), cola.vruntime(b))
+        self.assertEqual([p.pid for p in (cola.dequeue(), cola.dequeue())], [3, 1])
+        self.assertEqual(cola.load, 0)
+
+    def test_sobrevive_a_pickle(self):
+        cola = FairReadyQueue(weight=nice_weight)
+        a = PCB(pid=1, arrival_time=0, burst_time=50, priority=5)
+        a.consume(3)
+        cola.min_vruntime = 10**9
+        cola.enqueue(a)
+        copia = pickle.loads(pickle.dumps(cola))
+        self.assertEqual(copia.vruntime(copia.peek()), cola.vruntime(a))
+        self.assertEqual(copia.load, nice_weight(a))
+
+
+class TestCFS(unittest.TestCase):
+    def test_reparte_la_cpu_segun_el_peso(self):
+        for engine in ("tick", "event"):
+            cpu = _cpu_por_pid(
+                [
+                    PCB(pid=1, arrival_time=0, burst_time=10**6, priority=0),
+                    PCB(pid=2, arrival_time=0, burst_time=10**6, priority=5),
+                ],
+                max_time=4000,
+                engine=engine,
+            )
+            self.assertAlmostEqual(cpu[1] / cpu[2], 1024 / 335, delta=0.1)
+
+    def test_muchos_procesos_concurrentes_reciben_lo_mismo(self):
+        cpu = _cpu_por_pid([PCB(pid=i, arrival_time=0, burst_time=10**6) for i in range(200)], 6000)
+        self.assertEqual(len(cpu), 200)
+        self.assertLessEqual(max(cpu.values()) - min(cpu.values()), 3)
+
+    def test_timeslice_por_latencia_y_granularidad(self):
+        # Dos procesos iguales: la latencia objetivo (24) se reparte a medias.
+        cpu = _cpu_por_pid(
+            [PCB(pid=1, arrival_time=0, burst_time=100), PCB(pid=2, arrival_time=0, burst_time=100)], 24
+        )
+        self.assertEqual(cpu, Counter({1: 12, 2: 12}))
+        with self.assertRaises(ValueError):
+            CFSAlgorithm(target_latency=2, min_granularity=3)
+
+    def test_planificador(self):
+        procesos = [{"pid": i, "llegada": 0, "rafaga": 6, "prioridad": -i} for i in range(3)]
+        resultado = Planificador().cfs(procesos, latencia=6, granularidad=1)
+        fin = {p["pid"]: p["finish_time"] for p in resultado.completed}
+        # Más prioridad (nice menor) termina antes.
+        self.assertLess(fin[2], fin[1])
+        self.assertLess(fin[1], fin[0])
+
+    def test_prioridad_como_texto(self):
+        numeros = [{"pid": i, "llegada": 0, "rafaga": 6, "prioridad": -i} for i in range(3)]
+        textos = [dict(p, prioridad=str(p["prioridad"])) for p in numeros]
+        plan = Planificador()
+        self.assertEqual(plan.cfs(textos).completed, plan.cfs(numeros).completed)
+        self.assertEqual(
+            plan._simular(textos, "cfs").completed, plan._simular(numeros, "cfs").completed
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
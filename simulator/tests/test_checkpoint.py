@@ -0,0 +1,138 @@
+import os
+import random
+import tempfile
+import threading
+import unittest
+from dataclasses import replace
+
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.algorithms.sjf import SJFAlgorithm
+from simulator.core.engine.algorithms.srtf import SRTFAlgorithm
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.process_table import ProcessTable
+from simulator.core.engine.simulator import (
+    SchedulerSimulator,
+    SimulationCancelled,
+    SimulationConfig,
+    SimulationPaused,
+)
+from simulator.core.engine.sources import PoissonArrivals
+
+
+def _carga(n=120):
+    rnd = random.Random(11)
+    return [PCB(pid=i, arrival_time=rnd.randint(0, 300), burst_time=rnd.randint(1, 25)) for i in range(1, n + 1)]
+
+
+def _huella(sim, metrics):
+    return (
+        sim.timeline.to_list(), sim.clock, metrics.context_switches, metrics.makespan,
+        [(p.pid, p.waiting_time, p.response_time) for p in metrics.processes],
+        metrics.latency.summary(),
+    )
+
+
+class TestCheckpoint(unittest.TestCase):
+    def _por_tramos(self, config, cargar):
+        """Ejecuta con presupuesto 0 y reanuda siempre desde el snapshot serializado."""
+        sim = SchedulerSimulator(replace(config, wall_clock_budget=0.0))
+        cargar(sim)
+        pausas = 0
+        while True:
+            try:
+                metrics = sim.run()
+                return _huella(sim, metrics), pausas
+            except SimulationPaused as pausa:
+                pausas += 1
+                sim = SchedulerSimulator.restore(pausa.snapshot)
+
+    def _comparar(self, config, cargar):
+        sim = SchedulerSimulator(config)
+        cargar(sim)
+        esperado = _huella(sim, sim.run())
+        obtenido, pausas = self._por_tramos(config, cargar)
+        self.assertGreater(pausas, 0)
+        self.assertEqual(obtenido, esperado)
+
+    def test_reanudar_equivale_a_ejecucion_continua(self):
+        for algoritmo in (lambda: RoundRobinAlgorithm(quantum=3), SJFAlgorithm, SRTFAlgorithm):
+            for engine in ("tick", "event"):
+                config = SimulationConfig(algorithm=algoritmo(), io_enabled=True, seed=4, engine=engine)
+                self._comparar(config, lambda sim: sim.load_jobs(_carga()))
+
+    def test_tabla_y_stream_con_random_global(self):
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=2), io_enabled=True)
+        def cargar_tabla(sim):
+            random.seed(5)
+            sim.load_table(ProcessTable.from_pcbs(_carga()))
+
+        self._comparar(config, cargar_tabla)
+
+        def cargar(sim):
+            random.seed(99)
+            sim.load_stream(PoissonArrivals(rate=0.5, burst_mean=6, count=200, seed=3))
+
+        self._comparar(config, cargar)
+
+    def test_snapshot_desde_progreso_y_archivo(self):
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True, seed=2)
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(_carga())
+        esperado = _huella(sim, sim.run())
+
+        capturas = []
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(_carga())
+        sim.run(lambda hechos, total: capturas.append(sim.snapshot()) if hechos == 40 else None)
+        reanudado = SchedulerSimulator.restore(capturas[0])
+        self.assertEqual(_huella(reanudado, reanudado.run()), esperado)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = os.path.join(tmp, "run.ckpt")
+            sim = SchedulerSimulator(replace(config, wall_clock_budget=0.0, checkpoint_path=ruta))
+            sim.load_jobs(_carga())
+            with self.assertRaises(SimulationPaused) as pausa:
+                sim.run()
+            with open(ruta, "rb") as handle:
+                self.assertEqual(handle.read(), pausa.exception.snapshot)
+            self.assertEqual(os.listdir(tmp), ["run.ckpt"])
+
+
+
+class TestCancelacion(unittest.TestCase):
+    def _sim(self, cancelar, engine="tick"):
+        config = SimulationConfig(
+            algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=False, engine=engine, cancel_event=cancelar
+        )
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(_carga())
+        return sim
+
+    def test_cancelar_desde_otro_hilo_aborta_run(self):
+        cancelar = threading.Event()
+        sim = self._sim(cancelar)
+        # El callback solo marca el evento; el bucle lo consulta por su cuenta.
+        with self.assertRaises(SimulationCancelled) as cancelada:
+            sim.run(lambda hechos, total: cancelar.set() if hechos == 10 else None)
+        self.assertLess(cancelada.exception.completed, len(_carga()))
+
+    def test_sin_cancelar_no_cambia_el_resultado(self):
+        sim = self._sim(None)
+        esperado = _huella(sim, sim.run())
+        sim = self._sim(threading.Event())
+        self.assertEqual(_huella(sim, sim.run()), esperado)
+
+    def test_iter_run_y_snapshot(self):
+        cancelar = threading.Event()
+        sim = self._sim(cancelar, engine="event")
+        pasos = sim.iter_run(batch_size=1)
+        next(pasos)
+        # El snapshot no incluye el evento (no es serializable).
+        self.assertIsNone(SchedulerSimulator.restore(sim.snapshot()).config.cancel_event)
+        cancelar.set()
+        with self.assertRaises(SimulationCancelled):
+            list(pasos)
+
+
+if __name__ == "__main__":
+    unittest.main()
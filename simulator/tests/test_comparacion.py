@@ -0,0 +1,116 @@
+import json
+import unittest
+from unittest import mock
+
+from simulator.core import comparacion
+from simulator.core.cache import CacheResultados
+from simulator.core.comparacion import comparar, lado_a_lado
+from simulator.core.engine.workload import Poisson, WorkloadSpec, generate_workload
+from simulator.core.metrics import resultado_a_dict
+from simulator.core.scheduler import Planificador
+
+VARIANTES = [
+    {"algoritmo": "fcfs"},
+    {"algoritmo": "sjf"},
+    {"algoritmo": "srtf"},
+    {"algoritmo": "rr", "quantum": 3},
+    {"algoritmo": "mlfq", "quantum": 2, "niveles": 2, "boost": 20},
+    {"algoritmo": "cfs"},
+]
+
+
+def _procesos():
+    return [
+        {"pid": i, "llegada": i % 7, "rafaga": 1 + i * 5 % 9, "prioridad": i % 3 - 1, "usuario": "ab"[i % 2]}
+        for i in range(1, 60)
+    ]
+
+
+def _dict(resultado):
+    return resultado_a_dict(resultado, timeline=True, timeline_page_size=10_000)
+
+
+class TestComparar(unittest.TestCase):
+    def test_igual_que_simular_cada_algoritmo(self):
+        procesos = _procesos()
+        resultados = comparar(procesos, VARIANTES)
+        plan = Planificador()
+        for variante, resultado in zip(VARIANTES, resultados):
+            esperado = plan._run(
+                procesos,
+                variante["algoritmo"],
+                variante.get("quantum"),
+                opciones={k: v for k, v in variante.items() if k not in ("algoritmo", "quantum")},
+            )
+            self.assertEqual(_dict(resultado), _dict(esperado), variante)
+
+    def test_pool_igual_que_serie(self):
+        procesos = _procesos()
+        serie = comparar(procesos, VARIANTES, max_workers=1)
+        with mock.patch.object(comparacion, "MIN_PROCESOS_POOL", 0):
+            paralelo = comparar(procesos, VARIANTES, max_workers=2)
+        self.assertEqual([_dict(r) for r in serie], [_dict(r) for r in paralelo])
+
+    def test_acepta_una_process_table(self):
+        tabla = generate_workload(WorkloadSpec(200, arrivals=Poisson(0.5)), seed=4)
+        tabla_resultados = comparar(tabla, VARIANTES)
+        filas = [
+            {"pid": tabla.pid[i], "llegada": tabla.arrival[i], "rafaga": tabla.burst[i]}
+            for i in range(len(tabla))
+        ]
+        for a, b in zip(tabla_resultados, comparar(filas, VARIANTES)):
+            self.assertEqual(_dict(a), _dict(b))
+
+    def test_valida_antes_de_simular(self):
+        with mock.patch.object(comparacion, "_simular") as simular:
+            with self.assertRaises(ValueError):
+                comparar([{"pid": 1, "rafaga": 2}, {"pid": "x"}], VARIANTES)
+            with self.assertRaises(ValueError):
+                comparar(_procesos(), [{"algoritmo": "fcfs"}, {"algoritmo": "lottery"}])
+            with self.assertRaises(ValueError):
+                comparar([{"pid": 1, "rafaga": -2}])
+        simular.assert_not_called()
+
+    def test_cache_compartida_con_planificador(self):
+        cache = CacheResultados()
+        procesos = _procesos()
+        primera = comparar(procesos, VARIANTES, cache=cache)
+        self.assertEqual(cache.estadisticas.misses, len(VARIANTES))
+        segunda = comparar(procesos, VARIANTES, cache=cache)
+        self.assertEqual(cache.estadisticas.hits, len(VARIANTES))
+        self.assertEqual([r.clave for r in primera], [r.clave for r in segunda])
+        self.assertIsNotNone(primera[0].clave)
+        Planificador(cache=cache).round_robin(procesos, quantum=3)
+        self.assertEqual(cache.estadisticas.hits, len(VARIANTES) + 1)
+
+    def test_lado_a_lado(self):
+        procesos = _procesos()
+        variantes = [{"algoritmo": "fcfs"}, {"algoritmo": "sjf"}, {"algoritmo": "rr", "quantum": 4}]
+        resultados = comparar(procesos, variantes)
+        tabla = lado_a_lado(variantes, resultados)
+        self.assertEqual([c["etiqueta"] for c in tabla["columnas"]], ["FCFS", "SJF", "RR q=4"])
+        filas = {fila["metrica"]: fila for fila in tabla["filas"]}
+        espera = filas["avg_wait"]["valores"]
+        self.assertEqual([v["valor"] for v in espera], [r.avg_wait for r in resultados])
+        mejor = min(r.avg_wait for r in resultados)
+        self.assertEqual([v["mejor"] for v in espera], [r.avg_wait == mejor for r in resultados])
+        json.dumps(tabla)
+
+
+    def test_etiquetas_distinguen_opciones(self):
+        variantes = [
+            {"algoritmo": "mlfq", "quantum": 2},
+            {"algoritmo": "mlfq", "quantum": 2, "niveles": 4},
+            {"algoritmo": "mlfq", "quantum": 2, "boost": 50},
+            {"algoritmo": "cfs"},
+            {"algoritmo": "cfs", "latencia": 48},
+        ]
+        etiquetas = [comparacion.etiqueta(variante) for variante in variantes]
+        self.assertEqual(len(set(etiquetas)), len(variantes))
+        self.assertEqual(etiquetas[0], "MLFQ q=2 niveles=3")
+        self.assertEqual(etiquetas[2], "MLFQ q=2 niveles=3 boost=50")
+        self.assertEqual(etiquetas[3], "CFS latencia=24 granularidad=3")
+
+
+if __name__ == "__main__":
+    unittest.main()
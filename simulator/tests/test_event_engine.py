@@ -0,0 +1,139 @@
+import random
+import unittest
+
+from simulator.core.engine.algorithms.cfs import CFSAlgorithm
+from simulator.core.engine.algorithms.fcfs import FCFSAlgorithm
+from simulator.core.engine.algorithms.mlfq import MLFQAlgorithm
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.algorithms.sjf import SJFAlgorithm
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+
+
+def _carga(semilla, n=40):
+    rnd = random.Random(semilla)
+    llegada = 0
+    pcbs = []
+    for pid in range(1, n + 1):
+        llegada += rnd.randint(0, 6)
+        pcbs.append(PCB(pid=pid, arrival_time=llegada, burst_time=rnd.randint(1, 30)))
+    return pcbs
+
+
+def _simular(engine, algoritmo, semilla, io_enabled, max_time=None):
+    config = SimulationConfig(
+        algorithm=algoritmo, io_enabled=io_enabled, engine=engine, max_time=max_time
+    )
+    sim = SchedulerSimulator(config)
+    random.seed(semilla)  # prepare_io_schedule usa el módulo random global
+    sim.load_jobs(_carga(semilla))
+    metrics = sim.run()
+    return sim, metrics
+
+
+class TestMotorPorEventos(unittest.TestCase):
+    def _comparar(self, fabrica, io_enabled, max_time=None):
+        for semilla in range(5):
+            tick_sim, tick_m = _simular("tick", fabrica(), semilla, io_enabled, max_time)
+            ev_sim, ev_m = _simular("event", fabrica(), semilla, io_enabled, max_time)
+
+            self.assertEqual(tick_sim.timeline.to_list(), ev_sim.timeline.to_list())
+            self.assertEqual(tick_sim.clock, ev_sim.clock)
+            self.assertEqual(tick_m.context_switches, ev_m.context_switches)
+            self.assertEqual(tick_m.throughput, ev_m.throughput)
+            self.assertEqual(tick_m.cpu_utilization, ev_m.cpu_utilization)
+            self.assertEqual(
+                [(p.pid, p.waiting_time, p.turnaround_time, p.response_time) for p in tick_m.processes],
+                [(p.pid, p.waiting_time, p.turnaround_time, p.response_time) for p in ev_m.processes],
+            )
+
+    def test_fcfs_equivale_al_modo_tick(self):
+        self._comparar(FCFSAlgorithm, io_enabled=False)
+        self._comparar(FCFSAlgorithm, io_enabled=True)
+
+    def test_sjf_equivale_al_modo_tick(self):
+        self._comparar(SJFAlgorithm, io_enabled=False)
+        self._comparar(SJFAlgorithm, io_enabled=True)
+
+    def test_rr_equivale_al_modo_tick(self):
+        for quantum in (1, 3, 8):
+            self._comparar(lambda: RoundRobinAlgorithm(quantum=quantum), io_enabled=False)
+            self._comparar(lambda: RoundRobinAlgorithm(quantum=quantum), io_enabled=True)
+
+    def test_mlfq_equivale_al_modo_tick(self):
+        for quanta, boost in (((1, 2, 4), None), ((2, 5), 17), ((3,), 10)):
+            self._comparar(lambda: MLFQAlgorithm(quanta, boost), io_enabled=False)
+            self._comparar(lambda: MLFQAlgorithm(quanta, boost), io_enabled=True)
+
+    def test_cfs_equivale_al_modo_tick(self):
+        for latencia, granularidad in ((24, 3), (6, 2), (5, 5)):
+            self._comparar(lambda: CFSAlgorithm(latencia, granularidad), io_enabled=False)
+            self._comparar(lambda: CFSAlgorithm(latencia, granularidad), io_enabled=True)
+
+    def test_respeta_max_time(self):
+        self._comparar(lambda: RoundRobinAlgorithm(quantum=4), io_enabled=True, max_time=57)
+
+    def test_rafagas_largas_usan_pocos_segmentos(self):
+        sim = SchedulerSimulator(
+            SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False, engine="event")
+        )
+        sim.load_jobs([PCB(pid=1, arrival_time=0, burst_time=100_000)])
+        sim.run()
+        self.assertEqual(sim.timeline.to_list(), [{"t": 0, "pid": 1, "evento": "run", "dur": 100_000}])
+
+    def test_motor_desconocido(self):
+        sim = SchedulerSimulator(SimulationConfig(algorithm=FCFSAlgorithm(), engine="warp"))
+        sim.load_jobs([PCB(pid=1, arrival_time=0, burst_time=1)])
+        with self.assertRaises(ValueError):
+            sim.run()
+
+    def test_progreso_y_aborto(self):
+        vistos = []
+        sim = SchedulerSimulator(SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=False))
+        sim.load_jobs(_carga(1, n=10))
+        sim.run(lambda terminados, total: vistos.append((terminados, total)))
+        self.assertEqual(vistos, [(i, 10) for i in range(1, 11)])
+
+        class Cancelado(Exception):
+            pass
+
+        def cancelar(terminados, total):
+            if terminados == 3:
+                raise Cancelado
+
+        sim.load_jobs(_carga(1, n=10))
+        with self.assertRaises(Cancelado):
+            sim.run(cancelar)
+
+    def test_iter_run_reconstruye_la_ejecucion(self):
+        esperado_sim, esperado = _simular("event", RoundRobinAlgorithm(quantum=3), 5, True)
+        sim = SchedulerSimulator(SimulationConfig(
+            algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True, engine="event"))
+        random.seed(5)
+        sim.load_jobs(_carga(5))
+        segmentos = {}
+        pasos = list(sim.iter_run(batch_size=5))
+        for paso in pasos:
+            for seg in paso.segments:
+                segmentos[seg["t"]] = seg
+        self.assertGreater(len(pasos), 3)
+        self.assertTrue(pasos[-1].done)
+        self.assertFalse(any(paso.done for paso in pasos[:-1]))
+        self.assertEqual(list(segmentos.values()), esperado_sim.timeline.to_list())
+        self.assertEqual(pasos[-1].metrics.context_switches, esperado.context_switches)
+        self.assertEqual(pasos[-1].completed, 40)
+        self.assertEqual([p.completed for p in pasos], sorted(p.completed for p in pasos))
+
+    def test_planificador_pasos_equivale_a_run(self):
+        from simulator.core.scheduler import Planificador
+
+        procesos = [{"pid": i, "llegada": i % 5, "rafaga": 2 + i % 7} for i in range(1, 30)]
+        for algoritmo in ("fcfs", "sjf", "srtf", "rr"):
+            resultado = Planificador()._run(procesos, algoritmo, 2)
+            final = list(Planificador().pasos(procesos, algoritmo, 2, tamano_lote=4))[-1]
+            self.assertEqual(final.avg_wait, resultado.avg_wait, algoritmo)
+            self.assertEqual(final.percentiles, resultado.percentiles, algoritmo)
+
+
+if __name__ == '__main__':
+    unittest.main()
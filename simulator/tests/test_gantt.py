@@ -0,0 +1,107 @@
+import importlib.util
+import random
+import unittest
+
+from simulator.core import gantt
+from simulator.core.engine.timeline import Timeline
+
+
+def _timeline(segmentos):
+    tl = Timeline()
+    for t, pid, dur in segmentos:
+        tl.record(t, pid, dur)
+    return tl
+
+
+class TestGantt(unittest.TestCase):
+    def test_ventana_recorta_los_extremos(self):
+        tl = _timeline([(0, 1, 4), (4, None, 2), (6, 2, 4)])
+        self.assertEqual(list(tl.window(2, 8)), [(2, 1, 2), (4, None, 2), (6, 2, 2)])
+        self.assertEqual(list(tl.window(10, 20)), [])
+
+    def test_sin_reduccion_un_pixel_por_tick(self):
+        tl = _timeline([(0, 1, 3), (3, 2, 2), (5, None, 1)])
+        self.assertEqual(
+            gantt.reducir(tl, 6),
+            [gantt.Barra(0, 3, 1), gantt.Barra(3, 5, 2), gantt.Barra(5, 6, None)],
+        )
+
+    def test_cada_columna_toma_el_pid_dominante(self):
+        # 2 px para 8 ticks: la primera columna es sobre todo P1 y la segunda P2.
+        tl = _timeline([(0, 1, 3), (3, 2, 1), (4, 2, 3), (7, 1, 1)])
+        self.assertEqual(
+            gantt.reducir(tl, 2), [gantt.Barra(0, 1, 1, True), gantt.Barra(1, 2, 2, True)]
+        )
+
+    def test_funde_columnas_del_mismo_pid(self):
+        segmentos = []
+        for t in range(0, 1000, 2):
+            segmentos.append((t, 1, 2))
+            segmentos.append((1000 + t, 2, 1))
+            segmentos.append((1001 + t, 3, 1))
+        tl = _timeline(sorted(segmentos))
+        barras = gantt.reducir(tl, 10)
+        self.assertEqual(barras[0], gantt.Barra(0, 5, 1))
+        self.assertEqual([b.x1 for b in barras][-1], 10)
+
+    def test_nunca_mas_barras_que_pixeles(self):
+        rng = random.Random(3)
+        tl, t = Timeline(), 0
+        for _ in range(20_000):
+            dur = rng.randint(1, 5)
+            tl.record(t, rng.choice([None, 1, 2, 3, 4]), dur)
+            t += dur
+        for ancho in (1, 7, 100, 800):
+            barras = gantt.reducir(tl, ancho)
+            self.assertLessEqual(len(barras), ancho)
+            self.assertEqual(barras[0].x0, 0)
+            self.assertEqual(barras[-1].x1, ancho)
+            for anterior, siguiente in zip(barras, barras[1:]):
+                self.assertEqual(anterior.x1, siguiente.x0)
+
+    def test_timeline_y_lista_serializada_dan_lo_mismo(self):
+        tl = _timeline([(0, 1, 5), (5, 2, 3), (8, None, 4), (12, 1, 9), (21, 3, 2)])
+        for inicio, fin in ((0, None), (3, 14), (9, 30)):
+            self.assertEqual(
+                gantt.reducir(tl, 13, inicio, fin), gantt.reducir(tl.to_list(), 13, inicio, fin)
+            )
+
+    def test_svg(self):
+        tl = _timeline([(0, 1, 5), (5, None, 5)])
+        svg = gantt.renderizar(tl, "svg", ancho=100, alto=40).decode()
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertIn('width="100" height="40"', svg)
+        self.assertIn("<title>P1 · t=0–5</title>", svg)
+        self.assertIn("CPU ociosa", svg)
+        self.assertEqual(svg.count("<rect"), 2)
+
+    def test_svg_de_timeline_vacia(self):
+        svg = gantt.renderizar([], "svg", ancho=50, alto=30).decode()
+        self.assertNotIn("<rect", svg)
+
+    @unittest.skipUnless(importlib.util.find_spec("PIL"), "Pillow no está instalado")
+    def test_png(self):
+        png = gantt.renderizar(_timeline([(0, 1, 5)]), "png", ancho=64, alto=32)
+        self.assertTrue(png.startswith(b"\x89PNG"))
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            gantt.renderizar([], "gif")
+        with self.assertRaises(ValueError):
+            gantt.renderizar([], "svg", ancho=gantt.ANCHO_MAX + 1)
+        with self.assertRaises(ValueError):
+            gantt.renderizar([], "svg", alto=10)
+
+    def test_clave_imagen_distingue_vistas(self):
+        claves = {
+            gantt.clave_imagen("abc", "svg", 800, 60, 0, None),
+            gantt.clave_imagen("abc", "png", 800, 60, 0, None),
+            gantt.clave_imagen("abc", "svg", 400, 60, 0, None),
+            gantt.clave_imagen("abc", "svg", 800, 60, 10, None),
+            gantt.clave_imagen("abc", "svg", 800, 60, 0, 50),
+        }
+        self.assertEqual(len(claves), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import pickle
+import random
+import unittest
+
+from simulator.core.engine.histogram import LatencyHistograms, LogHistogram
+from simulator.core.scheduler import Planificador
+
+
+def _exacto(valores, q):
+    ordenados = sorted(valores)
+    rango = max(1, -(-len(ordenados) * q // 100))
+    return ordenados[int(rango) - 1]
+
+
+class TestLogHistogram(unittest.TestCase):
+    def test_exacto_en_valores_pequenos(self):
+        hist = LogHistogram()
+        for v in range(200):
+            hist.record(v)
+        self.assertEqual(hist.percentile(50), 99)
+        self.assertEqual(hist.percentile(99), 197)
+        self.assertEqual(hist.summary()["max"], 199)
+
+    def test_error_relativo_acotado(self):
+        rng = random.Random(3)
+        valores = [int(rng.lognormvariate(6, 2)) for _ in range(5000)]
+        hist = LogHistogram()
+        for v in valores:
+            hist.record(v)
+        for q in (50, 90, 95, 99, 99.9):
+            exacto = _exacto(valores, q)
+            self.assertGreaterEqual(hist.percentile(q), exacto)
+            self.assertLessEqual(hist.percentile(q), exacto * (1 + 2 ** -7) + 1)
+        self.assertEqual(hist.percentile(100), max(valores))
+
+    def test_combinar_es_exacto(self):
+        rng = random.Random(8)
+        valores = [rng.randint(0, 10 ** 6) for _ in range(3000)]
+        total, partes = LogHistogram(), [LogHistogram() for _ in range(4)]
+        for i, v in enumerate(valores):
+            total.record(v)
+            partes[i % 4].record(v)
+        combinado = LogHistogram()
+        for parte in partes:
+            combinado.merge(pickle.loads(pickle.dumps(parte)))
+        self.assertEqual(combinado, total)
+        self.assertEqual(combinado.summary(), total.summary())
+        with self.assertRaises(ValueError):
+            combinado.merge(LogHistogram(sub_bucket_bits=4))
+
+
+class TestPercentilesPorUsuario(unittest.TestCase):
+    def test_resultado_reporta_colas_por_usuario(self):
+        procesos = [
+            {"pid": i, "llegada": 0, "rafaga": 3, "usuario": "ana" if i % 2 else "luis"}
+            for i in range(1, 11)
+        ]
+        for metodo in ("fcfs", "round_robin"):
+            resultado = getattr(Planificador(), metodo)(procesos)
+            self.assertEqual(set(resultado.percentiles_por_usuario), {"ana", "luis"})
+            espera = resultado.percentiles["waiting"]
+            self.assertEqual(espera["count"], 10)
+            self.assertEqual(
+                espera["max"], max(p["waiting_time"] for p in resultado.completed)
+            )
+            self.assertEqual(resultado.percentiles_por_usuario["ana"]["response"]["count"], 5)
+
+    def test_latency_histograms_merge(self):
+        a, b = LatencyHistograms(), LatencyHistograms()
+        a.record(1, 2)
+        b.record(300, None)
+        a.merge(b)
+        self.assertEqual(a.summary()["waiting"]["max"], 300)
+        self.assertEqual(a.summary()["response"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+from simulator.core.engine.io_schedule import IOScheduleTable, generate_io_schedules
+from simulator.core.engine.pcb import PCB
+
+PARAMS = dict(interval_mean=4.0, interval_stddev=1.5, duration_mean=3.0, duration_stddev=1.0)
+
+
+class TestPlanesDeIO(unittest.TestCase):
+    def test_lote_equivale_a_preparar_uno_por_uno(self):
+        rafagas = [1, 5, 40, 0, 17, 60]
+        activos = [True, True, False, True, True, True]
+        tabla = generate_io_schedules(rafagas, enabled=activos, rng=random.Random(5), **PARAMS)
+
+        rng = random.Random(5)
+        for fila, (rafaga, activo) in enumerate(zip(rafagas, activos)):
+            pcb = PCB(pid=fila, arrival_time=0, burst_time=rafaga)
+            pcb.prepare_io_schedule(enabled=activo, rng=rng, **PARAMS)
+            self.assertEqual(tabla.events(fila), pcb.io_schedule)
+        self.assertEqual(tabla.rows, len(rafagas))
+        self.assertEqual(tabla.events(2), [])
+
+    def test_max_events_y_desactivado(self):
+        tabla = generate_io_schedules([500, 500], max_events=2, rng=random.Random(1), **PARAMS)
+        self.assertEqual([len(tabla.events(i)) for i in range(2)], [2, 2])
+        vacia = generate_io_schedules([500], max_events=0, rng=random.Random(1), **PARAMS)
+        self.assertEqual(list(vacia.offsets), [0, 0])
+
+    def test_pcb_consume_su_fila(self):
+        pcb = PCB(pid=1, arrival_time=0, burst_time=10)
+        pcb.attach_io_schedule(IOScheduleTable.from_events([(2, 3), (6, 1)]), 0)
+        self.assertEqual(pcb.cpu_until_next_io(), 2)
+        pcb.consume(2)
+        self.assertEqual(pcb.io_request_due(), (True, 3))
+        self.assertEqual(pcb.io_remaining_time, 3)
+        self.assertEqual(pcb.cpu_until_next_io(), 4)
+        pcb.consume(4)
+        self.assertEqual(pcb.io_request_due(), (True, 1))
+        self.assertIsNone(pcb.cpu_until_next_io())
+        self.assertEqual(pcb.io_request_due(), (False, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
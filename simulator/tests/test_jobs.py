@@ -0,0 +1,249 @@
+"""
+Cola de trabajos (simulator.jobs), su API y el límite de tamaño que la
+acompaña (SIMULATOR_JOB_THRESHOLD). Necesitan Django con la base de datos
+de pruebas: `python manage.py test simulator.tests.test_jobs`.
+"""
+
+import json
+import threading
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+try:
+    from django.apps import apps
+except ImportError:
+    raise unittest.SkipTest("Django no está instalado")
+if not apps.ready:
+    raise unittest.SkipTest("Django no está configurado (usa manage.py test)")
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from simulator import jobs
+from simulator.core.engine.timeline import Timeline
+from simulator.models import LineaTiempo, SimulationJob
+
+Estado = SimulationJob.Estado
+
+
+def _procesos(n=40):
+    return [{"pid": i, "llegada": i % 5, "rafaga": 1 + i % 7} for i in range(1, n + 1)]
+
+
+def _sin_hilo():
+    """Late una vez en el hilo actual en lugar de arrancar el hilo de latido."""
+    return mock.patch.object(jobs.Latido, "start", jobs.Latido.latir)
+
+
+class TestCola(TestCase):
+    def test_encolar(self):
+        job = jobs.encolar(_procesos(), "mlfq", 3, {"niveles": 2, "boost": None})
+        self.assertEqual(job.estado, Estado.EN_COLA)
+        self.assertEqual(job.opciones, {"niveles": 2, "boost": None})
+        self.assertEqual(jobs.encolar(_procesos(), "fcfs").opciones, {})
+
+    def test_reclamar_en_orden(self):
+        primero = jobs.encolar(_procesos(), "fcfs")
+        segundo = jobs.encolar(_procesos(), "sjf")
+        reclamado = jobs.reclamar("w1")
+        self.assertEqual(reclamado.pk, primero.pk)
+        self.assertEqual((reclamado.estado, reclamado.worker), (Estado.EJECUTANDO, "w1"))
+        self.assertIsNotNone(reclamado.iniciado)
+        self.assertEqual(jobs.reclamar("w2").pk, segundo.pk)
+        self.assertIsNone(jobs.reclamar("w3"))
+
+    def test_cancelar_en_cola(self):
+        job = jobs.cancelar(jobs.encolar(_procesos(), "fcfs"))
+        self.assertEqual(job.estado, Estado.CANCELADO)
+        self.assertIsNotNone(job.terminado)
+        self.assertIsNone(jobs.reclamar("w1"))
+
+    def test_cancelar_en_ejecucion(self):
+        jobs.encolar(_procesos(2000), "rr", 1)
+        job = jobs.reclamar("w1")
+        self.assertEqual(jobs.cancelar(job).estado, Estado.EJECUTANDO)
+        self.assertTrue(job.cancelacion_solicitada)
+        with _sin_hilo():
+            job = jobs.ejecutar(job)
+        self.assertEqual(job.estado, Estado.CANCELADO)
+        self.assertIsNone(job.resultado)
+
+    def test_ejecutar_guarda_resumen_y_linea_de_tiempo(self):
+        jobs.encolar(_procesos(), "rr", 2)
+        job = jobs.ejecutar(jobs.reclamar("w1"))
+        self.assertEqual((job.estado, job.progreso), (Estado.TERMINADO, 1.0))
+        self.assertNotIn("completed", job.resultado)
+        self.assertNotIn("timeline", job.resultado)
+        linea = LineaTiempo.cargar(job.clave)
+        ocupado = sum(seg["dur"] for seg in linea if seg["pid"] is not None)
+        self.assertEqual(ocupado, sum(p["rafaga"] for p in _procesos()))
+
+    def test_ejecutar_no_pisa_a_otro_worker(self):
+        jobs.encolar(_procesos(), "fcfs")
+        job = jobs.reclamar("w1")
+        # Reencolado por huérfano y reclamado por otro worker mientras w1 simulaba.
+        SimulationJob.objects.filter(pk=job.pk).update(worker="w2")
+        with _sin_hilo():
+            job = jobs.ejecutar(job)
+        self.assertEqual((job.estado, job.worker), (Estado.EJECUTANDO, "w2"))
+        self.assertIsNone(job.resultado)
+
+    def test_latido(self):
+        jobs.encolar(_procesos(), "fcfs")
+        job = jobs.reclamar("w1")
+        antes = timezone.now() - timedelta(hours=1)
+        SimulationJob.objects.filter(pk=job.pk).update(actualizado=antes)
+        latido = jobs.Latido(job, 60)
+        latido.progreso = 0.5
+        latido.latir()
+        job.refresh_from_db()
+        self.assertEqual(job.progreso, 0.5)
+        self.assertGreater(job.actualizado, antes)
+        self.assertFalse(latido.cancelar.is_set())
+        SimulationJob.objects.filter(pk=job.pk).update(worker="w2")
+        latido.latir()
+        self.assertTrue(latido.perdido)
+        self.assertTrue(latido.cancelar.is_set())
+
+    def test_reencolar_huerfanos(self):
+        for _ in range(3):
+            jobs.encolar(_procesos(), "fcfs")
+        huerfano, cancelado, vivo = (jobs.reclamar(f"w{i}") for i in range(3))
+        jobs.cancelar(cancelado)
+        viejo = timezone.now() - timedelta(minutes=30)
+        SimulationJob.objects.filter(pk__in=[huerfano.pk, cancelado.pk]).update(actualizado=viejo)
+        self.assertEqual(jobs.reencolar_huerfanos(timedelta(minutes=10)), 1)
+        estados = dict(SimulationJob.objects.values_list("pk", "estado"))
+        self.assertEqual(estados[huerfano.pk], Estado.EN_COLA)
+        self.assertEqual(estados[cancelado.pk], Estado.CANCELADO)
+        self.assertEqual(estados[vivo.pk], Estado.EJECUTANDO)
+        self.assertEqual(jobs.reclamar("w9").pk, huerfano.pk)
+
+    def test_purgar_lineas_tiempo(self):
+        for clave in ("vieja", "nueva"):
+            LineaTiempo.guardar(clave, Timeline())
+        LineaTiempo.objects.filter(clave="vieja").update(creado=timezone.now() - timedelta(days=8))
+        self.assertEqual(jobs.purgar_lineas_tiempo(timedelta(days=7)), 1)
+        self.assertIsNone(LineaTiempo.cargar("vieja"))
+        self.assertIsNotNone(LineaTiempo.cargar("nueva"))
+
+
+class TestReclamarConcurrente(TransactionTestCase):
+    @skipUnlessDBFeature("has_select_for_update_skip_locked")
+    def test_salta_filas_bloqueadas(self):
+        primero = jobs.encolar(_procesos(), "fcfs")
+        segundo = jobs.encolar(_procesos(), "sjf")
+        bloqueado, soltar = threading.Event(), threading.Event()
+
+        def bloquear():
+            try:
+                with transaction.atomic():
+                    list(SimulationJob.objects.select_for_update().filter(pk=primero.pk))
+                    bloqueado.set()
+                    soltar.wait(10)
+            finally:
+                connection.close()
+
+        hilo = threading.Thread(target=bloquear)
+        hilo.start()
+        try:
+            self.assertTrue(bloqueado.wait(10))
+            self.assertEqual(jobs.reclamar("w1").pk, segundo.pk)
+        finally:
+            soltar.set()
+            hilo.join()
+        self.assertEqual(jobs.reclamar("w2").pk, primero.pk)
+
+
+class TestApiTrabajos(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def _crear(self, **datos):
+        datos.setdefault("procesos", _procesos())
+        datos.setdefault("algoritmo", "rr")
+        datos.setdefault("quantum", 2)
+        return self.client.post(reverse("api_jobs"), datos, format="json")
+
+    def test_crear_y_consultar(self):
+        respuesta = self._crear()
+        self.assertEqual(respuesta.status_code, 202)
+        detalle = reverse("api_job_detail", args=[respuesta.data["id"]])
+        self.assertEqual(respuesta["Location"], detalle)
+        self.assertEqual(self.client.get(detalle).data["estado"], Estado.EN_COLA)
+        self.assertEqual(self._crear(procesos=[]).status_code, 400)
+
+    def test_cancelar(self):
+        pk = self._crear().data["id"]
+        url = reverse("api_job_cancel", args=[pk])
+        self.assertEqual(self.client.post(url).data["estado"], Estado.CANCELADO)
+        self.assertEqual(self.client.post(url).status_code, 409)
+
+    def test_resultado_y_gantt(self):
+        pk = self._crear().data["id"]
+        resultado = reverse("api_job_result", args=[pk])
+        gantt = reverse("api_job_gantt", args=[pk, "svg"])
+        self.assertEqual(self.client.get(resultado).status_code, 409)
+        self.assertEqual(self.client.get(gantt).status_code, 409)
+
+        jobs.ejecutar(jobs.reclamar("w1"))
+        datos = self.client.get(resultado).data
+        self.assertNotIn("timeline", datos)
+        pagina = self.client.get(resultado, {"timeline": 1, "timeline_page_size": 5}).data["timeline"]
+        self.assertEqual((pagina["page"], len(pagina["segments"])), (1, 5))
+        self.assertGreater(pagina["total"], 5)
+        self.assertEqual(self.client.get(resultado, {"timeline": 1, "timeline_page": "x"}).status_code, 400)
+
+        imagen = self.client.get(gantt, {"ancho": 200})
+        self.assertEqual(imagen.status_code, 200)
+        self.assertEqual(imagen["Content-Type"], "image/svg+xml")
+        self.assertTrue(imagen.content.startswith(b"<svg"))
+
+
+class TestApiComparar(TestCase):
+    @override_settings(SIMULATOR_JOB_THRESHOLD=30)
+    def test_rechaza_cargas_por_encima_del_umbral(self):
+        client, url = APIClient(), reverse("api_compare")
+        respuesta = client.post(url, {"procesos": _procesos(31)}, format="json")
+        self.assertEqual(respuesta.status_code, 400)
+        self.assertIn("30", respuesta.data["detail"])
+        respuesta = client.post(url, {"procesos": _procesos(30)}, format="json")
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(respuesta.data["resultados"]), 3)
+
+
+class TestApiLotes(TestCase):
+    @override_settings(SIMULATOR_JOB_THRESHOLD=30)
+    def test_rechaza_cargas_por_encima_del_umbral(self):
+        client, url = APIClient(), reverse("api_batch")
+        carga = {"algoritmo": "fcfs", "procesos": _procesos(20)}
+        respuesta = client.post(url, {"cargas": [carga, carga]}, format="json")
+        self.assertEqual(respuesta.status_code, 400)
+        self.assertIn("30", respuesta.data["detail"])
+        respuesta = client.post(url, {"cargas": [carga]}, format="json")
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(b"".join(respuesta.streaming_content).splitlines()), 1)
+
+
+class TestStream(TestCase):
+    @override_settings(SIMULATOR_JOB_THRESHOLD=30)
+    def test_carga_grande_no_encola(self):
+        url = reverse("stream_simulation")
+        consulta = {"algoritmo": "fcfs", "procesos_json": json.dumps(_procesos(31))}
+        for _ in range(2):
+            respuesta = self.client.get(url, consulta)
+            cuerpo = b"".join(respuesta.streaming_content).decode()
+            self.assertIn("event: error", cuerpo)
+            self.assertIn(reverse("api_jobs"), cuerpo)
+        self.assertFalse(SimulationJob.objects.exists())
+        consulta["procesos_json"] = json.dumps(_procesos(30))
+        cuerpo = b"".join(self.client.get(url, consulta).streaming_content).decode()
+        self.assertIn("event: done", cuerpo)
+
+
+if __name__ == "__main__":
+    unittest.main()
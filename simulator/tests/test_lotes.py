@@ -0,0 +1,46 @@
+import json
+import unittest
+
+from simulator.core.cache import CacheResultados
+from simulator.core.lotes import simular_lote
+from simulator.core.metrics import resultado_a_dict
+from simulator.core.scheduler import Planificador
+
+
+def _cargas():
+    procesos = [{"pid": i, "llegada": i % 4, "rafaga": 1 + i % 5} for i in range(1, 40)]
+    return [
+        {"id": "a", "algoritmo": "rr", "quantum": 2, "procesos": procesos},
+        {"id": "b", "algoritmo": "srtf", "procesos": procesos},
+        {"id": "c", "algoritmo": "fcfs", "procesos": procesos[:5]},
+        {"id": "mala", "algoritmo": "lottery", "procesos": procesos},
+    ]
+
+
+class TestSimularLote(unittest.TestCase):
+    def test_paralelo_igual_a_serie(self):
+        serie = sorted(simular_lote(_cargas(), max_workers=1), key=lambda l: l["index"])
+        paralelo = sorted(simular_lote(_cargas(), max_workers=2), key=lambda l: l["index"])
+        self.assertEqual(serie, paralelo)
+        self.assertEqual([l["id"] for l in serie], ["a", "b", "c", "mala"])
+        self.assertIn("error", serie[3])
+        esperado = Planificador().round_robin(_cargas()[0]["procesos"], quantum=2)
+        self.assertEqual(serie[0]["resultado"], resultado_a_dict(esperado))
+        self.assertNotIn("timeline", serie[0]["resultado"])
+        json.dumps(serie)
+
+    def test_timeline_paginada_y_cache(self):
+        cache = CacheResultados()
+        opciones = {"timeline": True, "timeline_page": 2, "timeline_page_size": 3, "max_workers": 1}
+        primera = list(simular_lote(_cargas()[:1], cache=cache, **opciones))
+        segunda = list(simular_lote(_cargas()[:1], cache=cache, **opciones))
+        self.assertEqual(primera, segunda)
+        self.assertEqual(cache.estadisticas.hits, 1)
+        pagina = primera[0]["resultado"]["timeline"]
+        completa = Planificador().round_robin(_cargas()[0]["procesos"], quantum=2).timeline
+        self.assertEqual(pagina["total"], len(completa))
+        self.assertEqual(pagina["segments"], completa[3:6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+import statistics
+import unittest
+
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.metrics import RunningStat
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+
+
+def _jobs():
+    return [PCB(pid=i, arrival_time=3 * i, burst_time=4 + i % 9) for i in range(1, 60)]
+
+
+class TestRunningStat(unittest.TestCase):
+    def test_coincide_con_statistics_y_se_puede_combinar(self):
+        rng = random.Random(4)
+        valores = [rng.uniform(0, 100) for _ in range(500)]
+        a, b, total = RunningStat(), RunningStat(), RunningStat()
+        for i, v in enumerate(valores):
+            (a if i % 3 else b).add(v)
+            total.add(v)
+        a.merge(b)
+        for stat in (a, total):
+            self.assertEqual(stat.count, 500)
+            self.assertAlmostEqual(stat.mean, statistics.fmean(valores))
+            self.assertAlmostEqual(stat.stddev, statistics.stdev(valores))
+            self.assertEqual(stat.min, min(valores))
+            self.assertEqual(stat.max, max(valores))
+
+    def test_ignora_none(self):
+        stat = RunningStat()
+        stat.add(None)
+        self.assertEqual(stat.as_dict()["count"], 0)
+        self.assertEqual(stat.mean, 0.0)
+
+
+class TestSoloResumen(unittest.TestCase):
+    def _run(self, summary_only):
+        sim = SchedulerSimulator(SimulationConfig(
+            algorithm=RoundRobinAlgorithm(quantum=2), io_enabled=True, seed=5,
+            engine="event", summary_only=summary_only))
+        sim.load_jobs(_jobs())
+        return sim, sim.run()
+
+    def test_mismos_promedios_sin_retener_procesos(self):
+        sim_full, full = self._run(False)
+        sim_lite, lite = self._run(True)
+        self.assertEqual(lite.processes, [])
+        self.assertEqual(sim_lite.completed, [])
+        self.assertEqual(len(sim_lite.timeline), 0)
+        self.assertEqual(lite.completed, full.completed)
+        self.assertEqual(lite.makespan, full.makespan)
+        self.assertEqual(lite.waiting.mean, full.waiting.mean)
+        self.assertEqual(
+            full.turnaround.mean,
+            sum(p.turnaround_time for p in full.processes) / len(full.processes),
+        )
+        self.assertGreater(len(sim_full.timeline), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from simulator.core.engine.algorithms.mlfq import MLFQAlgorithm
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.scheduler import Planificador, crear_algoritmo
+
+
+def _simular(algoritmo, pcbs):
+    sim = SchedulerSimulator(SimulationConfig(algorithm=algoritmo, io_enabled=False))
+    sim.load_jobs(pcbs)
+    sim.run()
+    return sim
+
+
+def _tramos(sim):
+    return [(s["t"], s["pid"], s["dur"]) for s in sim.timeline.to_list()]
+
+
+class TestMLFQ(unittest.TestCase):
+    def test_degrada_al_agotar_el_quantum_y_los_nuevos_desplazan(self):
+        sim = _simular(
+            MLFQAlgorithm((2, 4)),
+            [PCB(pid=1, arrival_time=0, burst_time=10), PCB(pid=2, arrival_time=3, burst_time=2)],
+        )
+        # P1 agota el quantum del nivel 0, sigue en el nivel 1 y P2 (nivel 0) lo desplaza al llegar.
+        self.assertEqual(_tramos(sim), [(0, 1, 3), (3, 2, 2), (5, 1, 7)])
+
+    def test_boost_evita_la_inanicion(self):
+        largos = [PCB(pid=1, arrival_time=0, burst_time=30)]
+        # Procesos cortos que llegan sin parar mantendrían a P1 en el último nivel.
+        cortos = [PCB(pid=i, arrival_time=2 * i, burst_time=2) for i in range(2, 20)]
+        sin_boost = _simular(MLFQAlgorithm((1, 2)), largos + cortos)
+        con_boost = _simular(
+            MLFQAlgorithm((1, 2), boost_interval=5),
+            [PCB(pid=p.pid, arrival_time=p.arrival_time, burst_time=p.burst_time) for p in largos + cortos],
+        )
+        inicio_p1 = lambda sim: [t for t, pid, _ in _tramos(sim) if pid == 1]
+        self.assertLess(len(inicio_p1(sin_boost)), len(inicio_p1(con_boost)))
+
+    def test_un_nivel_equivale_a_round_robin(self):
+        def carga():
+            return [PCB(pid=i, arrival_time=i, burst_time=3 + i % 4) for i in range(1, 12)]
+
+        self.assertEqual(
+            _simular(MLFQAlgorithm((3,)), carga()).timeline.to_list(),
+            _simular(RoundRobinAlgorithm(quantum=3), carga()).timeline.to_list(),
+        )
+
+    def test_planificador_y_opciones(self):
+        alg = crear_algoritmo("mlfq", 3, {"niveles": 4, "boost": 50})
+        self.assertEqual(alg.quanta, [3, 6, 12, 24])
+        self.assertEqual(alg.boost_interval, 50)
+        with self.assertRaises(ValueError):
+            crear_algoritmo("mlfq", 2, {"niveles": 17})
+
+        procesos = [{"pid": i, "llegada": i, "rafaga": 4} for i in range(1, 6)]
+        resultado = Planificador().mlfq(procesos, quantum=2, niveles=2)
+        self.assertEqual(len(resultado.completed), 5)
+        # P1 agota su quantum justo cuando llega P2 (nivel 0) y le cede la CPU.
+        self.assertEqual([s["pid"] for s in resultado.timeline[:3]], [None, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
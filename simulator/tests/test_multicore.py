@@ -0,0 +1,118 @@
+import random
+import threading
+import unittest
+
+from simulator.core.engine.algorithms.cfs import CFSAlgorithm
+from simulator.core.engine.algorithms.fcfs import FCFSAlgorithm
+from simulator.core.engine.algorithms.mlfq import MLFQAlgorithm
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.algorithms.srtf import SRTFAlgorithm
+from simulator.core.engine.multicore import LoadBalancer, MultiCoreSimulator
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationCancelled, SimulationConfig
+
+FABRICAS = (
+    FCFSAlgorithm,
+    SRTFAlgorithm,
+    lambda: RoundRobinAlgorithm(quantum=3),
+    lambda: MLFQAlgorithm((1, 2, 4), boost_interval=20),
+    CFSAlgorithm,
+)
+
+
+def _carga(semilla, n=60):
+    rnd = random.Random(semilla)
+    return [
+        PCB(pid=i, arrival_time=rnd.randint(0, 100), burst_time=rnd.randint(1, 40), priority=rnd.choice([None, -5, 5]))
+        for i in range(1, n + 1)
+    ]
+
+
+def _simular(clase, algoritmo, semilla, engine="tick", io_enabled=True, **opciones):
+    sim = clase(SimulationConfig(algorithm=algoritmo, io_enabled=io_enabled, engine=engine), **opciones)
+    random.seed(semilla)  # prepare_io_schedule usa el módulo random global
+    sim.load_jobs(_carga(semilla))
+    return sim, sim.run()
+
+
+class TestMultiCore(unittest.TestCase):
+    def test_un_nucleo_equivale_al_simulador_simple(self):
+        for fabrica in FABRICAS:
+            for semilla in range(3):
+                simple, m_simple = _simular(SchedulerSimulator, fabrica(), semilla)
+                multi, m_multi = _simular(MultiCoreSimulator, fabrica(), semilla, engine="event", cpus=1)
+                self.assertEqual(simple.timeline.to_list(), multi.timeline.to_list())
+                self.assertEqual(m_simple.context_switches, m_multi.context_switches)
+                self.assertEqual(m_multi.migrations, 0)
+
+    def test_motor_por_eventos_equivale_al_modo_tick(self):
+        balanceadores = (LoadBalancer(), LoadBalancer(push_interval=None), LoadBalancer(steal=False))
+        for fabrica in FABRICAS:
+            for balanceador in balanceadores:
+                tick, m_tick = _simular(MultiCoreSimulator, fabrica(), 4, cpus=4, balancer=balanceador)
+                ev, m_ev = _simular(
+                    MultiCoreSimulator, fabrica(), 4, engine="event", cpus=4, balancer=balanceador
+                )
+                self.assertEqual([t.to_list() for t in tick.timelines], [t.to_list() for t in ev.timelines])
+                self.assertEqual(m_tick.per_cpu, m_ev.per_cpu)
+
+    def test_robo_de_trabajo_reparte_la_carga(self):
+        # Los núcleos que solo recibieron procesos cortos quedan libres enseguida
+        # y roban de las colas de los que tienen procesos largos.
+        pcbs = [PCB(pid=i, arrival_time=0, burst_time=40 if i % 4 == 0 else 2) for i in range(16)]
+        resultados = {}
+        for robar in (False, True):
+            sim = MultiCoreSimulator(
+                SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False, engine="event"),
+                cpus=4,
+                balancer=LoadBalancer(push_interval=None, steal=robar),
+            )
+            sim.load_jobs([PCB(pid=p.pid, arrival_time=0, burst_time=p.burst_time) for p in pcbs])
+            resultados[robar] = sim.run()
+        self.assertEqual(resultados[False].migrations, 0)
+        self.assertGreater(resultados[True].migrations, 0)
+        self.assertEqual(
+            resultados[True].migrations, sum(cpu.steals for cpu in resultados[True].per_cpu)
+        )
+        self.assertLess(resultados[True].makespan, resultados[False].makespan)
+
+    def test_metricas_por_cpu(self):
+        sim, metrics = _simular(
+            MultiCoreSimulator, RoundRobinAlgorithm(quantum=2), 7, engine="event", cpus=3
+        )
+        self.assertEqual(len(metrics.per_cpu), 3)
+        self.assertEqual(metrics.completed, 60)
+        ocupado = sum(cpu.busy_time for cpu in metrics.per_cpu)
+        self.assertEqual(ocupado, sum(p.burst_time for p in sim.completed))
+        self.assertAlmostEqual(metrics.cpu_utilization, ocupado / (3 * sim.clock))
+        self.assertEqual(
+            sum(cpu.migrations_in for cpu in metrics.per_cpu),
+            sum(cpu.migrations_out for cpu in metrics.per_cpu),
+        )
+        for cpu, timeline in zip(metrics.per_cpu, sim.timelines):
+            self.assertEqual(sum(s["dur"] for s in timeline if s["pid"] is not None), cpu.busy_time)
+
+    def test_reanuda_desde_snapshot(self):
+        completo, m_completo = _simular(MultiCoreSimulator, CFSAlgorithm(), 2, engine="event", cpus=4)
+
+        sim = MultiCoreSimulator(SimulationConfig(algorithm=CFSAlgorithm(), engine="event"), cpus=4)
+        random.seed(2)
+        sim.load_jobs(_carga(2))
+        sim._advance(max_iterations=40)
+        reanudado = MultiCoreSimulator.restore(sim.snapshot())
+        metrics = reanudado.run()
+        self.assertEqual([t.to_list() for t in reanudado.timelines], [t.to_list() for t in completo.timelines])
+        self.assertEqual(metrics.per_cpu, m_completo.per_cpu)
+
+    def test_cancelar(self):
+        cancelar = threading.Event()
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=1), io_enabled=False, cancel_event=cancelar)
+        sim = MultiCoreSimulator(config, cpus=2)
+        sim.load_jobs(_carga(1, n=200))
+        with self.assertRaises(SimulationCancelled) as cancelada:
+            sim.run(lambda hechos, total: cancelar.set() if hechos == 5 else None)
+        self.assertLess(cancelada.exception.completed, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
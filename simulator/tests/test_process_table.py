@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.algorithms.srtf import SRTFAlgorithm
+from simulator.core.engine.metrics import SimulationMetrics
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.process_table import ProcessTable
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.engine.states import ProcessState
+
+
+def _pcbs(semilla, n=80):
+    rnd = random.Random(semilla)
+    return [
+        PCB(pid=i, arrival_time=rnd.randint(0, 200), burst_time=rnd.randint(1, 25),
+            priority=rnd.choice([None, 3]), metadata={"usuario": rnd.choice(["ana", "luis"])})
+        for i in range(1, n + 1)
+    ]
+
+
+class TestProcessTable(unittest.TestCase):
+    def test_simulacion_sobre_la_tabla_equivale_a_pcbs(self):
+        for fabrica in (lambda: RoundRobinAlgorithm(quantum=3), SRTFAlgorithm):
+            for engine in ("tick", "event"):
+                salidas = []
+                for usar_tabla in (False, True):
+                    config = SimulationConfig(algorithm=fabrica(), io_enabled=True, seed=11, engine=engine)
+                    sim = SchedulerSimulator(config)
+                    pcbs = _pcbs(3)
+                    if usar_tabla:
+                        tabla = ProcessTable.from_pcbs(pcbs)
+                        sim.load_table(tabla)
+                    else:
+                        sim.load_jobs(pcbs)
+                    metrics = sim.run()
+                    salidas.append((
+                        sim.timeline.to_list(),
+                        metrics.context_switches,
+                        [(p.pid, p.waiting_time, p.turnaround_time, p.response_time) for p in metrics.processes],
+                    ))
+                self.assertEqual(salidas[0], salidas[1])
+
+                por_filas = SimulationMetrics.from_table(tabla)
+                self.assertEqual(
+                    sorted((p.pid, p.waiting_time, p.response_time) for p in por_filas.processes),
+                    sorted((pid, w, r) for pid, w, _t, r in salidas[1][2]),
+                )
+
+    def test_vistas_y_columnas(self):
+        tabla = ProcessTable.from_columns([7, 8], [0, 2], [4, 5], usuarios=["ana", "ana"])
+        self.assertEqual(tabla.usuarios, ["ana"])
+        vista = tabla.view(1)
+        self.assertEqual((vista.pid, vista.arrival_time, vista.remaining_time), (8, 2, 5))
+        self.assertIsNone(vista.priority)
+        self.assertEqual(vista.metadata, {"usuario": "ana", "io_enabled": True})
+        vista.consume(2)
+        vista.start_time = 3
+        vista.set_state(ProcessState.RUNNING)
+        self.assertEqual((tabla.remaining[1], tabla.executed[1]), (3, 2))
+        self.assertEqual(vista.response_time, 1)
+        self.assertIs(vista.state, ProcessState.RUNNING)
+        self.assertIsNone(vista.finish_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
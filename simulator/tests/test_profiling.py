@@ -0,0 +1,82 @@
+import unittest
+
+from simulator.core.engine.algorithms.cfs import CFSAlgorithm
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.multicore import MultiCoreSimulator
+from simulator.core.engine.profiling import PHASES, RunProfiler
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.engine.workload import Poisson, WorkloadSpec, generate_workload
+
+_CARGA = generate_workload(WorkloadSpec(300, Poisson(0.12)), seed=4)
+
+
+def _simular(fabrica, engine, profiler=None):
+    config = SimulationConfig(algorithm=fabrica(), io_enabled=True, seed=2, engine=engine, profiler=profiler)
+    sim = SchedulerSimulator(config)
+    sim.load_jobs(_CARGA.fresh())
+    metrics = sim.run()
+    return sim, metrics
+
+
+class TestRunProfiler(unittest.TestCase):
+    def test_no_cambia_la_simulacion(self):
+        for fabrica in (lambda: RoundRobinAlgorithm(quantum=3), CFSAlgorithm):
+            for engine in ("tick", "event"):
+                sim_a, a = _simular(fabrica, engine)
+                sim_b, b = _simular(fabrica, engine, RunProfiler())
+                self.assertEqual(sim_a.timeline.to_list(), sim_b.timeline.to_list())
+                self.assertEqual(
+                    [(p.pid, p.waiting_time) for p in a.processes],
+                    [(p.pid, p.waiting_time) for p in b.processes],
+                )
+                self.assertIsNone(a.profile)
+                self.assertIsNotNone(b.profile)
+
+    def test_fases_y_decisiones(self):
+        profiler = RunProfiler()
+        sim, metrics = _simular(lambda: RoundRobinAlgorithm(quantum=3), "event", profiler)
+        fases = metrics.profile["phases"]
+        self.assertEqual(list(fases), list(PHASES))
+        self.assertEqual(fases["admission"]["calls"], len(_CARGA))
+        self.assertEqual(fases["metrics"]["calls"], len(_CARGA))
+        self.assertEqual(fases["timeline"]["calls"], profiler.phases["timeline"].calls)
+        self.assertGreater(fases["blocked"]["calls"], 0)
+        self.assertAlmostEqual(sum(datos["share"] for datos in fases.values()), 1.0)
+        decisiones = metrics.profile["decisions"]
+        self.assertEqual(list(decisiones), ["rr"])
+        self.assertEqual(decisiones["rr"]["count"], fases["next_tick"]["calls"])
+
+    def test_acumula_entre_ejecuciones(self):
+        profiler = RunProfiler()
+        _simular(lambda: RoundRobinAlgorithm(quantum=3), "event", profiler)
+        _, metrics = _simular(CFSAlgorithm, "event", profiler)
+        self.assertEqual(list(metrics.profile["decisions"]), ["cfs", "rr"])
+        self.assertEqual(metrics.profile["phases"]["admission"]["calls"], 2 * len(_CARGA))
+        profiler.reset()
+        self.assertEqual(profiler.report()["decisions"], {})
+
+    def test_reloj_inyectable(self):
+        ticks = iter(range(0, 10**9, 5))
+        profiler = RunProfiler(clock=lambda: next(ticks))
+        _, metrics = _simular(lambda: RoundRobinAlgorithm(quantum=3), "event", profiler)
+        self.assertEqual(metrics.profile["decisions"]["rr"]["max"], 5)
+
+    def test_snapshot_con_profiler(self):
+        config = SimulationConfig(
+            algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True, seed=2, profiler=RunProfiler()
+        )
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(_CARGA.fresh())
+        capturas = []
+        metrics = sim.run(lambda hechos, total: capturas.append(sim.snapshot()) if hechos == 100 else None)
+        reanudado = SchedulerSimulator.restore(capturas[0])
+        self.assertEqual(reanudado.run().makespan, metrics.makespan)
+
+    def test_multicore_no_soportado(self):
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), profiler=RunProfiler())
+        with self.assertRaises(NotImplementedError):
+            MultiCoreSimulator(config, cpus=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
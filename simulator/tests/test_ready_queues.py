@@ -0,0 +1,132 @@
+import unittest
+
+from simulator.core.engine.algorithms.srtf import SRTFAlgorithm
+from simulator.core.engine.pcb import PCB
+import pickle
+
+from simulator.core.engine.queues import BlockedQueue, MultiLevelReadyQueue, PriorityReadyQueue
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+
+
+def _pcb(pid, rafaga, llegada=0):
+    return PCB(pid=pid, arrival_time=llegada, burst_time=rafaga)
+
+
+class TestPriorityReadyQueue(unittest.TestCase):
+    def setUp(self):
+        self.cola = PriorityReadyQueue(key=lambda pcb: pcb.remaining_time)
+
+    def test_saca_el_menor_y_respeta_orden_en_empates(self):
+        a, b, c, d = _pcb(1, 5), _pcb(2, 3), _pcb(3, 5), _pcb(4, 3)
+        self.cola.extend([a, b, c, d])
+        self.assertEqual(len(self.cola), 4)
+        self.assertIs(self.cola.peek(), b)
+        self.assertEqual([self.cola.dequeue().pid for _ in range(4)], [2, 4, 1, 3])
+        self.assertIsNone(self.cola.dequeue())
+
+    def test_remove_y_update(self):
+        a, b, c = _pcb(1, 5), _pcb(2, 6), _pcb(3, 7)
+        self.cola.extend([a, b, c])
+        self.assertTrue(self.cola.remove(a))
+        self.assertFalse(self.cola.remove(a))
+        self.assertNotIn(a, self.cola)
+        c.remaining_time = 1
+        self.cola.update(c)
+        self.assertEqual([self.cola.dequeue().pid for _ in range(2)], [3, 2])
+        self.assertEqual(len(self.cola), 0)
+        with self.assertRaises(KeyError):
+            self.cola.update(c)
+
+    def test_compacta_entradas_eliminadas(self):
+        pcbs = [_pcb(i, i) for i in range(200)]
+        self.cola.extend(pcbs)
+        for pcb in pcbs[:150]:
+            self.cola.remove(pcb)
+        self.assertLessEqual(len(self.cola._heap), 2 * len(self.cola))
+        self.assertEqual(self.cola.dequeue().pid, 150)
+
+
+class TestMultiLevelReadyQueue(unittest.TestCase):
+    def test_saca_del_nivel_mas_alto_en_orden_fifo(self):
+        cola = MultiLevelReadyQueue(3)
+        a, b, c, d = _pcb(1, 5), _pcb(2, 5), _pcb(3, 5), _pcb(4, 5)
+        cola.set_level(a, 2)
+        cola.set_level(c, 1)
+        cola.extend([a, b, c, d])
+        self.assertEqual(len(cola), 4)
+        self.assertEqual(cola.highest_level(), 0)
+        self.assertIs(cola.peek(), b)
+        self.assertEqual([pcb.pid for pcb in cola], [2, 4, 3, 1])
+        self.assertEqual([cola.dequeue().pid for _ in range(4)], [2, 4, 3, 1])
+        self.assertIsNone(cola.dequeue())
+        self.assertIsNone(cola.highest_level())
+
+    def test_boost_devuelve_todo_al_nivel_cero(self):
+        cola = MultiLevelReadyQueue(3)
+        a, b, fuera = _pcb(1, 5), _pcb(2, 5), _pcb(3, 5)
+        for pcb, nivel in ((a, 2), (b, 1), (fuera, 2)):
+            cola.set_level(pcb, nivel)
+        cola.extend([a, b])
+        cola.boost()
+        self.assertEqual(cola.highest_level(), 0)
+        self.assertEqual(cola.level_of(fuera), 0)
+        self.assertEqual([cola.dequeue().pid for _ in range(2)], [2, 1])
+
+    def test_niveles_sobreviven_a_pickle(self):
+        cola = MultiLevelReadyQueue(2)
+        a, b = _pcb(1, 5), _pcb(2, 5)
+        cola.set_level(a, 1)
+        cola.set_level(b, 1)
+        cola.enqueue(a)
+        copia_cola, copia_b = pickle.loads(pickle.dumps((cola, b)))
+        self.assertEqual(copia_cola.level_of(copia_b), 1)
+        self.assertEqual(copia_cola.dequeue().pid, 1)
+        with self.assertRaises(ValueError):
+            cola.set_level(a, 2)
+
+
+class TestBlockedQueue(unittest.TestCase):
+    def test_despierta_solo_los_vencidos_en_orden_de_bloqueo(self):
+        cola = BlockedQueue()
+        a, b, c = _pcb(1, 5), _pcb(2, 5), _pcb(3, 5)
+        for pcb in (a, b, c):
+            pcb.io_remaining_time = 4
+        cola.block(a, 10)
+        cola.block(b, 7)
+        cola.block(c, 7)
+        self.assertEqual(cola.next_wake_time(), 7)
+        self.assertEqual(cola.pop_due(6), [])
+        self.assertEqual(cola.pop_due(7), [b, c])
+        self.assertIsNone(b.io_remaining_time)
+        cola.sync(8)
+        self.assertEqual(a.io_remaining_time, 2)
+        self.assertEqual(list(cola), [a])
+
+
+class TestSRTF(unittest.TestCase):
+    def test_ejemplo_clasico(self):
+        sim = SchedulerSimulator(SimulationConfig(algorithm=SRTFAlgorithm(), io_enabled=False))
+        sim.load_jobs([_pcb(1, 8, 0), _pcb(2, 4, 1), _pcb(3, 9, 2), _pcb(4, 5, 3)])
+        metrics = sim.run()
+        esperas = {p.pid: p.waiting_time for p in metrics.processes}
+        self.assertEqual(esperas, {1: 9, 2: 0, 3: 15, 4: 2})
+        self.assertEqual(
+            [(seg["pid"], seg["dur"]) for seg in sim.timeline],
+            [(1, 1), (2, 4), (4, 5), (1, 7), (3, 9)],
+        )
+
+    def test_motor_por_eventos_equivalente(self):
+        jobs = lambda: [_pcb(i, (i * 37) % 23 + 1, (i * 11) % 40) for i in range(1, 60)]
+        resultados = []
+        for engine in ("tick", "event"):
+            sim = SchedulerSimulator(
+                SimulationConfig(algorithm=SRTFAlgorithm(), io_enabled=False, engine=engine)
+            )
+            sim.load_jobs(jobs())
+            metrics = sim.run()
+            resultados.append((sim.timeline.to_list(), metrics.context_switches))
+        self.assertEqual(resultados[0], resultados[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
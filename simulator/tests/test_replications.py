@@ -0,0 +1,68 @@
+import unittest
+
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.replications import run_replications, t_critical
+
+
+def _jobs():
+    return [PCB(pid=i, arrival_time=2 * i, burst_time=10 + i % 7) for i in range(1, 30)]
+
+
+class TestReplicas(unittest.TestCase):
+    def setUp(self):
+        self.config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True)
+
+    def test_semilla_hace_reproducible_la_io(self):
+        timelines = []
+        for _ in range(2):
+            sim = SchedulerSimulator(SimulationConfig(
+                algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True, seed=123))
+            sim.load_jobs(_jobs())
+            sim.run()
+            timelines.append(sim.timeline.to_list())
+        self.assertEqual(timelines[0], timelines[1])
+
+    def test_estudio_reproducible_y_paralelo(self):
+        serial = run_replications(self.config, _jobs(), max_replications=6, base_seed=9, max_workers=1)
+        paralelo = run_replications(self.config, _jobs(), max_replications=6, base_seed=9, max_workers=2)
+        self.assertEqual(serial.samples, paralelo.samples)
+        self.assertEqual(serial.replications, 6)
+        est = serial.estimates["avg_wait"]
+        self.assertLess(est.low, est.mean)
+        self.assertGreater(est.half_width, 0)
+
+    def test_parada_temprana(self):
+        report = run_replications(
+            self.config, _jobs(), max_replications=200, min_replications=4,
+            target_precision=0.5, base_seed=1, max_workers=1,
+        )
+        self.assertTrue(report.converged)
+        self.assertLess(report.replications, 200)
+
+    def test_parada_temprana_no_depende_de_los_workers(self):
+        informes = [
+            run_replications(
+                self.config, _jobs(), max_replications=60, min_replications=4,
+                target_precision=0.1, base_seed=3, max_workers=workers,
+            )
+            for workers in (1, 4)
+        ]
+        serial, paralelo = informes
+        self.assertLess(serial.replications, 60)
+        self.assertEqual(serial.replications, paralelo.replications)
+        self.assertEqual(serial.converged, paralelo.converged)
+        self.assertEqual(serial.samples, paralelo.samples)
+        self.assertEqual(serial.estimates, paralelo.estimates)
+        self.assertEqual([s["replica"] for s in paralelo.samples], list(range(paralelo.replications)))
+
+    def test_t_critico(self):
+        self.assertAlmostEqual(t_critical(0.95, 1), 12.706, places=2)
+        self.assertAlmostEqual(t_critical(0.95, 2), 4.303, places=2)
+        self.assertAlmostEqual(t_critical(0.95, 10), 2.228, places=2)
+        self.assertAlmostEqual(t_critical(0.99, 30), 2.750, places=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
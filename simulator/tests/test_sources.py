@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from simulator.core.engine.algorithms.fcfs import FCFSAlgorithm
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.engine.sources import PoissonArrivals, TraceArrivals
+
+
+class TestFuentesDeLlegada(unittest.TestCase):
+    def _config(self, **kwargs):
+        return SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=False, **kwargs)
+
+    def test_stream_equivale_a_load_jobs(self):
+        resultados = []
+        for streamed in (False, True):
+            sim = SchedulerSimulator(self._config())
+            fuente = PoissonArrivals(rate=0.2, burst_mean=4, count=300, seed=7)
+            if streamed:
+                sim.load_stream(fuente)
+            else:
+                sim.load_jobs(list(fuente))
+            metrics = sim.run()
+            resultados.append(
+                (sim.timeline.to_list(), metrics.context_switches, metrics.makespan,
+                 [(p.pid, p.waiting_time, p.response_time) for p in metrics.processes])
+            )
+        self.assertEqual(resultados[0], resultados[1])
+
+    def test_libera_pcbs_terminados(self):
+        sim = SchedulerSimulator(self._config(retain_completed=False))
+        sim.load_stream(PoissonArrivals(rate=0.2, burst_mean=4, count=500, seed=1))
+        metrics = sim.run()
+        self.assertEqual(sim.completed, [])
+        self.assertEqual(metrics.completed, 500)
+        self.assertEqual(metrics.throughput, 500 / sim.clock)
+
+    def test_fuente_infinita_acotada_por_max_time(self):
+        sim = SchedulerSimulator(self._config(max_time=1000, engine="event"))
+        sim.load_stream(PoissonArrivals(rate=0.1, burst_mean=5, seed=3))
+        metrics = sim.run()
+        self.assertEqual(sim.clock, 1000)
+        self.assertGreater(metrics.completed, 0)
+
+    def test_rechaza_llegadas_desordenadas(self):
+        sim = SchedulerSimulator(SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False))
+        sim.load_stream(iter([PCB(pid=1, arrival_time=5, burst_time=1), PCB(pid=2, arrival_time=2, burst_time=1)]))
+        with self.assertRaises(ValueError):
+            sim.run()
+
+    def test_traza_csv(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as fh:
+            fh.write("pid,llegada,rafaga,prioridad,usuario\n1,0,3,,ana\n2,1,2,1,luis\n")
+        self.addCleanup(os.remove, fh.name)
+        sim = SchedulerSimulator(SimulationConfig(algorithm=FCFSAlgorithm(), io_enabled=False))
+        sim.load_stream(TraceArrivals.from_csv(fh.name))
+        metrics = sim.run()
+        self.assertEqual([p.pid for p in sim.completed], [1, 2])
+        self.assertEqual(sim.completed[1].metadata["usuario"], "luis")
+        self.assertEqual(sim.completed[1].priority, 1)
+        self.assertEqual(metrics.makespan, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from simulator.core.scheduler import Planificador
+from simulator.core.sweep import SweepCase, run_sweep
+
+
+class TestBarrido(unittest.TestCase):
+    def setUp(self):
+        rnd = random.Random(4)
+        self.procesos = [
+            {"pid": i, "llegada": rnd.randint(0, 300), "rafaga": rnd.randint(1, 20), "prioridad": rnd.choice([None, 2])}
+            for i in range(1, 101)
+        ]
+        self.casos = [SweepCase("rr", q) for q in (1, 2, 4, 8)] + [SweepCase("fcfs"), SweepCase("sjf")]
+
+    def test_pool_coincide_con_ejecucion_serial(self):
+        serial = run_sweep(self.procesos, self.casos, max_workers=1)
+        paralelo = run_sweep(self.procesos, self.casos, max_workers=2)
+        self.assertEqual(serial, paralelo)
+        self.assertEqual([(fila["algoritmo"], fila["quantum"]) for fila in serial],
+                         [(c.algoritmo, c.quantum) for c in self.casos])
+
+    def test_filas_coinciden_con_planificador(self):
+        fila = run_sweep(self.procesos, [SweepCase("rr", 4)], max_workers=1)[0]
+        esperado = Planificador().round_robin(self.procesos, quantum=4)
+        self.assertEqual(fila["avg_wait"], esperado.avg_wait)
+        self.assertEqual(fila["context_switches"], esperado.context_switches)
+
+    def test_opciones_y_semilla(self):
+        casos = [
+            SweepCase("mlfq", 2, opciones={"niveles": 2, "boost": 40}),
+            SweepCase("cfs", opciones={"latencia": 12, "granularidad": 2}),
+            SweepCase("rr", 3, io_enabled=True, seed=7),
+        ]
+        filas = run_sweep(self.procesos, casos, max_workers=1)
+        plan = Planificador()
+        self.assertEqual(filas[0]["avg_wait"], plan.mlfq(self.procesos, quantum=2, niveles=2, boost=40).avg_wait)
+        self.assertEqual(filas[1]["avg_wait"], plan.cfs(self.procesos, latencia=12, granularidad=2).avg_wait)
+        self.assertEqual(filas[0]["opciones"], {"niveles": 2, "boost": 40})
+        # Con semilla, la I/O aleatoria se repite entre ejecuciones y entre workers.
+        self.assertEqual(run_sweep(self.procesos, casos, max_workers=2), filas)
+
+    def test_carga_invalida(self):
+        with self.assertRaises(ValueError):
+            run_sweep([{"pid": 1, "rafaga": -3}], [SweepCase("fcfs")], max_workers=1)
+        with self.assertRaises(ValueError):
+            run_sweep(self.procesos, [SweepCase("mlfq", opciones={"niveles": 99})], max_workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
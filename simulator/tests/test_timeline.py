@@ -0,0 +1,69 @@
+import unittest
+
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.pcb import PCB
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.engine.timeline import Timeline
+
+
+class TestTimeline(unittest.TestCase):
+    def test_fusiona_segmentos_contiguos(self):
+        tl = Timeline()
+        for t in range(5):
+            tl.record(t, 7, 1)
+        tl.record(5, None, 2)
+        tl.record(7, None, 1)
+        tl.record(8, 7, 3)
+        self.assertEqual(len(tl), 3)
+        self.assertEqual(
+            tl.to_list(),
+            [
+                {"t": 0, "pid": 7, "evento": "run", "dur": 5},
+                {"t": 5, "pid": None, "evento": "idle", "dur": 3},
+                {"t": 8, "pid": 7, "evento": "run", "dur": 3},
+            ],
+        )
+
+    def test_no_fusiona_si_hay_hueco(self):
+        tl = Timeline()
+        tl.record(0, 1, 2)
+        tl.record(3, 1, 2)
+        self.assertEqual(list(tl.segments()), [(0, 1, 2), (3, 1, 2)])
+
+    def test_indices_y_rebanadas(self):
+        tl = Timeline()
+        tl.record(0, 1, 1)
+        tl.record(1, 2, 1)
+        tl.record(2, 3, 1)
+        self.assertEqual(tl[-1]["pid"], 3)
+        self.assertEqual([seg["pid"] for seg in tl[1:]], [2, 3])
+        with self.assertRaises(IndexError):
+            tl[3]
+
+    def test_bytes_ida_y_vuelta(self):
+        tl = Timeline()
+        tl.record(0, 1, 4)
+        tl.record(4, None, 2)
+        tl.record(6, 1 << 40, 3)
+        copia = Timeline.from_bytes(tl.to_bytes())
+        self.assertEqual(list(copia.segments()), list(tl.segments()))
+        self.assertEqual(len(Timeline.from_bytes(Timeline().to_bytes())), 0)
+        with self.assertRaises(ValueError):
+            Timeline.from_bytes(b"basura")
+        with self.assertRaises(ValueError):
+            Timeline.from_bytes(tl.to_bytes()[:-4])
+
+    def test_segmentos_escalan_con_cambios_de_contexto(self):
+        sim = SchedulerSimulator(
+            SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=50), io_enabled=False)
+        )
+        sim.load_jobs(
+            [PCB(pid=1, arrival_time=0, burst_time=1000), PCB(pid=2, arrival_time=0, burst_time=1000)]
+        )
+        metrics = sim.run()
+        self.assertEqual(len(sim.timeline), metrics.context_switches)
+        self.assertEqual(sum(seg["dur"] for seg in sim.timeline), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import pickle
+import tempfile
+import unittest
+from array import array
+
+from simulator.core.cache import clave_resultado
+from simulator.core.engine.algorithms.rr import RoundRobinAlgorithm
+from simulator.core.engine.process_table import ProcessTable
+from simulator.core.engine.simulator import SchedulerSimulator, SimulationConfig
+from simulator.core.engine.workload import (
+    Bimodal,
+    Bursty,
+    Diurnal,
+    Pareto,
+    Poisson,
+    UserMix,
+    WorkloadSpec,
+    generate_workload,
+    open_workload,
+    workload_digest,
+    write_workload,
+)
+from simulator.core.scheduler import Planificador
+
+_SPEC = WorkloadSpec(
+    400,
+    Bursty(0.05, 0.8),
+    Bimodal(),
+    usuarios=(UserMix("ana", 3), UserMix("luis", 1, Pareto(1.5, 2), priority=5)),
+    max_burst=60,
+)
+
+
+def _simular(tabla, engine="event"):
+    config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True, seed=5, engine=engine)
+    sim = SchedulerSimulator(config)
+    sim.load_jobs(tabla)
+    metrics = sim.run()
+    return sim.timeline.to_list(), [(p.pid, p.waiting_time, p.turnaround_time) for p in metrics.processes]
+
+
+class TestGenerador(unittest.TestCase):
+    def test_reproducible_por_semilla(self):
+        a, b = generate_workload(_SPEC, seed=7), generate_workload(_SPEC, seed=7)
+        self.assertEqual(workload_digest(a), workload_digest(b))
+        self.assertNotEqual(workload_digest(a), workload_digest(generate_workload(_SPEC, seed=8)))
+
+    def test_columnas(self):
+        tabla = generate_workload(_SPEC, seed=1)
+        self.assertEqual(list(tabla.pid), list(range(1, 401)))
+        self.assertEqual(list(tabla.arrival), sorted(tabla.arrival))
+        self.assertTrue(all(1 <= r <= 60 for r in tabla.burst))
+        self.assertEqual(tabla.usuarios, ["ana", "luis"])
+        for i in range(len(tabla)):
+            vista = tabla.view(i)
+            self.assertEqual(vista.priority, 5 if vista.metadata["usuario"] == "luis" else None)
+        luis = sum(1 for codigo in tabla.usuario if codigo == 1)
+        self.assertTrue(60 < luis < 140)
+
+    def test_tasa_media_de_llegadas(self):
+        for llegadas, tasa in ((Poisson(0.2), 0.2), (Diurnal(0.2, period=500), 0.2)):
+            tabla = generate_workload(WorkloadSpec(20_000, llegadas), seed=3)
+            self.assertAlmostEqual(len(tabla) / tabla.arrival[-1], tasa, delta=0.02)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            Poisson(0)
+        with self.assertRaises(ValueError):
+            Diurnal(0.1, amplitude=2)
+        with self.assertRaises(ValueError):
+            generate_workload(WorkloadSpec(10, usuarios=()))
+
+
+class TestFormatoBinario(unittest.TestCase):
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.ruta = os.path.join(directorio.name, "carga.simw")
+
+    def test_ida_y_vuelta(self):
+        tabla = generate_workload(_SPEC, seed=2)
+        write_workload(tabla, self.ruta)
+        abierta = open_workload(self.ruta)
+        self.assertTrue(abierta.sorted_by_arrival)
+        self.assertIsInstance(abierta.arrival, memoryview)
+        self.assertEqual(workload_digest(abierta), workload_digest(tabla))
+        self.assertEqual(_simular(abierta), _simular(tabla.fresh()))
+        self.assertEqual(_simular(abierta.fresh(), "tick"), _simular(tabla))
+
+    def test_reordena_por_llegada(self):
+        tabla = ProcessTable.from_columns([1, 2, 3], [5, 0, 5], [2, 3, 4], usuarios=["x", "y", "x"])
+        esperado = _simular(tabla)
+        write_workload(tabla, self.ruta)
+        abierta = open_workload(self.ruta)
+        self.assertEqual(list(abierta.pid), [2, 1, 3])
+        self.assertEqual(_simular(abierta), esperado)
+
+    def test_usuario_mismo_tipo_en_memoria_y_en_fichero(self):
+        tabla = ProcessTable.from_columns([1, 2], [0, 1], [2, 3], usuarios=["x", "y"])
+        write_workload(tabla, self.ruta)
+        abierta = open_workload(self.ruta)
+        self.assertEqual(tabla.usuario.typecode, "i")
+        self.assertEqual(abierta.usuario.format, tabla.usuario.typecode)
+        columna = array("q", [1])
+        self.assertEqual(ProcessTable.from_arrays(columna, columna, columna).usuario.typecode, "i")
+
+    def test_snapshot_de_una_carga_mapeada(self):
+        write_workload(generate_workload(_SPEC, seed=4), self.ruta)
+        config = SimulationConfig(algorithm=RoundRobinAlgorithm(quantum=3), io_enabled=True, seed=5)
+        sim = SchedulerSimulator(config)
+        sim.load_jobs(open_workload(self.ruta))
+        capturas = []
+        metrics = sim.run(lambda hechos, total: capturas.append(sim.snapshot()) if hechos == 100 else None)
+        reanudado = SchedulerSimulator.restore(capturas[0])
+        self.assertEqual(reanudado.run().makespan, metrics.makespan)
+        self.assertEqual(reanudado.timeline.to_list(), sim.timeline.to_list())
+
+    def test_fichero_invalido(self):
+        with open(self.ruta, "wb") as fichero:
+            fichero.write(b"no es una carga" * 4)
+        with self.assertRaises(ValueError):
+            open_workload(self.ruta)
+
+
+class TestPlanificador(unittest.TestCase):
+    def test_tabla_equivale_a_diccionarios(self):
+        tabla = generate_workload(WorkloadSpec(150, Poisson(0.15), Pareto(1.4, 2)), seed=6)
+        procesos = [
+            {"pid": tabla.pid[i], "llegada": tabla.arrival[i], "rafaga": tabla.burst[i]}
+            for i in range(len(tabla))
+        ]
+        planificador = Planificador()
+        for algoritmo in ("fcfs", "sjf", "rr", "cfs"):
+            de_tabla = planificador._run(tabla, algoritmo)
+            de_dicts = planificador._run(procesos, algoritmo)
+            self.assertEqual(de_tabla.completed, de_dicts.completed)
+            self.assertEqual(de_tabla.context_switches, de_dicts.context_switches)
+
+    def test_clave_de_cache(self):
+        tabla = generate_workload(_SPEC, seed=9)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "carga.simw")
+            write_workload(tabla, ruta)
+            abierta = open_workload(ruta)
+            self.assertEqual(clave_resultado(tabla, "rr"), clave_resultado(abierta, "rr"))
+            self.assertNotEqual(clave_resultado(tabla, "rr"), clave_resultado(tabla, "fcfs"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,15 @@
 from django.urls import path
-from . import views
+from . import api, views
 urlpatterns = [
     path('', views.sim_home, name='sim_home'),
     path('run/', views.run_simulation, name='run_simulation'),
+    path('stream/', views.stream_simulation, name='stream_simulation'),
+    path('gantt/<slug:clave>.<slug:formato>', views.gantt_resultado, name='gantt_resultado'),
+    path('api/batch/', api.BatchSimulationView.as_view(), name='api_batch'),
+    path('api/compare/', api.CompareView.as_view(), name='api_compare'),
+    path('api/jobs/', api.JobListCreateView.as_view(), name='api_jobs'),
+    path('api/jobs/<int:pk>/', api.JobDetailView.as_view(), name='api_job_detail'),
+    path('api/jobs/<int:pk>/cancel/', api.JobCancelView.as_view(), name='api_job_cancel'),
+    path('api/jobs/<int:pk>/result/', api.JobResultView.as_view(), name='api_job_result'),
+    path('api/jobs/<int:pk>/gantt.<slug:formato>', api.JobGanttView.as_view(), name='api_job_gantt'),
 ]
@@ -1,8 +1,22 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import render
+from django.urls import reverse
 from .forms import ProcessForm
+from .core import gantt
+from .core.cache import cache_desde_settings
+from .core.comparacion import comparar, lado_a_lado
 from .core.scheduler import Planificador
+from .models import LineaTiempo
+from . import jobs
 import json
 
+# Una caché por proceso worker; SIMULATOR_RESULT_CACHE["BACKEND"] la comparte entre workers.
+cache_resultados = cache_desde_settings(getattr(settings, 'SIMULATOR_RESULT_CACHE', None))
+cache_gantt = cache_desde_settings(
+    getattr(settings, 'SIMULATOR_GANTT_CACHE', {'PREFIX': 'simulator:gantt:'})
+)
+
 
 def sim_home(request):
     form = ProcessForm()
@@ -12,6 +26,8 @@ def sim_home(request):
 def run_simulation(request):
     form = ProcessForm(request.POST or None)
     result = None
+    comparacion = None
+    job = None
     error = None
 
     if request.method == 'POST' and form.is_valid():
@@ -20,16 +36,54 @@ def run_simulation(request):
             algoritmo = form.cleaned_data['algoritmo']
             quantum = form.cleaned_data.get('quantum') or 2
 
-            plan = Planificador()
+            # Con clave aunque no haya caché: el Gantt se pide por ella (ver gantt_resultado).
+            plan = Planificador(cache=cache_resultados, con_clave=True)
+            umbral = getattr(settings, 'SIMULATOR_JOB_THRESHOLD', 0)
 
-            if algoritmo == 'fcfs':
+            variantes = form.variantes()
+            if variantes:
+                if umbral and len(procesos) > umbral:
+                    raise ValueError(f'Para comparar algoritmos la carga debe tener como mucho {umbral} procesos.')
+                resultados = comparar(
+                    procesos,
+                    variantes,
+                    max_workers=getattr(settings, 'SIMULATOR_BATCH_MAX_WORKERS', None),
+                    cache=cache_resultados,
+                )
+                comparacion = lado_a_lado(variantes, resultados)
+                for resultado in resultados:
+                    if resultado.clave:
+                        LineaTiempo.guardar(resultado.clave, resultado.timeline)
+            elif umbral and len(procesos) > umbral:
+                # Cargas grandes van a la cola de trabajos para no bloquear este worker.
+                job = jobs.encolar(
+                    procesos,
+                    algoritmo,
+                    int(quantum) if algoritmo in ('rr', 'mlfq') else None,
+                    form.opciones(),
+                )
+            elif algoritmo == 'fcfs':
                 result = plan.fcfs(procesos)
             elif algoritmo == 'rr':
                 result = plan.round_robin(procesos, quantum=int(quantum))
             elif algoritmo == 'sjf':
                 result = plan.sjf(procesos)
+            elif algoritmo == 'srtf':
+                result = plan.srtf(procesos)
+            elif algoritmo == 'mlfq':
+                opciones = form.opciones()
+                result = plan.mlfq(
+                    procesos, quantum=int(quantum), niveles=opciones['niveles'], boost=opciones['boost']
+                )
+            elif algoritmo == 'cfs':
+                opciones = form.opciones()
+                result = plan.cfs(
+                    procesos, latencia=opciones['latencia'], granularidad=opciones['granularidad']
+                )
             else:
                 error = 'Algoritmo no soportado'
+            if result is not None:
+                LineaTiempo.guardar(result.clave, result.timeline)
         except Exception as e:
             error = str(e)
 
@@ -39,6 +93,111 @@ def run_simulation(request):
         {
             'form': form,
             'result': result,
+            'comparacion': comparacion,
+            'job': job,
             'error': error,
         },
     )
+
+
+def _evento_sse(evento, datos):
+    return f"event: {evento}\ndata: {json.dumps(datos, ensure_ascii=False)}\n\n"
+
+
+def stream_simulation(request):
+    """
+    Server-Sent Events con la simulación en curso: un evento "step" por lote
+    (segmentos nuevos de la línea de tiempo + métricas parciales) y "done"
+    al final. El generador solo avanza cuando el servidor puede escribir,
+    así que un cliente lento frena la simulación en lugar de acumular datos.
+    Las cargas de más de SIMULATOR_JOB_THRESHOLD procesos no se simulan en
+    vivo: se envía un evento "error" que remite a la cola de trabajos. Esta
+    vista atiende un GET (EventSource), así que no debe encolar nada.
+    """
+    form = ProcessForm(request.GET or None)
+    tamano_lote = getattr(settings, 'SIMULATOR_STREAM_BATCH', 256)
+
+    def eventos():
+        if not form.is_valid():
+            yield _evento_sse('error', {'error': form.errors.get_json_data()})
+            return
+        try:
+            procesos = json.loads(form.cleaned_data['procesos_json'])
+            algoritmo = form.cleaned_data['algoritmo']
+            quantum = form.cleaned_data.get('quantum') or 2
+            # Un cliente que se reconecta no debe relanzar una simulación terminada.
+            yield 'retry: 86400000\n\n'
+            umbral = getattr(settings, 'SIMULATOR_JOB_THRESHOLD', 0)
+            if umbral and len(procesos) > umbral:
+                # Las cargas grandes no ocupan un worker web; se encolan con un POST.
+                yield _evento_sse('error', {
+                    'error': (
+                        f'La carga tiene más de {umbral} procesos y no se puede simular en vivo: '
+                        f'usa «Ejecutar simulación» o POST {reverse("api_jobs")} para encolarla.'
+                    ),
+                    'trabajos': reverse('api_jobs'),
+                })
+                return
+            pasos = Planificador().pasos(
+                procesos, algoritmo, quantum, tamano_lote=tamano_lote, opciones=form.opciones()
+            )
+            for paso in pasos:
+                yield _evento_sse('done' if paso.done else 'step', paso.as_dict())
+        except Exception as e:
+            yield _evento_sse('error', {'error': str(e)})
+
+    respuesta = StreamingHttpResponse(eventos(), content_type='text/event-stream')
+    respuesta['Cache-Control'] = 'no-cache'
+    respuesta['X-Accel-Buffering'] = 'no'
+    return respuesta
+
+
+def respuesta_gantt(request, clave, formato, segmentos):
+    """
+    Imagen del Gantt del resultado `clave`. `segmentos()` devuelve su línea
+    de tiempo (o None si ya no está disponible) y solo se llama si la imagen
+    no está en caché. Parámetros GET: ancho y alto en píxeles y la ventana
+    de tiempo inicio/fin (por defecto, toda la simulación).
+    """
+    if formato not in gantt.FORMATOS:
+        raise Http404('Formato no soportado.')
+    try:
+        ancho = min(gantt.ANCHO_MAX, max(1, int(request.GET.get('ancho', 800))))
+        alto = min(gantt.ALTO_MAX, max(40, int(request.GET.get('alto', 60))))
+        inicio = max(0, int(request.GET.get('inicio', 0)))
+        fin = int(request.GET['fin']) if request.GET.get('fin') else None
+    except ValueError:
+        return HttpResponseBadRequest('Parámetros inválidos.')
+    if fin is not None and fin <= inicio:
+        return HttpResponseBadRequest('fin debe ser mayor que inicio.')
+
+    clave_imagen = gantt.clave_imagen(clave, formato, ancho, alto, inicio, fin)
+    imagen = cache_gantt.obtener(clave_imagen) if cache_gantt is not None else None
+    if imagen is None:
+        linea = segmentos()
+        if linea is None:
+            raise Http404('Resultado no disponible; vuelve a simular.')
+        imagen = gantt.renderizar(linea, formato, ancho=ancho, alto=alto, inicio=inicio, fin=fin)
+        if cache_gantt is not None:
+            cache_gantt.guardar(clave_imagen, imagen)
+
+    respuesta = HttpResponse(imagen, content_type=gantt.FORMATOS[formato])
+    # La clave identifica el contenido: la imagen de una URL no cambia nunca.
+    respuesta['Cache-Control'] = 'public, max-age=86400, immutable'
+    respuesta['ETag'] = f'"{clave_imagen}"'
+    return respuesta
+
+
+def gantt_resultado(request, clave, formato):
+    """
+    Gantt de un resultado de /sim/run/. La línea de tiempo sale de la caché
+    de resultados si sigue ahí y, si no, de la guardada en LineaTiempo.
+    """
+
+    def segmentos():
+        resultado = cache_resultados.obtener(clave) if cache_resultados is not None else None
+        if resultado is not None:
+            return resultado.timeline
+        return LineaTiempo.cargar(clave)
+
+    return respuesta_gantt(request, clave, formato, segmentos)